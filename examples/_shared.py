@@ -0,0 +1,16 @@
+"""Helpers shared by the example scripts."""
+
+from functools import lru_cache
+
+from lacuna.engine.governance import GovernanceEngine
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> GovernanceEngine:
+    """Get the governance engine shared by all examples.
+
+    Examples run in the same process (e.g. from a notebook or test harness)
+    reuse one engine instead of each reloading classifiers, policies and
+    audit handles.
+    """
+    return GovernanceEngine()
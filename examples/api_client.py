@@ -2,55 +2,133 @@
 """API client example.
 
 Demonstrates how to interact with the Lacuna REST API
-using HTTP requests.
+using asynchronous HTTP requests.
 
 Prerequisites:
     Start the dev server: lacuna dev
 """
 
+import asyncio
 import sys
+from collections.abc import AsyncIterator
+from typing import Any
+
+import aiohttp
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
-import requests
 
 BASE_URL = "http://localhost:8000"
 
+TIMEOUT = aiohttp.ClientTimeout(total=10)
+NDJSON = "application/x-ndjson"
+
+
+async def _get(session: aiohttp.ClientSession, path: str, **kwargs: Any) -> dict:
+    """Issue a GET request and return the decoded JSON body."""
+    kwargs.setdefault("timeout", TIMEOUT)
+    async with session.get(path, **kwargs) as response:
+        response.raise_for_status()
+        return _loads(await response.read())
 
-def check_health() -> bool:
+
+async def _post(
+    session: aiohttp.ClientSession,
+    path: str,
+    json: dict,
+    **kwargs: Any,
+) -> dict:
+    """Issue a POST request with a JSON payload and return the decoded body."""
+    kwargs.setdefault("timeout", TIMEOUT)
+    async with session.post(path, data=_dumps(json), **kwargs) as response:
+        response.raise_for_status()
+        return _loads(await response.read())
+
+
+async def _stream(
+    session: aiohttp.ClientSession,
+    method: str,
+    path: str,
+    key: str,
+    **kwargs: Any,
+) -> AsyncIterator[dict]:
+    """Yield items of a list response, streaming NDJSON when offered.
+
+    If the server answers with ``application/x-ndjson`` each line is decoded
+    as it arrives; otherwise the JSON body is parsed and ``body[key]`` items
+    are yielded.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    headers = {"Accept": f"{NDJSON}, application/json"}
+    async with session.request(method, path, headers=headers, **kwargs) as response:
+        response.raise_for_status()
+        if response.content_type == NDJSON:
+            async for line in response.content:
+                if line.strip():
+                    yield _loads(line)
+        else:
+            for item in _loads(await response.read()).get(key, []):
+                yield item
+
+
+async def check_health(session: aiohttp.ClientSession) -> bool:
     """Check if the API is healthy."""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        return response.status_code == 200
-    except requests.exceptions.ConnectionError:
+        async with session.get(
+            "/health", timeout=aiohttp.ClientTimeout(total=5)
+        ) as response:
+            return response.status == 200
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
         return False
 
 
-def classify_query(query: str, context: dict | None = None) -> dict:
+async def classify_query(
+    session: aiohttp.ClientSession,
+    query: str,
+    context: dict | None = None,
+) -> dict:
     """Classify a query via the API."""
-    payload = {"query": query}
+    payload: dict[str, Any] = {"query": query}
     if context:
         payload["context"] = context
 
-    response = requests.post(
-        f"{BASE_URL}/api/v1/classify",
-        json=payload,
-        timeout=10,
-    )
-    response.raise_for_status()
-    return response.json()
-
-
-def classify_batch(queries: list[str]) -> dict:
-    """Classify multiple queries in a single request."""
-    response = requests.post(
-        f"{BASE_URL}/api/v1/classify/batch",
-        json={"queries": queries},
-        timeout=30,
-    )
-    response.raise_for_status()
-    return response.json()
+    return await _post(session, "/api/v1/classify", payload)
+
+
+async def classify_batch(session: aiohttp.ClientSession, queries: list[str]) -> dict:
+    """Classify multiple queries in a single request.
+
+    Duplicate queries are sent once; results are returned in input order.
+    """
+    unique = list(dict.fromkeys(queries))
+    results = [
+        item
+        async for item in _stream(
+            session,
+            "POST",
+            "/api/v1/classify/batch",
+            "results",
+            data=_dumps({"queries": unique}),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    ]
+    by_query = dict(zip(unique, results))
+    return {"results": [by_query[query] for query in queries if query in by_query]}
 
 
-def evaluate_operation(
+async def evaluate_operation(
+    session: aiohttp.ClientSession,
     operation_type: str,
     resource_id: str,
     user_id: str,
@@ -65,109 +143,128 @@ def evaluate_operation(
             "user_role": user_role,
         },
     }
-    response = requests.post(
-        f"{BASE_URL}/api/v1/evaluate",
-        json=payload,
-        timeout=10,
-    )
-    response.raise_for_status()
-    return response.json()
+    return await _post(session, "/api/v1/evaluate", payload)
 
 
-def get_lineage(artifact_id: str, max_depth: int = 10) -> dict:
+async def get_lineage(
+    session: aiohttp.ClientSession, artifact_id: str, max_depth: int = 10
+) -> dict:
     """Get lineage for an artifact."""
-    response = requests.get(
-        f"{BASE_URL}/api/v1/lineage/{artifact_id}",
+    return await _get(
+        session,
+        f"/api/v1/lineage/{artifact_id}",
         params={"max_depth": max_depth},
-        timeout=10,
     )
-    response.raise_for_status()
-    return response.json()
 
 
-def query_audit_logs(
+async def query_audit_logs(
+    session: aiohttp.ClientSession,
     user_id: str | None = None,
     resource_id: str | None = None,
     limit: int = 10,
 ) -> dict:
     """Query audit logs."""
-    params = {"limit": limit}
+    params: dict[str, Any] = {"limit": limit}
     if user_id:
         params["user_id"] = user_id
     if resource_id:
         params["resource_id"] = resource_id
 
-    response = requests.get(
-        f"{BASE_URL}/api/v1/audit",
-        params=params,
-        timeout=10,
-    )
-    response.raise_for_status()
-    return response.json()
+    records = [
+        record
+        async for record in _stream(
+            session, "GET", "/api/v1/audit", "records", params=params
+        )
+    ]
+    return {"records": records}
 
 
-def get_openapi_spec() -> dict:
+async def get_openapi_spec(session: aiohttp.ClientSession) -> dict:
     """Get the OpenAPI specification."""
-    response = requests.get(f"{BASE_URL}/openapi.json", timeout=10)
-    response.raise_for_status()
-    return response.json()
+    return await _get(session, "/openapi.json")
 
 
-def main() -> None:
+async def main_async() -> None:
     """Run API client examples."""
     print("=== Lacuna API Client Examples ===\n")
 
-    # Check if server is running
-    print("1. Checking API health:")
-    if not check_health():
-        print("   ✗ API is not reachable at", BASE_URL)
-        print("   Please start the dev server: lacuna dev")
-        sys.exit(1)
-    print("   ✓ API is healthy")
-    print()
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+    async with aiohttp.ClientSession(
+        base_url=BASE_URL,
+        connector=connector,
+        headers={"Accept": "application/json", "Content-Type": "application/json"},
+    ) as session:
+        # Check if server is running
+        print("1. Checking API health:")
+        if not await check_health(session):
+            print("   ✗ API is not reachable at", BASE_URL)
+            print("   Please start the dev server: lacuna dev")
+            sys.exit(1)
+        print("   ✓ API is healthy")
+        print()
+
+        # The remaining calls are independent, so issue them concurrently
+        context = {"user_id": "analyst", "project": "quarterly_report"}
+        queries = [
+            "SELECT name FROM users",
+            "SELECT ssn FROM employees",
+            "SELECT id FROM products",
+        ]
+        (
+            classified,
+            classified_ctx,
+            batch,
+            evaluation,
+            spec,
+            logs,
+        ) = await asyncio.gather(
+            classify_query(session, "SELECT email, phone FROM customers"),
+            classify_query(session, "SELECT revenue FROM sales", context),
+            classify_batch(session, queries),
+            evaluate_operation(
+                session,
+                operation_type="read",
+                resource_id="customer_data.csv",
+                user_id="alice",
+                user_role="analyst",
+            ),
+            get_openapi_spec(session),
+            query_audit_logs(session, limit=5),
+            return_exceptions=True,
+        )
+
+    # Results that failed come back as exceptions; surface the first one
+    # for the core calls and report audit failures inline.
+    for result in (classified, classified_ctx, batch, evaluation, spec):
+        if isinstance(result, BaseException):
+            raise result
 
     # Classify a query
     print("2. Classifying a query:")
-    result = classify_query("SELECT email, phone FROM customers")
-    print(f"   Tier: {result.get('tier')}")
-    print(f"   Confidence: {result.get('confidence', 0):.2%}")
+    print(f"   Tier: {classified.get('tier')}")
+    print(f"   Confidence: {classified.get('confidence', 0):.2%}")
     print()
 
     # Classify with context
     print("3. Classifying with user context:")
-    context = {"user_id": "analyst", "project": "quarterly_report"}
-    result = classify_query("SELECT revenue FROM sales", context)
-    print(f"   Tier: {result.get('tier')}")
+    print(f"   Tier: {classified_ctx.get('tier')}")
     print()
 
     # Batch classification
     print("4. Batch classification:")
-    queries = [
-        "SELECT name FROM users",
-        "SELECT ssn FROM employees",
-        "SELECT id FROM products",
-    ]
-    results = classify_batch(queries)
-    for item in results.get("classifications", []):
-        print(f"   {item.get('tier', 'N/A'):12} | {item.get('query', 'N/A')[:40]}")
+    for query, item in zip(queries, batch.get("results", [])):
+        print(f"   {item.get('tier', 'N/A'):12} | {query[:40]}")
     print()
 
     # Evaluate operation
     print("5. Evaluating an operation:")
-    result = evaluate_operation(
-        operation_type="read",
-        resource_id="customer_data.csv",
-        user_id="alice",
-        user_role="analyst",
-    )
-    allowed = result.get("allowed", False)
+    allowed = evaluation.get("allowed", False)
     status = "✓ Allowed" if allowed else "✗ Denied"
     print(f"   {status}")
     print()
 
     # Get OpenAPI spec info
     print("6. OpenAPI specification:")
-    spec = get_openapi_spec()
     print(f"   Title: {spec.get('info', {}).get('title')}")
     print(f"   Version: {spec.get('info', {}).get('version')}")
     print(f"   Endpoints: {len(spec.get('paths', {}))}")
@@ -175,11 +272,17 @@ def main() -> None:
 
     # Query audit logs
     print("7. Querying audit logs:")
-    try:
-        logs = query_audit_logs(limit=5)
-        print(f"   Retrieved {len(logs.get('logs', []))} log entries")
-    except requests.exceptions.HTTPError as e:
-        print(f"   Error: {e}")
+    if isinstance(logs, aiohttp.ClientResponseError):
+        print(f"   Error: {logs}")
+    elif isinstance(logs, BaseException):
+        raise logs
+    else:
+        print(f"   Retrieved {len(logs.get('records', []))} log entries")
+
+
+def main() -> None:
+    """Run API client examples."""
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
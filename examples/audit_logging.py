@@ -5,16 +5,21 @@ Demonstrates how to query and inspect audit logs
 for compliance and investigation purposes.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-from lacuna.engine.governance import GovernanceEngine
+from _shared import get_engine
+
 from lacuna.models.data_operation import DataOperation, OperationType, UserContext
 
+# Number of log entries shown when listing audit records
+DISPLAY_N = 3
+
 
 def main() -> None:
     """Run audit logging examples."""
     # Initialize the governance engine
-    engine = GovernanceEngine()
+    engine = get_engine()
 
     print("=== Audit Logging Examples ===\n")
 
@@ -31,22 +36,28 @@ def main() -> None:
         (OperationType.DELETE, "temp_file.txt"),
     ]
 
-    for user, (op_type, resource) in zip(users, operations):
-        op = DataOperation(
+    # Independent operations; evaluate them concurrently
+    ops = [
+        DataOperation(
             operation_type=op_type,
             resource_id=resource,
-            user_context=user,
+            user=user,
         )
-        engine.evaluate_operation(op)
+        for user, (op_type, resource) in zip(users, operations)
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(engine.evaluate_operation, ops))
+
+    for user, (op_type, resource) in zip(users, operations):
         print(f"   {user.user_id}: {op_type.value} on {resource}")
     print()
 
     # Example 2: Query all recent audit logs
     print("2. Querying recent audit logs:")
     try:
-        logs = engine.query_audit_logs(limit=10)
-        print(f"   Found {len(logs)} audit entries")
-        for log in logs[:3]:
+        logs = engine.query_audit_logs(limit=DISPLAY_N)
+        print(f"   Showing {len(logs)} most recent audit entries")
+        for log in logs:
             print(f"   - {log.get('timestamp', 'N/A')}: {log.get('event_type', 'N/A')}")
     except Exception as e:
         print(f"   (Audit query requires running backend: {e})")
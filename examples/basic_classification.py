@@ -5,14 +5,15 @@ Demonstrates how to classify data queries and content
 to determine their sensitivity tier.
 """
 
-from lacuna.engine.governance import GovernanceEngine
+from _shared import get_engine
+
 from lacuna.models.classification import ClassificationContext, DataTier
 
 
 def main() -> None:
     """Run basic classification examples."""
     # Initialize the governance engine
-    engine = GovernanceEngine()
+    engine = get_engine()
 
     print("=== Basic Classification Examples ===\n")
 
@@ -65,8 +66,7 @@ def main() -> None:
         "SELECT salary FROM employees",
         "SELECT api_key FROM credentials",
     ]
-    for q in queries:
-        r = engine.classify(q)
+    for q, r in zip(queries, engine.classify_batch(queries)):
         print(f"   {r.tier.value:12} | {q}")
 
 
@@ -5,16 +5,19 @@ Demonstrates efficient classification of multiple data items
 using both the SDK and the API.
 """
 
+import statistics
 import time
+from collections import Counter, defaultdict
+
+from _shared import get_engine
 
-from lacuna.engine.governance import GovernanceEngine
 from lacuna.models.classification import ClassificationContext
 
 
 def main() -> None:
     """Run batch classification examples."""
     # Initialize the governance engine
-    engine = GovernanceEngine()
+    engine = get_engine()
 
     print("=== Batch Classification Examples ===\n")
 
@@ -35,27 +38,31 @@ def main() -> None:
         "SELECT salary, bonus FROM compensation",
     ]
 
+    # Shared context for the whole batch. The dataset is classified once
+    # with it; every example below reuses those results.
+    context = ClassificationContext(
+        user_id="batch_processor",
+        user_role="system",
+        environment="production",
+        project="data_audit",
+    )
+
     # Example 1: Classify all queries
     print("1. Classifying dataset:")
-    start = time.time()
-    results = []
-    for query in queries:
-        result = engine.classify(query)
-        results.append((query, result))
-    elapsed = time.time() - start
-
-    print(f"   Classified {len(queries)} queries in {elapsed:.3f}s")
-    print(f"   Average: {elapsed/len(queries)*1000:.1f}ms per query")
+    # Time only the batch call; keep printing and other work outside it
+    start_ns = time.perf_counter_ns()
+    results = list(zip(queries, engine.classify_batch(queries, context=context)))
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
+    print(f"   Classified {len(queries)} queries in {elapsed_ns / 1e9:.3f}s")
+    print(f"   Average: {elapsed_ns / len(queries) / 1e6:.1f}ms per query")
     print()
 
     # Example 2: Group by tier
     print("2. Results by sensitivity tier:")
-    by_tier: dict[str, list[str]] = {}
+    by_tier: defaultdict[str, list[str]] = defaultdict(list)
     for query, result in results:
-        tier = result.tier.value
-        if tier not in by_tier:
-            by_tier[tier] = []
-        by_tier[tier].append(query[:50])
+        by_tier[result.tier.value].append(query[:50])
 
     for tier in ["PUBLIC", "INTERNAL", "PROPRIETARY"]:
         if tier in by_tier:
@@ -75,20 +82,9 @@ def main() -> None:
         print(f"     Reason: {result.reasoning}")
     print()
 
-    # Example 4: Classify with shared context
+    # Example 4: Summarize the batch classified with the shared context
     print("4. Batch classification with context:")
-    context = ClassificationContext(
-        user_id="batch_processor",
-        user_role="system",
-        environment="production",
-        project="data_audit",
-    )
-
-    sensitive_count = 0
-    for query in queries:
-        result = engine.classify(query, context=context)
-        if result.tier.value == "PROPRIETARY":
-            sensitive_count += 1
+    sensitive_count = len(proprietary)
 
     print(f"   Context: {context.project} ({context.environment})")
     print(f"   Total queries: {len(queries)}")
@@ -98,13 +94,8 @@ def main() -> None:
 
     # Example 5: Classification statistics
     print("5. Classification statistics:")
-    confidence_sum = sum(r.confidence for _, r in results)
-    avg_confidence = confidence_sum / len(results)
-
-    tier_counts = {}
-    for _, result in results:
-        tier = result.tier.value
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
+    avg_confidence = statistics.fmean(r.confidence for _, r in results)
+    tier_counts = Counter(r.tier.value for _, r in results)
 
     print(f"   Average confidence: {avg_confidence:.2%}")
     print("   Distribution:")
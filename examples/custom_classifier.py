@@ -6,26 +6,98 @@ for domain-specific data sensitivity detection.
 """
 
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
-from lacuna.classifier.base import BaseClassifier
+try:
+    import re2  # google-re2, optional
+except ImportError:
+    re2 = None
+
+# The unrelated PyPI "re2" package shares the module name but has no Set API
+if re2 is not None and not hasattr(re2, "Set"):
+    re2 = None
+
+from lacuna.classifier.base import Classifier
 from lacuna.classifier.pipeline import ClassificationPipeline
 from lacuna.engine.governance import GovernanceEngine
 from lacuna.models.classification import Classification, ClassificationContext, DataTier
 
 
-class HealthcareClassifier(BaseClassifier):
+def lower(query: str) -> str:
+    """Lower-case a query, skipping the copy when it is already lower-case.
+
+    ``isascii`` and ``islower`` are single C-level scans that allocate
+    nothing; ASCII text passing both is returned unchanged by ``str.lower``.
+    """
+    if query.isascii() and query.islower():
+        return query
+    return query.lower()
+
+
+class PatternSet:
+    """Multi-pattern matcher that tests every pattern in one scan.
+
+    Uses a google-re2 ``Set`` (linear-time DFA) when ``google-re2`` is
+    installed, otherwise a fused stdlib alternation with one named group
+    ``p<index>`` per pattern.
+    """
+
+    def __init__(self, patterns: tuple[str, ...]):
+        """Compile the pattern set.
+
+        Args:
+            patterns: Regex sources, reported back verbatim on a match
+        """
+        self.patterns = patterns
+        if re2 is not None:
+            self._set = re2.Set.SearchSet()
+            for pattern in patterns:
+                self._set.Add(pattern)
+            self._set.Compile()
+        else:
+            self._regex = re.compile(
+                "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns))
+            )
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the source pattern that matched ``text``, if any."""
+        if re2 is not None:
+            matches = self._set.Match(text)
+            return self.patterns[min(matches)] if matches else None
+
+        match = self._regex.search(text)
+        return self.patterns[int(match.lastgroup[1:])] if match else None
+
+
+class HealthcareClassifier(Classifier):
     """Custom classifier for healthcare data.
 
     Detects PHI (Protected Health Information) and other
     healthcare-specific sensitive data patterns.
     """
 
-    name = "healthcare"
-    priority = 100  # High priority - check early
-
-    # PHI patterns
-    PHI_PATTERNS = [
+    def __init__(self, priority: int = 10):
+        """Initialize classifier; lower priorities run earlier in the pipeline."""
+        super().__init__(priority)
+
+    @property
+    def name(self) -> str:
+        """Get classifier name."""
+        return "healthcare"
+
+    # Cheap substring prefilter covering every PHI pattern and sensitive
+    # field below; queries without any of these skip the regex scans.
+    _PREFILTER_RE = re.compile(
+        "patient|medical|mrn|diagnosis|treatment|prescription|lab|health|hipaa"
+        "|date_of_birth|social_security|insurance|icd_code|medication|dosage"
+        "|physician"
+    )
+
+    # PHI patterns, compiled once into a single PatternSet when the class is
+    # created. Queries are lower-cased before matching, so no IGNORECASE flag
+    # is needed.
+    PHI_PATTERNS = (
         r"\bpatient[_\s]?id\b",
         r"\bmedical[_\s]?record[_\s]?number\b",
         r"\bmrn\b",
@@ -35,7 +107,8 @@ class HealthcareClassifier(BaseClassifier):
         r"\blab[_\s]?results?\b",
         r"\bhealth[_\s]?insurance\b",
         r"\bhipaa\b",
-    ]
+    )
+    _PHI_SET = PatternSet(PHI_PATTERNS)
 
     # Sensitive field names
     SENSITIVE_FIELDS = {
@@ -50,54 +123,73 @@ class HealthcareClassifier(BaseClassifier):
         "physician",
         "medical_history",
     }
+    # Substring match, longest-first so overlapping names resolve
+    # deterministically
+    _FIELD_RE = re.compile(
+        "|".join(map(re.escape, sorted(SENSITIVE_FIELDS, key=len, reverse=True)))
+    )
 
     def classify(
         self,
         query: str,
-        context: ClassificationContext | None = None,
+        context: Optional[ClassificationContext] = None,
         **kwargs: Any,
-    ) -> Classification | None:
+    ) -> Optional[Classification]:
         """Classify healthcare-related queries.
 
         Returns PROPRIETARY for any PHI or healthcare data.
         """
-        query_lower = query.lower()
+        query_lower = lower(query)
+        if not self._PREFILTER_RE.search(query_lower):
+            return None
 
         # Check for PHI patterns
-        for pattern in self.PHI_PATTERNS:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                return Classification(
-                    tier=DataTier.PROPRIETARY,
-                    confidence=0.95,
-                    reasoning=f"Contains PHI pattern: {pattern}",
-                    classifier_name=self.name,
-                )
+        pattern = self._PHI_SET.search(query_lower)
+        if pattern:
+            return Classification(
+                tier=DataTier.PROPRIETARY,
+                confidence=0.95,
+                reasoning=f"Contains PHI pattern: {pattern}",
+                classifier_name=self.name,
+            )
 
         # Check for sensitive field names
-        for field in self.SENSITIVE_FIELDS:
-            if field in query_lower:
-                return Classification(
-                    tier=DataTier.PROPRIETARY,
-                    confidence=0.90,
-                    reasoning=f"Contains sensitive healthcare field: {field}",
-                    classifier_name=self.name,
-                )
+        match = self._FIELD_RE.search(query_lower)
+        if match:
+            return Classification(
+                tier=DataTier.PROPRIETARY,
+                confidence=0.90,
+                reasoning=f"Contains sensitive healthcare field: {match.group(0)}",
+                classifier_name=self.name,
+            )
 
         # Not healthcare data - let other classifiers handle it
         return None
 
 
-class FinancialClassifier(BaseClassifier):
+class FinancialClassifier(Classifier):
     """Custom classifier for financial data.
 
     Detects PCI-DSS relevant data and other financial
     sensitive information.
     """
 
-    name = "financial"
-    priority = 90
+    def __init__(self, priority: int = 20):
+        """Initialize classifier; lower priorities run earlier in the pipeline."""
+        super().__init__(priority)
 
-    SENSITIVE_PATTERNS = [
+    @property
+    def name(self) -> str:
+        """Get classifier name."""
+        return "financial"
+
+    # Cheap substring prefilter covering every pattern below
+    _PREFILTER_RE = re.compile(
+        "credit|card|cvv|expiry|bank|routing|iban|swift|tax|ein"
+        "|revenue|profit|forecast|budget|expense"
+    )
+
+    SENSITIVE_PATTERNS = (
         r"\bcredit[_\s]?card\b",
         r"\bcard[_\s]?number\b",
         r"\bcvv\b",
@@ -108,65 +200,83 @@ class FinancialClassifier(BaseClassifier):
         r"\bswift\b",
         r"\btax[_\s]?id\b",
         r"\bein\b",  # Employer Identification Number
-    ]
+    )
+    _SENSITIVE_SET = PatternSet(SENSITIVE_PATTERNS)
 
-    INTERNAL_PATTERNS = [
+    INTERNAL_PATTERNS = (
         r"\brevenue\b",
         r"\bprofit\b",
         r"\bforecast\b",
         r"\bbudget\b",
         r"\bexpenses?\b",
-    ]
+    )
+    _INTERNAL_SET = PatternSet(INTERNAL_PATTERNS)
 
     def classify(
         self,
         query: str,
-        context: ClassificationContext | None = None,
+        context: Optional[ClassificationContext] = None,
         **kwargs: Any,
-    ) -> Classification | None:
+    ) -> Optional[Classification]:
         """Classify financial data queries."""
-        query_lower = query.lower()
+        query_lower = lower(query)
+        if not self._PREFILTER_RE.search(query_lower):
+            return None
 
         # Check for PCI-DSS relevant patterns
-        for pattern in self.SENSITIVE_PATTERNS:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                return Classification(
-                    tier=DataTier.PROPRIETARY,
-                    confidence=0.95,
-                    reasoning=f"Contains PCI-DSS relevant pattern: {pattern}",
-                    classifier_name=self.name,
-                )
+        pattern = self._SENSITIVE_SET.search(query_lower)
+        if pattern:
+            return Classification(
+                tier=DataTier.PROPRIETARY,
+                confidence=0.95,
+                reasoning=f"Contains PCI-DSS relevant pattern: {pattern}",
+                classifier_name=self.name,
+            )
 
         # Check for internal financial data
-        for pattern in self.INTERNAL_PATTERNS:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                return Classification(
-                    tier=DataTier.INTERNAL,
-                    confidence=0.80,
-                    reasoning=f"Contains internal financial data: {pattern}",
-                    classifier_name=self.name,
-                )
+        pattern = self._INTERNAL_SET.search(query_lower)
+        if pattern:
+            return Classification(
+                tier=DataTier.INTERNAL,
+                confidence=0.80,
+                reasoning=f"Contains internal financial data: {pattern}",
+                classifier_name=self.name,
+            )
 
         return None
 
 
-def main() -> None:
-    """Run custom classifier examples."""
-    print("=== Custom Classifier Examples ===\n")
+@lru_cache(maxsize=1)
+def get_pipeline() -> ClassificationPipeline:
+    """Build the pipeline with the custom classifiers registered.
 
-    # Create a custom pipeline with our classifiers
+    The classifiers only hold precompiled, immutable pattern state, so one
+    wired pipeline is shared by every caller.
+    """
     pipeline = ClassificationPipeline()
+    pipeline.add_classifier(HealthcareClassifier())
+    pipeline.add_classifier(FinancialClassifier())
+    return pipeline
+
 
-    # Register custom classifiers
-    healthcare_classifier = HealthcareClassifier()
-    financial_classifier = FinancialClassifier()
+def main() -> None:
+    """Run custom classifier examples."""
+    print("=== Custom Classifier Examples ===\n")
 
-    pipeline.register_classifier(healthcare_classifier)
-    pipeline.register_classifier(financial_classifier)
+    # Get the pipeline with our custom classifiers registered
+    pipeline = get_pipeline()
+    healthcare_classifier, financial_classifier = (
+        next(c for c in pipeline.classifiers if isinstance(c, cls))
+        for cls in (HealthcareClassifier, FinancialClassifier)
+    )
 
     print("1. Registered custom classifiers:")
-    print(f"   - {healthcare_classifier.name} (priority: {healthcare_classifier.priority})")
-    print(f"   - {financial_classifier.name} (priority: {financial_classifier.priority})")
+    print(
+        f"   - {healthcare_classifier.name} (priority: {healthcare_classifier.priority})"
+    )
+    print(
+        f"   - {financial_classifier.name} (priority: {financial_classifier.priority})"
+    )
     print()
 
     # Test healthcare classifications
@@ -8,25 +8,34 @@ Demonstrates a full data governance workflow including:
 - Audit logging
 """
 
-from lacuna.engine.governance import GovernanceEngine
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _shared import get_engine
+
 from lacuna.models.data_operation import DataOperation, OperationType, UserContext
 
 
-def print_section(title: str) -> None:
-    """Print a section header."""
-    print(f"\n{'='*60}")
-    print(f" {title}")
-    print("=" * 60)
+def section(title: str) -> list[str]:
+    """Start a section's output buffer with its header."""
+    return [f"\n{'='*60}", f" {title}", "=" * 60]
+
+
+def flush(out: list[str]) -> None:
+    """Write a section's buffered lines with a single write call."""
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
     """Run a complete governance workflow."""
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║           Lacuna Data Governance Workflow                  ║")
-    print("╚════════════════════════════════════════════════════════════╝")
+    out = [
+        "╔════════════════════════════════════════════════════════════╗",
+        "║           Lacuna Data Governance Workflow                  ║",
+        "╚════════════════════════════════════════════════════════════╝",
+    ]
 
     # Initialize
-    engine = GovernanceEngine()
+    engine = get_engine()
 
     # Define our user
     user = UserContext(
@@ -36,14 +45,15 @@ def main() -> None:
         session_id="session_abc123",
     )
 
-    print(f"\nUser: {user.user_id}")
-    print(f"Role: {user.user_role}")
-    print(f"Department: {user.user_department}")
+    out.append(f"\nUser: {user.user_id}")
+    out.append(f"Role: {user.user_role}")
+    out.append(f"Department: {user.user_department}")
+    flush(out)
 
     # ==========================================================
     # Step 1: Classify the source data
     # ==========================================================
-    print_section("Step 1: Data Classification")
+    out = section("Step 1: Data Classification")
 
     queries = {
         "sales_data": "SELECT date, product, quantity, revenue FROM sales",
@@ -55,15 +65,16 @@ def main() -> None:
     for name, query in queries.items():
         result = engine.classify(query)
         classifications[name] = result
-        print(f"\n{name}:")
-        print(f"  Query: {query[:50]}...")
-        print(f"  Tier: {result.tier.value}")
-        print(f"  Confidence: {result.confidence:.2%}")
+        out.append(f"\n{name}:")
+        out.append(f"  Query: {query[:50]}...")
+        out.append(f"  Tier: {result.tier.value}")
+        out.append(f"  Confidence: {result.confidence:.2%}")
+    flush(out)
 
     # ==========================================================
     # Step 2: Request access to data
     # ==========================================================
-    print_section("Step 2: Access Request Evaluation")
+    out = section("Step 2: Access Request Evaluation")
 
     access_requests = [
         ("sales_data", OperationType.READ),
@@ -75,116 +86,127 @@ def main() -> None:
     approved = []
     denied = []
 
-    for resource, op_type in access_requests:
-        operation = DataOperation(
+    operations = [
+        DataOperation(
             operation_type=op_type,
             resource_id=f"{resource}.csv",
-            user_context=user,
+            user=user,
         )
-        result = engine.evaluate_operation(operation)
+        for resource, op_type in access_requests
+    ]
+
+    # The requests are independent; audit writes go through the logger's
+    # thread-safe queue, so they can be evaluated concurrently.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(engine.evaluate_operation, operations))
 
+    for (resource, op_type), result in zip(access_requests, results):
         status = "✓ APPROVED" if result.allowed else "✗ DENIED"
-        print(f"\n{op_type.value.upper()} {resource}: {status}")
+        out.append(f"\n{op_type.value.upper()} {resource}: {status}")
 
         if result.allowed:
             approved.append((resource, op_type))
         else:
             denied.append((resource, op_type, result.to_user_message()))
-            print(f"  Reason: {result.to_user_message()}")
+            out.append(f"  Reason: {result.to_user_message()}")
+    flush(out)
 
     # ==========================================================
     # Step 3: Perform approved operations with lineage tracking
     # ==========================================================
-    print_section("Step 3: Data Transformation with Lineage")
+    out = section("Step 3: Data Transformation with Lineage")
 
     if approved:
         # Join sales and customer data
-        print("\nTransformation: Join sales with customers")
+        out.append("\nTransformation: Join sales with customers")
         transform_op = DataOperation(
             operation_type=OperationType.JOIN,
             resource_id="sales_with_customers.parquet",
-            source_resources=["sales_data.csv", "customer_data.csv"],
-            user_context=user,
+            sources=["sales_data.csv", "customer_data.csv"],
+            user=user,
             metadata={
                 "join_type": "left",
                 "join_key": "customer_id",
             },
         )
         result = engine.evaluate_operation(transform_op)
-        print(f"  Sources: {transform_op.source_resources}")
-        print(f"  Output: {transform_op.resource_id}")
-        print(f"  Status: {'✓ Recorded' if result.allowed else '✗ Denied'}")
+        out.append(f"  Sources: {transform_op.sources}")
+        out.append(f"  Output: {transform_op.resource_id}")
+        out.append(f"  Status: {'✓ Recorded' if result.allowed else '✗ Denied'}")
 
         # Aggregate the joined data
-        print("\nTransformation: Aggregate by month")
+        out.append("\nTransformation: Aggregate by month")
         agg_op = DataOperation(
             operation_type=OperationType.AGGREGATE,
             resource_id="monthly_sales_report.parquet",
-            source_resources=["sales_with_customers.parquet"],
-            user_context=user,
+            sources=["sales_with_customers.parquet"],
+            user=user,
             metadata={
                 "group_by": ["year", "month"],
                 "aggregations": ["sum(revenue)", "count(customer_id)"],
             },
         )
         result = engine.evaluate_operation(agg_op)
-        print(f"  Source: {agg_op.source_resources}")
-        print(f"  Output: {agg_op.resource_id}")
-        print(f"  Status: {'✓ Recorded' if result.allowed else '✗ Denied'}")
+        out.append(f"  Source: {agg_op.sources}")
+        out.append(f"  Output: {agg_op.resource_id}")
+        out.append(f"  Status: {'✓ Recorded' if result.allowed else '✗ Denied'}")
+    flush(out)
 
     # ==========================================================
     # Step 4: Review audit trail
     # ==========================================================
-    print_section("Step 4: Audit Trail Review")
+    out = section("Step 4: Audit Trail Review")
 
-    print(f"\nQuerying audit logs for user: {user.user_id}")
+    out.append(f"\nQuerying audit logs for user: {user.user_id}")
     try:
-        logs = engine.query_audit_logs(user_id=user.user_id, limit=5)
-        print(f"Found {len(logs)} audit entries")
-        for i, log in enumerate(logs[:3], 1):
-            print(f"\n  Entry {i}:")
-            print(f"    Event: {log.get('event_type', 'N/A')}")
-            print(f"    Resource: {log.get('resource_id', 'N/A')}")
-            print(f"    Time: {log.get('timestamp', 'N/A')}")
+        logs = engine.query_audit_logs(user_id=user.user_id, limit=3)
+        out.append(f"Showing {len(logs)} most recent audit entries")
+        for i, log in enumerate(logs, 1):
+            out.append(f"\n  Entry {i}:")
+            out.append(f"    Event: {log.get('event_type', 'N/A')}")
+            out.append(f"    Resource: {log.get('resource_id', 'N/A')}")
+            out.append(f"    Time: {log.get('timestamp', 'N/A')}")
     except Exception as e:
-        print(f"  (Audit query requires running backend: {e})")
+        out.append(f"  (Audit query requires running backend: {e})")
+    flush(out)
 
     # ==========================================================
     # Step 5: Check lineage
     # ==========================================================
-    print_section("Step 5: Lineage Verification")
+    out = section("Step 5: Lineage Verification")
 
     try:
-        print("\nLineage for: monthly_sales_report.parquet")
+        out.append("\nLineage for: monthly_sales_report.parquet")
         lineage = engine.get_lineage("monthly_sales_report.parquet")
         nodes = list(lineage.get("nodes", {}).keys())
         edges = lineage.get("edges", [])
-        print(f"  Nodes in graph: {len(nodes)}")
-        print(f"  Connections: {len(edges)}")
+        out.append(f"  Nodes in graph: {len(nodes)}")
+        out.append(f"  Connections: {len(edges)}")
 
         if nodes:
-            print("  Data flow:")
-            for node in nodes:
-                print(f"    - {node}")
+            out.append("  Data flow:")
+            out.extend(f"    - {node}" for node in nodes)
     except Exception as e:
-        print(f"  (Lineage query requires running backend: {e})")
+        out.append(f"  (Lineage query requires running backend: {e})")
+    flush(out)
 
     # ==========================================================
     # Summary
     # ==========================================================
-    print_section("Workflow Summary")
+    out = section("Workflow Summary")
 
-    print(f"\nClassifications performed: {len(classifications)}")
-    print(f"Access requests approved: {len(approved)}")
-    print(f"Access requests denied: {len(denied)}")
+    out.append(f"\nClassifications performed: {len(classifications)}")
+    out.append(f"Access requests approved: {len(approved)}")
+    out.append(f"Access requests denied: {len(denied)}")
 
     if denied:
-        print("\nDenied requests:")
+        out.append("\nDenied requests:")
         for resource, op_type, reason in denied:
-            print(f"  - {op_type.value} {resource}: {reason}")
+            out.append(f"  - {op_type.value} {resource}: {reason}")
 
-    print("\n✓ Governance workflow complete")
-    print("  All operations have been classified, evaluated, and audited.")
+    out.append("\n✓ Governance workflow complete")
+    out.append("  All operations have been classified, evaluated, and audited.")
+    flush(out)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,25 @@ Demonstrates how to evaluate data operations against
 governance policies to determine if they are allowed.
 """
 
-from lacuna.engine.governance import GovernanceEngine
+import sys
+
+from _shared import get_engine
+
 from lacuna.models.data_operation import DataOperation, OperationType, UserContext
 
 
 def main() -> None:
     """Run policy evaluation examples."""
     # Initialize the governance engine
-    engine = GovernanceEngine()
+    engine = get_engine()
 
-    print("=== Policy Evaluation Examples ===\n")
+    # Buffer output and write it once at the end
+    out: list[str] = []
+
+    out.append("=== Policy Evaluation Examples ===\n")
 
     # Example 1: Basic read operation
-    print("1. Evaluating a read operation:")
+    out.append("1. Evaluating a read operation:")
     user = UserContext(
         user_id="alice",
         user_role="analyst",
@@ -26,18 +32,20 @@ def main() -> None:
     operation = DataOperation(
         operation_type=OperationType.READ,
         resource_id="marketing_data.csv",
-        user_context=user,
+        user=user,
     )
     result = engine.evaluate_operation(operation)
-    print(f"   Operation: {operation.operation_type.value} on {operation.resource_id}")
-    print(f"   User: {user.user_id} ({user.user_role})")
-    print(f"   Allowed: {result.allowed}")
+    out.append(
+        f"   Operation: {operation.operation_type.value} on {operation.resource_id}"
+    )
+    out.append(f"   User: {user.user_id} ({user.user_role})")
+    out.append(f"   Allowed: {result.allowed}")
     if not result.allowed:
-        print(f"   Reason: {result.to_user_message()}")
-    print()
+        out.append(f"   Reason: {result.to_user_message()}")
+    out.append("")
 
     # Example 2: Export operation (higher risk)
-    print("2. Evaluating an export operation:")
+    out.append("2. Evaluating an export operation:")
     user = UserContext(
         user_id="bob",
         user_role="intern",
@@ -46,18 +54,20 @@ def main() -> None:
     operation = DataOperation(
         operation_type=OperationType.EXPORT,
         resource_id="customer_pii.csv",
-        user_context=user,
+        user=user,
     )
     result = engine.evaluate_operation(operation)
-    print(f"   Operation: {operation.operation_type.value} on {operation.resource_id}")
-    print(f"   User: {user.user_id} ({user.user_role})")
-    print(f"   Allowed: {result.allowed}")
+    out.append(
+        f"   Operation: {operation.operation_type.value} on {operation.resource_id}"
+    )
+    out.append(f"   User: {user.user_id} ({user.user_role})")
+    out.append(f"   Allowed: {result.allowed}")
     if not result.allowed:
-        print(f"   Message: {result.to_user_message()}")
-    print()
+        out.append(f"   Message: {result.to_user_message()}")
+    out.append("")
 
     # Example 3: Transform operation with lineage
-    print("3. Evaluating a transform operation:")
+    out.append("3. Evaluating a transform operation:")
     user = UserContext(
         user_id="charlie",
         user_role="data_engineer",
@@ -66,19 +76,19 @@ def main() -> None:
     operation = DataOperation(
         operation_type=OperationType.TRANSFORM,
         resource_id="aggregated_metrics.parquet",
-        source_resources=["raw_events.csv", "user_sessions.csv"],
-        user_context=user,
+        sources=["raw_events.csv", "user_sessions.csv"],
+        user=user,
         metadata={"transformation": "aggregate_by_day"},
     )
     result = engine.evaluate_operation(operation)
-    print(f"   Operation: {operation.operation_type.value}")
-    print(f"   Sources: {operation.source_resources}")
-    print(f"   Target: {operation.resource_id}")
-    print(f"   Allowed: {result.allowed}")
-    print()
+    out.append(f"   Operation: {operation.operation_type.value}")
+    out.append(f"   Sources: {operation.sources}")
+    out.append(f"   Target: {operation.resource_id}")
+    out.append(f"   Allowed: {result.allowed}")
+    out.append("")
 
     # Example 4: Delete operation (administrative)
-    print("4. Evaluating a delete operation:")
+    out.append("4. Evaluating a delete operation:")
     user = UserContext(
         user_id="admin",
         user_role="admin",
@@ -88,16 +98,18 @@ def main() -> None:
     operation = DataOperation(
         operation_type=OperationType.DELETE,
         resource_id="old_logs.csv",
-        user_context=user,
+        user=user,
     )
     result = engine.evaluate_operation(operation)
-    print(f"   Operation: {operation.operation_type.value} on {operation.resource_id}")
-    print(f"   User: {user.user_id} (clearance: {user.user_clearance})")
-    print(f"   Allowed: {result.allowed}")
-    print()
+    out.append(
+        f"   Operation: {operation.operation_type.value} on {operation.resource_id}"
+    )
+    out.append(f"   User: {user.user_id} (clearance: {user.user_clearance})")
+    out.append(f"   Allowed: {result.allowed}")
+    out.append("")
 
     # Example 5: Check multiple operations
-    print("5. Batch policy checks:")
+    out.append("5. Batch policy checks:")
     operations = [
         (OperationType.READ, "public_docs.md"),
         (OperationType.WRITE, "internal_config.yaml"),
@@ -105,14 +117,17 @@ def main() -> None:
     ]
     user = UserContext(user_id="eve", user_role="developer")
     for op_type, resource in operations:
+        op_value = op_type.value
         op = DataOperation(
             operation_type=op_type,
             resource_id=resource,
-            user_context=user,
+            user=user,
         )
         r = engine.evaluate_operation(op)
         status = "✓ Allowed" if r.allowed else "✗ Denied"
-        print(f"   {status} | {op_type.value:10} | {resource}")
+        out.append(f"   {status} | {op_value:10} | {resource}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
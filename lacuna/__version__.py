@@ -3,28 +3,95 @@
 import os
 import subprocess
 from datetime import datetime
+from functools import cache
+from importlib import metadata
 from pathlib import Path
+from typing import Optional
 
+_PACKAGE_DIR = Path(__file__).parent
+_GIT_DIR = _PACKAGE_DIR.parent / ".git"
 
-def _get_version() -> str:
-    """Generate version as year.major.buildnumber."""
-    # First, try to read from static version file (created during build)
-    version_file = Path(__file__).parent / "_version.txt"
-    if version_file.exists():
-        return version_file.read_text().strip()
 
-    # Otherwise, generate from git (development mode)
-    year = datetime.now().year
-    major = 1  # Increment manually for breaking changes
+def _cache_dir() -> Path:
+    """Get the per-user cache directory for development version lookups."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "lacuna"
+
+
+def _git_head_sha() -> Optional[str]:
+    """Resolve the checked-out commit by reading .git directly (no subprocess).
+
+    Returns:
+        Commit sha, or None if it cannot be determined from the files
+    """
+    try:
+        head = (_GIT_DIR / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD
+
+        ref = head[len("ref: ") :]
+        ref_file = _GIT_DIR / ref
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+
+        for line in (_GIT_DIR / "packed-refs").read_text().splitlines():
+            if line.endswith(f" {ref}"):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+
+def _git_commit_count() -> str:
+    """Count commits on HEAD, memoized on disk per HEAD sha."""
+    sha = _git_head_sha()
+    cache_file = _cache_dir() / f"commit-count-{sha}.txt" if sha else None
+    if cache_file is not None:
+        try:
+            return cache_file.read_text().strip()
+        except OSError:
+            pass
+
     try:
         commit_count = subprocess.run(
             ["git", "rev-list", "--count", "HEAD"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=_PACKAGE_DIR,
         ).stdout.strip()
     except (subprocess.CalledProcessError, FileNotFoundError):
-        commit_count = "0"
+        return "0"
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(commit_count)
+        except OSError:
+            pass  # Caching is best-effort
+
+    return commit_count
+
+
+@cache
+def _get_version() -> str:
+    """Generate version as year.major.buildnumber."""
+    # First, try to read from static version file (created during build)
+    version_file = _PACKAGE_DIR / "_version.txt"
+    if version_file.exists():
+        return version_file.read_text().strip()
+
+    # Installed from a wheel: use the package metadata
+    if not _GIT_DIR.exists():
+        try:
+            return metadata.version("lacuna")
+        except metadata.PackageNotFoundError:
+            pass
+
+    # Otherwise, generate from git (development mode)
+    year = datetime.now().year
+    major = 1  # Increment manually for breaking changes
+    commit_count = _git_commit_count()
 
     version = f"{year}.{major}.{commit_count}"
 
@@ -1,13 +1,5 @@
 """REST API server for Lacuna."""
 
 from lacuna.api.app import create_app
-from lacuna.api.routes import audit, classify, evaluate, health, lineage
 
-__all__ = [
-    "create_app",
-    "classify",
-    "evaluate",
-    "lineage",
-    "audit",
-    "health",
-]
+__all__ = ["create_app"]
@@ -1,50 +1,59 @@
 """FastAPI application factory."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Optional
+from functools import cache
 
 import structlog
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Request
 
 from lacuna.__version__ import __version__
+from lacuna.api.middleware import FastPathCORSMiddleware
 from lacuna.config import get_settings
+from lacuna.db.base import warm_pool
 from lacuna.engine.governance import GovernanceEngine
 
 logger = structlog.get_logger()
 
-# Global governance engine instance
-_engine: Optional[GovernanceEngine] = None
 
+async def get_engine(request: Request) -> GovernanceEngine:
+    """Get the governance engine created at application startup.
 
-def get_engine() -> GovernanceEngine:
-    """Get the governance engine instance."""
-    global _engine
-    if _engine is None:
-        _engine = GovernanceEngine()
-    return _engine
+    Declared async so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool.
+    """
+    return request.app.state.engine
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
-    global _engine
-
     # Startup
     logger.info("lacuna_api_starting", version=__version__)
-    _engine = GovernanceEngine()
+    app.state.engine = GovernanceEngine()
+
+    if get_settings().database.pool_warmup:
+        try:
+            opened = await asyncio.to_thread(warm_pool)
+            logger.info("database_pool_warmed", connections=opened)
+        except Exception as e:
+            logger.warning("database_pool_warmup_failed", error=str(e))
 
     yield
 
     # Shutdown
-    if _engine:
-        _engine.stop()
+    app.state.engine.stop()
     logger.info("lacuna_api_stopped")
 
 
+@cache
 def create_app() -> FastAPI:
-    """Create and configure FastAPI application."""
+    """Create and configure FastAPI application.
+
+    The application is built once per process; use ``lacuna.api.asgi:app``
+    as the ASGI entrypoint.
+    """
     _settings = get_settings()
 
     app = FastAPI(
@@ -59,7 +68,7 @@ def create_app() -> FastAPI:
 
     # CORS middleware
     app.add_middleware(
-        CORSMiddleware,
+        FastPathCORSMiddleware,
         allow_origins=["*"],  # Configure appropriately for production
         allow_credentials=True,
         allow_methods=["*"],
@@ -67,13 +76,10 @@ def create_app() -> FastAPI:
     )
 
     # Register routes
-    from lacuna.api.routes import audit, classify, evaluate, health, lineage
+    from lacuna.api.routes import ROUTERS
 
-    app.include_router(health.router, tags=["Health"])
-    app.include_router(classify.router, prefix="/api/v1", tags=["Classification"])
-    app.include_router(evaluate.router, prefix="/api/v1", tags=["Evaluation"])
-    app.include_router(lineage.router, prefix="/api/v1", tags=["Lineage"])
-    app.include_router(audit.router, prefix="/api/v1", tags=["Audit"])
+    for router, options in ROUTERS:
+        app.include_router(router, **options)
 
     # Register web routes (user and admin dashboards)
     from lacuna.web.routes import admin as admin_web
@@ -83,7 +89,3 @@ def create_app() -> FastAPI:
     app.include_router(admin_web.router)
 
     return app
-
-
-# Create the default app instance
-app = create_app()
@@ -0,0 +1,5 @@
+"""ASGI entrypoint for serving Lacuna (``uvicorn lacuna.api.asgi:app``)."""
+
+from lacuna.api.app import create_app
+
+app = create_app()
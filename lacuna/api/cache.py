@@ -0,0 +1,124 @@
+"""Decision cache for repeated policy evaluation requests."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from lacuna.config import get_settings
+
+
+class CachePolicy(str, Enum):
+    """How an evaluation request uses the decision cache."""
+
+    ENABLED = "enabled"  # Serve cached decisions and store new ones
+    READ_ONLY = "read-only"  # Serve cached decisions, never store
+    REPLAY = "replay"  # Only serve cached decisions; a miss is an error
+    DISABLED = "disabled"  # Always evaluate
+
+
+class DecisionCache:
+    """
+    LRU cache of evaluation responses keyed by request content.
+
+    Entries expire after ``ttl`` seconds so policy changes take effect
+    without an explicit flush. A cached decision is served without running
+    the governance pipeline, so its lineage is not tracked again; callers
+    are responsible for auditing it.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 60):
+        """Initialize decision cache.
+
+        Args:
+            max_size: Maximum number of cached decisions
+            ttl: Seconds before a cached decision expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[BaseModel, float]] = OrderedDict()
+
+    @staticmethod
+    def make_key(request: BaseModel, user_id: str) -> bytes:
+        """Build a content-addressed key for an evaluation request.
+
+        Args:
+            request: Validated request model
+            user_id: Effective user the request is evaluated for
+
+        Returns:
+            SHA-256 digest of the request type, user and fields
+        """
+        payload = f"{type(request).__name__}\0{user_id}\0{request.model_dump_json()}"
+        return hashlib.sha256(payload.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[BaseModel]:
+        """Look up a cached decision, evicting it if expired.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response, or None on miss or expiry
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, stored_at = entry
+            if time.monotonic() - stored_at <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: bytes, response: BaseModel) -> None:
+        """Store a decision, evicting the least recently used entry.
+
+        Args:
+            key: Key from make_key
+            response: Response to cache
+        """
+        self._entries[key] = (response, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached decisions and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_decision_cache() -> DecisionCache:
+    """Get the process-wide decision cache."""
+    settings = get_settings()
+    return DecisionCache(
+        max_size=settings.policy.decision_cache_size,
+        ttl=settings.policy.decision_cache_ttl,
+    )
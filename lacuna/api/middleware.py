@@ -0,0 +1,25 @@
+"""ASGI middleware for the Lacuna API."""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class FastPathCORSMiddleware(CORSMiddleware):
+    """
+    CORS middleware that skips requests without an ``Origin`` header.
+
+    Starlette precomputes the preflight and simple response headers, but
+    still parses the request headers on every call. Same-origin and
+    server-to-server API calls never carry ``Origin``, so they are passed
+    straight to the application after a scan of the raw header names.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call, only applying CORS to cross-origin requests."""
+        if scope["type"] == "http" and not any(
+            name == b"origin" for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,19 @@
+"""Response helpers for the Lacuna API."""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to a JSON response.
+
+    Returning a Response skips FastAPI's dump-and-revalidate pass against the
+    route's ``response_model``, which stays declared for the OpenAPI schema.
+
+    Args:
+        model: Response model built from trusted engine output
+
+    Returns:
+        JSON response with the serialized model
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -1,8 +1,22 @@
 """API routes for Lacuna."""
 
+from typing import Any
+
+from fastapi import APIRouter
+
 from lacuna.api.routes import audit, classify, evaluate, health, lineage
 
+# Routers registered by create_app(), with their include_router() options
+ROUTERS: tuple[tuple[APIRouter, dict[str, Any]], ...] = (
+    (health.router, {"tags": ["Health"]}),
+    (classify.router, {"prefix": "/api/v1", "tags": ["Classification"]}),
+    (evaluate.router, {"prefix": "/api/v1", "tags": ["Evaluation"]}),
+    (lineage.router, {"prefix": "/api/v1", "tags": ["Lineage"]}),
+    (audit.router, {"prefix": "/api/v1", "tags": ["Audit"]}),
+)
+
 __all__ = [
+    "ROUTERS",
     "classify",
     "evaluate",
     "lineage",
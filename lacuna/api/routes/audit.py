@@ -1,23 +1,55 @@
 """Audit API endpoints."""
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict
 
 from lacuna.api.app import get_engine
+from lacuna.api.responses import json_response
+from lacuna.api.routing import ErrorHandlingRoute
 from lacuna.auth.dependencies import get_current_user
 from lacuna.auth.models import AuthenticatedUser
 from lacuna.engine.governance import GovernanceEngine
-from lacuna.models.audit import EventType
+from lacuna.models.audit import AuditQuery, EventType
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
+
+_EVENT_TYPES = {et.value: et for et in EventType}
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp query parameter.
+
+    Dashboards poll the same time windows repeatedly, so results are memoized.
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 timestamp
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+def _parse_time_range(
+    start_time: Optional[str], end_time: Optional[str]
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Parse start/end query parameters, rejecting bad input with a 400."""
+    try:
+        return _parse_iso(start_time), _parse_iso(end_time)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid ISO timestamp: {e}"
+        ) from e
 
 
 class AuditRecordResponse(BaseModel):
     """Response model for audit records."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event_id: str
     timestamp: str
     event_type: str
@@ -34,6 +66,8 @@ class AuditRecordResponse(BaseModel):
 class AuditQueryResponse(BaseModel):
     """Response model for audit queries."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     records: list[AuditRecordResponse]
     total: int
     offset: int
@@ -46,72 +80,71 @@ async def query_audit_logs(
     resource_id: Optional[str] = Query(None, description="Filter by resource ID"),
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     action_result: Optional[str] = Query(None, description="Filter by action result"),
+    tag: Optional[list[str]] = Query(
+        None, description="Filter by resource tag (repeat to require several)"
+    ),
     start_time: Optional[str] = Query(None, description="Start time (ISO format)"),
     end_time: Optional[str] = Query(None, description="End time (ISO format)"),
     limit: int = Query(100, le=1000, description="Maximum records to return"),
     offset: int = Query(0, description="Offset for pagination"),
     engine: GovernanceEngine = Depends(get_engine),
     _user: AuthenticatedUser = Depends(get_current_user),
-) -> AuditQueryResponse:
+) -> Response:
     """Query audit logs with filters.
 
-    Supports filtering by user, resource, event type, and time range.
+    Supports filtering by user, resource, event type, resource tags, and
+    time range.
+
+    Records come from the audit store and are already well-formed, so the
+    response is built without per-record validation and serialized to JSON
+    in a single pass.
     """
-    try:
-        # Build query parameters
-        query_params: dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
-
-        if user_id:
-            query_params["user_id"] = user_id
-        if resource_id:
-            query_params["resource_id"] = resource_id
-        if action_result:
-            query_params["action_result"] = action_result
-        if start_time:
-            query_params["start_time"] = datetime.fromisoformat(start_time)
-        if end_time:
-            query_params["end_time"] = datetime.fromisoformat(end_time)
-        if event_type:
-            try:
-                query_params["event_types"] = [EventType(event_type)]
-            except ValueError:
-                pass
-
-        # Query audit logs
-        records = engine._audit_logger.query(**query_params)
-
-        return AuditQueryResponse(
-            records=[
-                AuditRecordResponse(
-                    event_id=str(r.event_id),
-                    timestamp=r.timestamp.isoformat(),
-                    event_type=r.event_type.value,
-                    severity=r.severity.value,
-                    user_id=r.user_id,
-                    resource_type=r.resource_type,
-                    resource_id=r.resource_id,
-                    resource_classification=r.resource_classification,
-                    action=r.action,
-                    action_result=r.action_result,
-                    reasoning=r.classification_reasoning,
-                )
-                for r in records
-            ],
-            total=len(records),
-            offset=offset,
-            limit=limit,
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    start, end = _parse_time_range(start_time, end_time)
+
+    query = AuditQuery(
+        user_id=user_id or None,
+        resource_id=resource_id or None,
+        action_result=action_result or None,
+        resource_tags=tag or [],
+        start_time=start,
+        end_time=end,
+        event_types=[_EVENT_TYPES[event_type]] if event_type in _EVENT_TYPES else [],
+        limit=limit,
+        offset=offset,
+    )
+
+    # Query audit logs
+    records = await asyncio.to_thread(engine._audit_logger.query, query)
+
+    response = AuditQueryResponse.model_construct(
+        records=[
+            AuditRecordResponse.model_construct(
+                event_id=str(r.event_id),
+                timestamp=r.timestamp.isoformat(),
+                event_type=r.event_type.value,
+                severity=r.severity.value,
+                user_id=r.user_id,
+                resource_type=r.resource_type,
+                resource_id=r.resource_id,
+                resource_classification=r.resource_classification,
+                action=r.action,
+                action_result=r.action_result,
+                reasoning=r.classification_reasoning,
+            )
+            for r in records
+        ],
+        total=len(records),
+        offset=offset,
+        limit=limit,
+    )
+    return json_response(response)
 
 
 class IntegrityVerificationResponse(BaseModel):
     """Response model for integrity verification."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     verified: bool
     records_checked: int
     errors: list[dict[str, Any]]
@@ -131,28 +164,25 @@ async def verify_audit_integrity(
 
     Checks that no audit records have been tampered with.
     """
-    try:
-        start = datetime.fromisoformat(start_time) if start_time else None
-        end = datetime.fromisoformat(end_time) if end_time else None
-
-        result = engine._audit_logger.verify_integrity(start, end)
+    start, end = _parse_time_range(start_time, end_time)
 
-        return IntegrityVerificationResponse(
-            verified=result["verified"],
-            records_checked=result["records_checked"],
-            errors=result["errors"],
-            message=result["message"],
-            first_record=result.get("first_record"),
-            last_record=result.get("last_record"),
-        )
+    result = await asyncio.to_thread(engine._audit_logger.verify_integrity, start, end)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    return IntegrityVerificationResponse(
+        verified=result["verified"],
+        records_checked=result["records_checked"],
+        errors=result["errors"],
+        message=result["message"],
+        first_record=result.get("first_record"),
+        last_record=result.get("last_record"),
+    )
 
 
 class AuditStatsResponse(BaseModel):
     """Response model for audit statistics."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     total_records: int
     by_event_type: dict[str, int]
     by_action_result: dict[str, int]
@@ -170,15 +200,11 @@ async def get_audit_stats(
 
     Returns aggregated statistics about audit events.
     """
-    try:
-        # For now, return basic stats
-        # In production, this would query aggregated data from the database
-        return AuditStatsResponse(
-            total_records=0,
-            by_event_type={},
-            by_action_result={},
-            by_classification={},
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    # For now, return basic stats
+    # In production, this would query aggregated data from the database
+    return AuditStatsResponse(
+        total_records=0,
+        by_event_type={},
+        by_action_result={},
+        by_classification={},
+    )
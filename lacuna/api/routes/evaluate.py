@@ -1,22 +1,40 @@
 """Evaluation API endpoints for policy decisions."""
 
-from typing import Optional
+import asyncio
+from time import perf_counter_ns
+from typing import Any, Optional
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict, Field
 
 from lacuna.api.app import get_engine
+from lacuna.api.cache import CachePolicy, get_decision_cache
+from lacuna.api.responses import json_response
+from lacuna.api.routing import ErrorHandlingRoute
 from lacuna.auth.dependencies import get_current_user
 from lacuna.auth.models import AuthenticatedUser
 from lacuna.engine.governance import GovernanceEngine
 from lacuna.models.data_operation import DataOperation, OperationType, UserContext
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
+
+_OPERATION_TYPES = {op.value: op for op in OperationType}
+
+_CACHE_POLICY_QUERY = Query(
+    CachePolicy.DISABLED,
+    description=(
+        "Decision cache use: enabled, read-only, replay or disabled. "
+        "Cached decisions are audited with a fresh evaluation ID."
+    ),
+)
 
 
 class EvaluateRequest(BaseModel):
     """Request model for governance evaluation."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     operation_type: str = Field(
         ..., description="Operation type (read, write, export, query, etc.)"
     )
@@ -31,7 +49,7 @@ class EvaluateRequest(BaseModel):
     )
     destination_type: Optional[str] = Field(None, description="Destination type")
     destination_encrypted: bool = Field(False, description="Is destination encrypted")
-    sources: Optional[list[str]] = Field(
+    sources: Optional[tuple[str, ...]] = Field(
         None, description="Source artifacts for transformations"
     )
     purpose: Optional[str] = Field(None, description="Business justification")
@@ -42,6 +60,8 @@ class EvaluateRequest(BaseModel):
 class EvaluateResponse(BaseModel):
     """Response model for governance evaluation."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     allowed: bool = Field(..., description="Whether the operation is allowed")
     classification_tier: Optional[str] = Field(
         None, description="Data classification tier"
@@ -59,67 +79,133 @@ class EvaluateResponse(BaseModel):
     latency_ms: Optional[float] = Field(None, description="Total evaluation latency")
 
 
+def _cached_response(
+    key: bytes,
+    cache_policy: CachePolicy,
+    start: int,
+    engine: GovernanceEngine,
+    operation: DataOperation,
+) -> Optional[Response]:
+    """Serve an evaluation from the decision cache.
+
+    A cached decision is audited like a fresh one and answered with a new
+    evaluation ID, so every decision handed out is traceable on its own.
+
+    Args:
+        key: Decision cache key for the request
+        cache_policy: Requested cache policy (not DISABLED)
+        start: perf_counter_ns() at request start
+        engine: Governance engine used to audit the decision
+        operation: Operation the decision applies to
+
+    Returns:
+        Response for a cache hit, or None to evaluate normally
+    """
+    cached = get_decision_cache().get(key)
+    if isinstance(cached, EvaluateResponse):
+        evaluation_id = str(uuid4())
+        engine.log_cached_evaluation(
+            operation,
+            cached.allowed,
+            cached.reasoning,
+            evaluation_id,
+            cached.evaluation_id,
+            classification_tier=cached.classification_tier,
+            tags=cached.tags,
+        )
+        latency_ms = (perf_counter_ns() - start) / 1_000_000
+        return json_response(
+            cached.model_copy(
+                update={"evaluation_id": evaluation_id, "latency_ms": latency_ms}
+            )
+        )
+
+    if cache_policy is CachePolicy.REPLAY:
+        raise HTTPException(status_code=404, detail="No cached evaluation")
+    return None
+
+
+def _evaluation_response(
+    result: Any, key: Optional[bytes], cache_policy: CachePolicy
+) -> Response:
+    """Build the response for a governance result, caching it if requested.
+
+    GovernanceResult fields are already typed to match the response, so the
+    model is constructed without re-validating them.
+    """
+    response = EvaluateResponse.model_construct(
+        allowed=result.allowed,
+        classification_tier=result.tier,
+        confidence=result.confidence,
+        reasoning=result.reasoning,
+        alternatives=result.alternatives,
+        tags=result.tags,
+        policy_rules=result.matched_rules,
+        evaluation_id=str(result.evaluation_id),
+        latency_ms=result.total_latency_ms,
+    )
+    if key is not None and cache_policy is CachePolicy.ENABLED:
+        get_decision_cache().put(key, response)
+    return json_response(response)
+
+
 @router.post("/evaluate", response_model=EvaluateResponse)
 async def evaluate_operation(
     request: EvaluateRequest,
+    cache_policy: CachePolicy = _CACHE_POLICY_QUERY,
     engine: GovernanceEngine = Depends(get_engine),
     user: AuthenticatedUser = Depends(get_current_user),
-) -> EvaluateResponse:
+) -> Response:
     """Evaluate a data operation against governance policies.
 
     Returns whether the operation is allowed, along with reasoning
     and alternatives if denied.
     """
-    try:
-        # Map string operation type to enum
-        try:
-            op_type = OperationType(request.operation_type)
-        except ValueError:
-            op_type = OperationType.READ
-
-        # Use request user_id if provided, otherwise use authenticated user
-        effective_user_id = request.user_id or user.user_id
-
-        # Build operation
-        operation = DataOperation(
-            operation_type=op_type,
-            resource_type=request.resource_type,
-            resource_id=request.resource_id,
-            destination=request.destination,
-            destination_type=request.destination_type,
-            destination_encrypted=request.destination_encrypted,
-            sources=request.sources or [],
-            user=UserContext(
-                user_id=effective_user_id,
-                user_role=request.user_role,
-            ),
-            purpose=request.purpose,
-            project=request.project,
-            environment=request.environment,
-        )
+    start = perf_counter_ns()
 
-        # Evaluate
-        result = engine.evaluate_operation(operation)
-
-        return EvaluateResponse(
-            allowed=result.allowed,
-            classification_tier=result.tier,
-            confidence=result.confidence,
-            reasoning=result.reasoning,
-            alternatives=result.alternatives,
-            tags=result.tags,
-            policy_rules=result.matched_rules,
-            evaluation_id=str(result.evaluation_id),
-            latency_ms=result.total_latency_ms,
-        )
+    # Use request user_id if provided, otherwise use authenticated user
+    effective_user_id = request.user_id or user.user_id
+
+    # Map string operation type to enum
+    op_type = _OPERATION_TYPES.get(request.operation_type, OperationType.READ)
+
+    # Build operation
+    operation = DataOperation(
+        operation_type=op_type,
+        resource_type=request.resource_type,
+        resource_id=request.resource_id,
+        destination=request.destination,
+        destination_type=request.destination_type,
+        destination_encrypted=request.destination_encrypted,
+        sources=request.sources or (),
+        user=UserContext(
+            user_id=effective_user_id,
+            user_role=request.user_role,
+        ),
+        purpose=request.purpose,
+        project=request.project,
+        environment=request.environment,
+    )
+
+    # The cache key is only computed when the policy uses the cache
+    key: Optional[bytes] = None
+    if cache_policy is not CachePolicy.DISABLED:
+        key = get_decision_cache().make_key(request, effective_user_id)
+        cached = _cached_response(key, cache_policy, start, engine, operation)
+        if cached is not None:
+            return cached
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    # Evaluation writes audit records and lineage; keep it off the event loop
+    result = await asyncio.to_thread(engine.evaluate_operation, operation)
+
+    return _evaluation_response(result, key, cache_policy)
 
 
 class ExportEvaluateRequest(BaseModel):
     """Request model for export evaluation."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     source: str = Field(..., description="Source resource ID")
     destination: str = Field(..., description="Destination path or URL")
     user_id: Optional[str] = Field(
@@ -131,31 +217,57 @@ class ExportEvaluateRequest(BaseModel):
 @router.post("/evaluate/export", response_model=EvaluateResponse)
 async def evaluate_export(
     request: ExportEvaluateRequest,
+    cache_policy: CachePolicy = _CACHE_POLICY_QUERY,
     engine: GovernanceEngine = Depends(get_engine),
     user: AuthenticatedUser = Depends(get_current_user),
-) -> EvaluateResponse:
+) -> Response:
     """Evaluate an export operation.
 
     Simplified endpoint specifically for export operations.
     """
+    start = perf_counter_ns()
+
     # Use request user_id if provided, otherwise use authenticated user
     effective_user_id = request.user_id or user.user_id
 
-    result = engine.evaluate_export(
+    # The cache key is only computed when the policy uses the cache
+    key: Optional[bytes] = None
+    if cache_policy is not CachePolicy.DISABLED:
+        key = get_decision_cache().make_key(request, effective_user_id)
+        operation = engine.export_operation(
+            request.source, request.destination, effective_user_id, request.purpose
+        )
+        cached = _cached_response(key, cache_policy, start, engine, operation)
+        if cached is not None:
+            return cached
+
+    result = await asyncio.to_thread(
+        engine.evaluate_export,
         source=request.source,
         destination=request.destination,
         user_id=effective_user_id,
         purpose=request.purpose,
     )
 
-    return EvaluateResponse(
-        allowed=result.allowed,
-        classification_tier=result.tier,
-        confidence=result.confidence,
-        reasoning=result.reasoning,
-        alternatives=result.alternatives,
-        tags=result.tags,
-        policy_rules=result.matched_rules,
-        evaluation_id=str(result.evaluation_id),
-        latency_ms=result.total_latency_ms,
-    )
+    return _evaluation_response(result, key, cache_policy)
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for decision cache statistics."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+@router.get("/evaluate/cache/stats", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    _user: AuthenticatedUser = Depends(get_current_user),
+) -> CacheStatsResponse:
+    """Get evaluation decision cache statistics."""
+    return CacheStatsResponse(**get_decision_cache().get_stats())
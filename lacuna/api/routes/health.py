@@ -1,8 +1,10 @@
 """Health check endpoints."""
 
+import json
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from lacuna.__version__ import __version__
 from lacuna.config import get_settings
@@ -10,27 +12,40 @@ from lacuna.config import get_settings
 router = APIRouter()
 
 
+def _encode(body: dict[str, Any]) -> bytes:
+    """Encode a probe response body once so it can be served repeatedly."""
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+_HEALTH_BODY = _encode({"status": "healthy", "version": __version__})
+_LIVE_BODY = _encode({"status": "alive"})
+
+
+@lru_cache(maxsize=1)
+def _ready_body() -> bytes:
+    """Encode the readiness response, which depends on settings."""
+    return _encode(
+        {
+            "status": "ready",
+            "version": __version__,
+            "environment": get_settings().environment,
+        }
+    )
+
+
 @router.get("/health")
-async def health_check() -> dict[str, Any]:
+async def health_check() -> Response:
     """Check service health status."""
-    return {
-        "status": "healthy",
-        "version": __version__,
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/health/ready")
-async def readiness_check() -> dict[str, Any]:
+async def readiness_check() -> Response:
     """Readiness check for Kubernetes."""
-    settings = get_settings()
-    return {
-        "status": "ready",
-        "version": __version__,
-        "environment": settings.environment,
-    }
+    return Response(content=_ready_body(), media_type="application/json")
 
 
 @router.get("/health/live")
-async def liveness_check() -> dict[str, str]:
+async def liveness_check() -> Response:
     """Liveness check for Kubernetes."""
-    return {"status": "alive"}
+    return Response(content=_LIVE_BODY, media_type="application/json")
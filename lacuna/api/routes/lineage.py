@@ -1,21 +1,69 @@
 """Lineage API endpoints."""
 
+import asyncio
+import hashlib
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from lacuna.api.app import get_engine
+from lacuna.api.responses import json_response
+from lacuna.api.routing import ErrorHandlingRoute
 from lacuna.auth.dependencies import get_current_user
 from lacuna.auth.models import AuthenticatedUser
 from lacuna.engine.governance import GovernanceEngine
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
+
+# Lineage responses are per-user, so only the client may cache them
+_CACHE_CONTROL = "private, max-age=30"
+
+
+def _lineage_etag(request: Request, version: Optional[int]) -> Optional[str]:
+    """Build an ETag for a lineage response.
+
+    The lineage version is only known for the in-memory backend used in
+    development; with a shared backend such as PostgreSQL no ETag is sent
+    and every request is answered in full.
+
+    Args:
+        request: Incoming request, whose path and query select the response
+        version: Engine lineage version
+
+    Returns:
+        Quoted ETag, or None if the lineage version is unknown
+    """
+    if version is None:
+        return None
+    key = f"{request.url.path}?{request.url.query}:{version}"
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """Return a 304 response if the client already holds the current lineage."""
+    if etag is None:
+        return None
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag not in (tag.strip() for tag in if_none_match.split(",")):
+        return None
+    return _with_cache_headers(Response(status_code=304), etag)
+
+
+def _with_cache_headers(response: Response, etag: Optional[str]) -> Response:
+    """Attach validation headers to a lineage response."""
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
 
 
 class LineageNode(BaseModel):
     """Lineage node model."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     node_id: str
     resource_type: Optional[str] = None
     classification_tier: Optional[str] = None
@@ -25,6 +73,8 @@ class LineageNode(BaseModel):
 class LineageEdge(BaseModel):
     """Lineage edge model."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     source_id: str
     destination_id: str
     operation_type: str
@@ -34,6 +84,8 @@ class LineageEdge(BaseModel):
 class LineageGraphResponse(BaseModel):
     """Response model for lineage graph."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     artifact_id: str
     nodes: list[LineageNode]
     edges: list[LineageEdge]
@@ -44,56 +96,66 @@ class LineageGraphResponse(BaseModel):
 @router.get("/lineage/{artifact_id}", response_model=LineageGraphResponse)
 async def get_lineage(
     artifact_id: str,
+    request: Request,
     max_depth: int = Query(10, description="Maximum traversal depth"),
     engine: GovernanceEngine = Depends(get_engine),
     _user: AuthenticatedUser = Depends(get_current_user),
-) -> LineageGraphResponse:
+) -> Response:
     """Get lineage information for an artifact.
 
     Returns the complete lineage graph including upstream and downstream
-    dependencies.
+    dependencies. The graph and its dependency counts come from a single
+    engine call. The graph is projected onto the response fields as plain
+    dicts and encoded directly, without building a pydantic model per node
+    and edge. Clients revalidating with If-None-Match get a 304 without the
+    graph being loaded.
     """
-    try:
-        graph_data = engine.get_lineage(artifact_id)
-
-        nodes = [
-            LineageNode(
-                node_id=nid,
-                resource_type=node.get("resource_type"),
-                classification_tier=node.get("classification_tier"),
-                tags=node.get("tags", []),
-            )
-            for nid, node in graph_data.get("nodes", {}).items()
-        ]
-
-        edges = [
-            LineageEdge(
-                source_id=edge.get("source_id"),
-                destination_id=edge.get("destination_id"),
-                operation_type=edge.get("operation_type"),
-                timestamp=edge.get("timestamp"),
-            )
-            for edge in graph_data.get("edges", [])
-        ]
-
-        upstream = engine.get_upstream(artifact_id)
-        downstream = engine.get_downstream(artifact_id)
-
-        return LineageGraphResponse(
-            artifact_id=artifact_id,
-            nodes=nodes,
-            edges=edges,
-            upstream_count=len(upstream),
-            downstream_count=len(downstream),
-        )
+    etag = _lineage_etag(request, engine.lineage_version())
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    graph_data = await asyncio.to_thread(
+        engine.get_lineage_with_counts, artifact_id, max_depth
+    )
+
+    nodes = [
+        {
+            "node_id": nid,
+            "resource_type": node.get("resource_type"),
+            "classification_tier": node.get("classification_tier"),
+            "tags": node.get("tags", []),
+        }
+        for nid, node in graph_data.get("nodes", {}).items()
+    ]
+
+    edges = [
+        {
+            "source_id": edge.get("source_id"),
+            "destination_id": edge.get("destination_id"),
+            "operation_type": edge.get("operation_type"),
+            "timestamp": edge.get("timestamp"),
+        }
+        for edge in graph_data.get("edges", [])
+    ]
+
+    response = JSONResponse(
+        {
+            "artifact_id": artifact_id,
+            "nodes": nodes,
+            "edges": edges,
+            "upstream_count": graph_data.get("upstream_count", 0),
+            "downstream_count": graph_data.get("downstream_count", 0),
+        }
+    )
+    return _with_cache_headers(response, etag)
 
 
 class UpstreamResponse(BaseModel):
     """Response model for upstream dependencies."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     artifact_id: str
     upstream: list[str]
     count: int
@@ -102,22 +164,33 @@ class UpstreamResponse(BaseModel):
 @router.get("/lineage/{artifact_id}/upstream", response_model=UpstreamResponse)
 async def get_upstream(
     artifact_id: str,
+    request: Request,
     max_depth: int = Query(10, description="Maximum traversal depth"),
     engine: GovernanceEngine = Depends(get_engine),
     _user: AuthenticatedUser = Depends(get_current_user),
-) -> UpstreamResponse:
+) -> Response:
     """Get upstream dependencies of an artifact."""
-    upstream = engine.get_upstream(artifact_id)
-    return UpstreamResponse(
-        artifact_id=artifact_id,
-        upstream=upstream,
-        count=len(upstream),
+    etag = _lineage_etag(request, engine.lineage_version())
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    upstream = await asyncio.to_thread(engine.get_upstream, artifact_id, max_depth)
+    response = json_response(
+        UpstreamResponse(
+            artifact_id=artifact_id,
+            upstream=upstream,
+            count=len(upstream),
+        )
     )
+    return _with_cache_headers(response, etag)
 
 
 class DownstreamResponse(BaseModel):
     """Response model for downstream dependencies."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     artifact_id: str
     downstream: list[str]
     count: int
@@ -126,22 +199,33 @@ class DownstreamResponse(BaseModel):
 @router.get("/lineage/{artifact_id}/downstream", response_model=DownstreamResponse)
 async def get_downstream(
     artifact_id: str,
+    request: Request,
     max_depth: int = Query(10, description="Maximum traversal depth"),
     engine: GovernanceEngine = Depends(get_engine),
     _user: AuthenticatedUser = Depends(get_current_user),
-) -> DownstreamResponse:
+) -> Response:
     """Get downstream dependents of an artifact."""
-    downstream = engine.get_downstream(artifact_id)
-    return DownstreamResponse(
-        artifact_id=artifact_id,
-        downstream=downstream,
-        count=len(downstream),
+    etag = _lineage_etag(request, engine.lineage_version())
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    downstream = await asyncio.to_thread(engine.get_downstream, artifact_id, max_depth)
+    response = json_response(
+        DownstreamResponse(
+            artifact_id=artifact_id,
+            downstream=downstream,
+            count=len(downstream),
+        )
     )
+    return _with_cache_headers(response, etag)
 
 
 class ImpactAnalysisResponse(BaseModel):
     """Response model for impact analysis."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     artifact_id: str
     downstream_count: int
     downstream_artifacts: list[str]
@@ -153,21 +237,21 @@ async def get_impact_analysis(
     artifact_id: str,
     engine: GovernanceEngine = Depends(get_engine),
     _user: AuthenticatedUser = Depends(get_current_user),
-) -> ImpactAnalysisResponse:
+) -> JSONResponse:
     """Analyze impact of changes to an artifact.
 
     Shows all downstream dependencies that would be affected
     by changes to this artifact.
     """
     tracker = engine._lineage_tracker
-    analysis = tracker.get_impact_analysis(artifact_id)
-
-    # Convert int keys to strings for JSON
-    by_depth = {str(k): v for k, v in analysis.get("by_depth", {}).items()}
-
-    return ImpactAnalysisResponse(
-        artifact_id=artifact_id,
-        downstream_count=analysis.get("downstream_count", 0),
-        downstream_artifacts=analysis.get("downstream_artifacts", []),
-        by_depth=by_depth,
+    analysis = await asyncio.to_thread(tracker.get_impact_analysis, artifact_id)
+
+    # by_depth is keyed by strings already, so it is passed through as-is
+    return JSONResponse(
+        {
+            "artifact_id": artifact_id,
+            "downstream_count": analysis.get("downstream_count", 0),
+            "downstream_artifacts": analysis.get("downstream_artifacts", []),
+            "by_depth": analysis.get("by_depth", {}),
+        }
     )
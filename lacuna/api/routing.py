@@ -0,0 +1,48 @@
+"""Route classes for the Lacuna API."""
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import structlog
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+logger = structlog.get_logger()
+
+_INTERNAL_ERROR_BODY = b'{"detail":"Internal server error"}'
+
+
+class ErrorHandlingRoute(APIRoute):
+    """
+    Route that turns unhandled errors into a generic 500 response.
+
+    Handlers no longer wrap their bodies in ``try/except Exception``. HTTP
+    and validation errors pass through to FastAPI's own handlers; anything
+    else is logged once and answered with a prebuilt body, so internal error
+    messages are not leaked to clients.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the FastAPI route handler with the error fallback."""
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception:
+                logger.exception(
+                    "api_request_failed",
+                    method=request.method,
+                    path=request.url.path,
+                )
+                return Response(
+                    content=_INTERNAL_ERROR_BODY,
+                    status_code=500,
+                    media_type="application/json",
+                )
+
+        return route_handler
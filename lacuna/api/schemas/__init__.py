@@ -0,0 +1,15 @@
+"""Request and response schemas for the Lacuna API."""
+
+from lacuna.api.schemas.classify import (
+    BatchClassifyRequest,
+    BatchClassifyResponse,
+    ClassifyRequest,
+    ClassifyResponse,
+)
+
+__all__ = [
+    "ClassifyRequest",
+    "ClassifyResponse",
+    "BatchClassifyRequest",
+    "BatchClassifyResponse",
+]
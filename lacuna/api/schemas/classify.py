@@ -0,0 +1,58 @@
+"""Request and response schemas for the classification API."""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ClassifyRequest(BaseModel):
+    """Request model for classification."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    query: str = Field(..., description="Query or text to classify")
+    project: Optional[str] = Field(None, description="Project context")
+    user_id: Optional[str] = Field(None, description="User identifier (overrides auth)")
+    user_role: Optional[str] = Field(None, description="User role")
+    environment: Optional[str] = Field(
+        None, description="Environment (dev/staging/prod)"
+    )
+    conversation: Optional[list[dict[str, str]]] = Field(
+        None, description="Previous conversation messages"
+    )
+
+
+class ClassifyResponse(BaseModel):
+    """Response model for classification."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    tier: str = Field(
+        ..., description="Classification tier (PROPRIETARY/INTERNAL/PUBLIC)"
+    )
+    confidence: float = Field(..., description="Classification confidence (0.0-1.0)")
+    reasoning: str = Field(..., description="Explanation for classification")
+    tags: list[str] = Field(
+        default_factory=list, description="Data tags (PII, PHI, etc.)"
+    )
+    classifier: str = Field(..., description="Classifier that made the decision")
+    latency_ms: float = Field(default=0.0, description="Classification latency")
+
+
+class BatchClassifyRequest(BaseModel):
+    """Request model for batch classification."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    queries: list[str] = Field(..., description="List of queries to classify")
+    project: Optional[str] = Field(None, description="Project context")
+    user_id: Optional[str] = Field(None, description="User identifier (overrides auth)")
+
+
+class BatchClassifyResponse(BaseModel):
+    """Response model for batch classification."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    results: list[ClassifyResponse]
+    total_latency_ms: float
@@ -1,19 +1,62 @@
 """Audit storage backend for PostgreSQL."""
 
-from datetime import datetime
+import csv
+import io
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
+from uuid import UUID
 
 import structlog
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, String, cast, desc, insert
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.orm import Query, Session
 
+from lacuna.config import get_settings
 from lacuna.db.base import session_scope
-from lacuna.db.models import AuditLogModel
+from lacuna.db.models import AuditCheckpointModel, AuditLogModel
 from lacuna.models.audit import AuditQuery, AuditRecord, EventType, Severity
 
 logger = structlog.get_logger()
 
 
+def _get_redis_client() -> Optional[Any]:
+    """Create a Redis client for sharing the chain head, if Redis is enabled."""
+    settings = get_settings().redis
+    if not settings.enabled:
+        return None
+
+    try:
+        import redis
+
+        return redis.Redis.from_url(settings.url, socket_timeout=0.5)
+    except Exception as e:
+        logger.warning("audit_redis_unavailable", error=str(e))
+        return None
+
+
+def _copy_value(value: Any) -> Any:
+    """Format a column value as a field of a COPY ... CSV stream."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        # PostgreSQL array literal with every element quoted
+        items = (
+            '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in value
+        )
+        return "{" + ",".join(items) + "}"
+    return value
+
+
 class AuditBackend:
     """
     PostgreSQL backend for ISO 27001-compliant audit logging.
@@ -24,81 +67,153 @@ class AuditBackend:
     - Indexed for efficient querying
     """
 
-    def __init__(self, verify_on_write: bool = True):
+    # Maximum rows per multi-row INSERT statement
+    INSERT_BATCH_SIZE = 1000
+
+    # Batches larger than this are loaded with COPY instead of INSERT
+    COPY_THRESHOLD = 5000
+
+    # Rows fetched per round trip when verifying the hash chain
+    VERIFY_BATCH_SIZE = 1000
+
+    # Time window applied to queries that set neither start nor end time
+    DEFAULT_QUERY_WINDOW = timedelta(days=30)
+
+    # Columns covered by AuditRecord.compute_hash, plus the stored hashes
+    _HASH_COLUMNS = (
+        AuditLogModel.event_id,
+        AuditLogModel.timestamp,
+        AuditLogModel.event_type,
+        AuditLogModel.user_id,
+        AuditLogModel.resource_id,
+        AuditLogModel.action,
+        AuditLogModel.action_result,
+        AuditLogModel.previous_record_hash,
+        AuditLogModel.record_hash,
+    )
+
+    # Chained records written between hash chain checkpoints (per process)
+    CHECKPOINT_INTERVAL = 10_000
+
+    # Redis key holding the hash chain head shared by all writer processes
+    LAST_HASH_KEY = "audit:last_hash"
+    LAST_HASH_TTL = 60
+
+    # Redis lease serializing chain extension across processes
+    CHAIN_LOCK_KEY = "audit:chain_lock"
+    CHAIN_LOCK_TIMEOUT = 30
+
+    def __init__(self, verify_on_write: bool = True, redis_client: Any = None):
         """Initialize audit backend.
 
         Args:
-            verify_on_write: Verify hash chain integrity on each write
+            verify_on_write: Hash-chain records on write; when False they are
+                stored unhashed and cannot be verified
+            redis_client: Redis client for sharing the chain head between
+                processes (defaults to one built from the redis settings)
         """
         self.verify_on_write = verify_on_write
         self._last_hash: Optional[str] = None
+        self._records_since_checkpoint = 0
+        self._redis = redis_client if redis_client is not None else _get_redis_client()
 
     def _get_last_hash(self, session: Session) -> Optional[str]:
-        """Get the hash of the most recent audit record."""
-        if self._last_hash is not None:
+        """Get the hash of the most recent audit record.
+
+        With Redis, the chain head is shared so a fresh worker process does
+        not need a database query, and processes see each other's writes.
+        Without it, the head is cached per process.
+        """
+        if self._redis is not None:
+            try:
+                cached = self._redis.get(self.LAST_HASH_KEY)
+                if cached is not None:
+                    return cached.decode()
+            except Exception as e:
+                logger.warning("audit_redis_get_failed", error=str(e))
+        elif self._last_hash is not None:
             return self._last_hash
 
+        # Unchained records have no hash and are not part of the chain
         result = (
             session.query(AuditLogModel.record_hash)
+            .filter(AuditLogModel.record_hash.isnot(None))
             .order_by(desc(AuditLogModel.timestamp))
             .first()
         )
 
         if result:
-            self._last_hash = result[0]
+            self._set_last_hash(result[0])
             return self._last_hash
         return None
 
+    def _set_last_hash(self, record_hash: Optional[str]) -> None:
+        """Record a new chain head locally and in Redis."""
+        self._last_hash = record_hash
+        if self._redis is None or record_hash is None:
+            return
+
+        try:
+            self._redis.set(self.LAST_HASH_KEY, record_hash, ex=self.LAST_HASH_TTL)
+        except Exception as e:
+            logger.warning("audit_redis_set_failed", error=str(e))
+
+    @contextmanager
+    def _chain_lock(self) -> Iterator[None]:
+        """Hold the cross-process chain lease while extending the chain.
+
+        Writes proceed without the lease if Redis is unreachable; a forked
+        chain is then reported by verify_chain rather than losing records.
+        """
+        lock = None
+        if self._redis is not None:
+            try:
+                lock = self._redis.lock(
+                    self.CHAIN_LOCK_KEY, timeout=self.CHAIN_LOCK_TIMEOUT
+                )
+                if not lock.acquire(blocking_timeout=self.CHAIN_LOCK_TIMEOUT):
+                    lock = None
+                    logger.warning("audit_chain_lock_timeout")
+            except Exception as e:
+                lock = None
+                logger.warning("audit_chain_lock_failed", error=str(e))
+
+        try:
+            yield
+        finally:
+            if lock is not None:
+                try:
+                    lock.release()
+                except Exception as e:
+                    logger.warning("audit_chain_lock_release_failed", error=str(e))
+
     def write(self, record: AuditRecord) -> None:
         """Write a single audit record.
 
         Args:
             record: Audit record to write
         """
-        with session_scope() as session:
-            # Get previous hash for chain
-            previous_hash = self._get_last_hash(session)
-            record.previous_record_hash = previous_hash
+        if not self.verify_on_write:
+            self._clear_hashes(record)
+            with session_scope() as session:
+                session.add(AuditLogModel(**self._record_to_mapping(record)))
+            logger.debug("audit_record_written", event_id=str(record.event_id))
+            return
 
-            # Compute hash for this record
-            record.record_hash = record.compute_hash()
+        with self._chain_lock():
+            with session_scope() as session:
+                # Get previous hash for chain
+                previous_hash = self._get_last_hash(session)
+                record.previous_record_hash = previous_hash
 
-            # Create database model
-            model = AuditLogModel(
-                event_id=record.event_id,
-                timestamp=record.timestamp,
-                event_type=record.event_type.value,
-                severity=record.severity.value,
-                user_id=record.user_id,
-                user_session_id=record.user_session_id,
-                user_ip_address=record.user_ip_address,
-                user_role=record.user_role,
-                user_department=record.user_department,
-                resource_type=record.resource_type,
-                resource_id=record.resource_id,
-                resource_classification=record.resource_classification,
-                resource_tags=record.resource_tags,
-                action=record.action,
-                action_result=record.action_result,
-                action_metadata=record.action_metadata,
-                policy_id=record.policy_id,
-                policy_version=record.policy_version,
-                classification_tier=record.classification_tier,
-                classification_confidence=record.classification_confidence,
-                classification_reasoning=record.classification_reasoning,
-                parent_event_id=record.parent_event_id,
-                lineage_chain=record.lineage_chain,
-                compliance_flags=record.compliance_flags,
-                retention_period_days=record.retention_period_days,
-                previous_record_hash=record.previous_record_hash,
-                record_hash=record.record_hash,
-                signature=record.signature,
-                system_id=record.system_id,
-                system_version=record.system_version,
-            )
+                # Compute hash for this record
+                record.record_hash = record.compute_hash()
+
+                session.add(AuditLogModel(**self._record_to_mapping(record)))
+                self._advance_checkpoint(session, [record])
 
-            session.add(model)
-            self._last_hash = record.record_hash
+            # Publish the new head only once the record is committed
+            self._set_last_hash(record.record_hash)
 
             logger.debug(
                 "audit_record_written",
@@ -116,70 +231,142 @@ class AuditBackend:
         if not records:
             return
 
-        with session_scope() as session:
-            previous_hash = self._get_last_hash(session)
-
+        if not self.verify_on_write:
             for record in records:
-                record.previous_record_hash = previous_hash
-                record.record_hash = record.compute_hash()
-                previous_hash = record.record_hash
-
-                model = AuditLogModel(
-                    event_id=record.event_id,
-                    timestamp=record.timestamp,
-                    event_type=record.event_type.value,
-                    severity=record.severity.value,
-                    user_id=record.user_id,
-                    user_session_id=record.user_session_id,
-                    user_ip_address=record.user_ip_address,
-                    user_role=record.user_role,
-                    user_department=record.user_department,
-                    resource_type=record.resource_type,
-                    resource_id=record.resource_id,
-                    resource_classification=record.resource_classification,
-                    resource_tags=record.resource_tags,
-                    action=record.action,
-                    action_result=record.action_result,
-                    action_metadata=record.action_metadata,
-                    policy_id=record.policy_id,
-                    policy_version=record.policy_version,
-                    classification_tier=record.classification_tier,
-                    classification_confidence=record.classification_confidence,
-                    classification_reasoning=record.classification_reasoning,
-                    parent_event_id=record.parent_event_id,
-                    lineage_chain=record.lineage_chain,
-                    compliance_flags=record.compliance_flags,
-                    retention_period_days=record.retention_period_days,
-                    previous_record_hash=record.previous_record_hash,
-                    record_hash=record.record_hash,
-                    signature=record.signature,
-                    system_id=record.system_id,
-                    system_version=record.system_version,
+                self._clear_hashes(record)
+            with session_scope() as session:
+                self._insert_mappings(
+                    session, [self._record_to_mapping(record) for record in records]
                 )
-                session.add(model)
+            logger.info("audit_batch_written", count=len(records), chained=False)
+            return
+
+        with self._chain_lock():
+            with session_scope() as session:
+                previous_hash = self._get_last_hash(session)
+
+                # Build each mapping once and hash it directly, so enum values are
+                # read a single time per record
+                mappings = []
+                for record in records:
+                    mapping = self._record_to_mapping(record)
+                    mapping["previous_record_hash"] = previous_hash
+                    record_hash = AuditRecord.compute_hash_from_mapping(mapping)
+                    mapping["record_hash"] = record_hash
 
-            self._last_hash = previous_hash
+                    record.previous_record_hash = previous_hash
+                    record.record_hash = record_hash
+                    previous_hash = record_hash
+                    mappings.append(mapping)
+
+                self._insert_mappings(session, mappings)
+                self._advance_checkpoint(session, records)
+
+            self._set_last_hash(previous_hash)
 
             logger.info(
                 "audit_batch_written",
                 count=len(records),
             )
 
+    def _advance_checkpoint(self, session: Session, records: list[AuditRecord]) -> None:
+        """Store a chain checkpoint once CHECKPOINT_INTERVAL records are written."""
+        self._records_since_checkpoint += len(records)
+        if self._records_since_checkpoint < self.CHECKPOINT_INTERVAL:
+            return
+
+        last = records[-1]
+        session.add(
+            AuditCheckpointModel(
+                event_id=last.event_id,
+                timestamp=last.timestamp,
+                record_hash=last.record_hash,
+            )
+        )
+        self._records_since_checkpoint = 0
+
+    @staticmethod
+    def _clear_hashes(record: AuditRecord) -> None:
+        """Leave a record outside the hash chain.
+
+        Used when verify_on_write is disabled: no SHA-256 or chain head
+        lookup per record. The empty hash is stored as NULL, and
+        verify_chain skips such records rather than verifying them.
+        """
+        record.previous_record_hash = None
+        record.record_hash = ""
+
+    def _insert_mappings(
+        self, session: Session, mappings: list[dict[str, Any]]
+    ) -> None:
+        """Insert column mappings, using COPY for very large batches."""
+        if (
+            len(mappings) > self.COPY_THRESHOLD
+            and session.get_bind().dialect.name == "postgresql"
+        ):
+            self._copy_mappings(session, mappings)
+            return
+
+        # ORM bulk INSERT: one multi-row statement per slice instead of a
+        # tracked object and INSERT per record
+        for i in range(0, len(mappings), self.INSERT_BATCH_SIZE):
+            session.execute(
+                insert(AuditLogModel), mappings[i : i + self.INSERT_BATCH_SIZE]
+            )
+
+    def _copy_mappings(self, session: Session, mappings: list[dict[str, Any]]) -> None:
+        """Load column mappings with COPY FROM STDIN.
+
+        COPY skips per-statement parsing and planning, which makes it the
+        fastest path for very large batches such as a compliance replay.
+        Runs on the session's connection, so it commits with the session.
+        """
+        # Every mapping comes from _record_to_mapping, so all share its key
+        # order and each one's values already form a row in column order
+        columns = list(mappings[0])
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            map(_copy_value, mapping.values()) for mapping in mappings
+        )
+        buffer.seek(0)
+
+        statement = (
+            f"COPY {AuditLogModel.__tablename__} ({', '.join(columns)}) "  # nosec B608
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(statement, buffer)
+        finally:
+            cursor.close()
+
     def query(self, query: AuditQuery) -> list[AuditRecord]:
         """Query audit records.
 
+        Queries without a time bound are limited to the last
+        ``DEFAULT_QUERY_WINDOW`` so they only scan recent partitions; pass an
+        explicit ``start_time`` to search further back.
+
         Args:
             query: Query parameters
 
         Returns:
             List of matching audit records
         """
+        start_time = query.start_time
+        if start_time is None and query.end_time is None:
+            start_time = datetime.now(timezone.utc) - self.DEFAULT_QUERY_WINDOW
+            logger.warning(
+                "audit_query_time_range_defaulted",
+                start_time=start_time.isoformat(),
+            )
+
         with session_scope() as session:
             q = session.query(AuditLogModel)
 
             # Apply filters
-            if query.start_time:
-                q = q.filter(AuditLogModel.timestamp >= query.start_time)
+            if start_time:
+                q = q.filter(AuditLogModel.timestamp >= start_time)
             if query.end_time:
                 q = q.filter(AuditLogModel.timestamp <= query.end_time)
             if query.user_id:
@@ -199,6 +386,19 @@ class AuditBackend:
                     AuditLogModel.resource_classification
                     == query.resource_classification
                 )
+            # Array containment (@>) is served by the GIN indexes on these
+            if query.resource_tags:
+                q = q.filter(
+                    AuditLogModel.resource_tags.op("@>")(
+                        cast(array(query.resource_tags), ARRAY(String))
+                    )
+                )
+            if query.compliance_flags:
+                q = q.filter(
+                    AuditLogModel.compliance_flags.op("@>")(
+                        cast(array(query.compliance_flags), ARRAY(String))
+                    )
+                )
 
             # Sorting
             if query.order_desc:
@@ -220,6 +420,14 @@ class AuditBackend:
     ) -> dict[str, Any]:
         """Verify the integrity of the hash chain.
 
+        With a start time, verification begins at the latest checkpoint at or
+        before it, so the first records of the window are linked back to a
+        stored hash rather than trusted as they are.
+
+        Records written with verify_on_write disabled have no hash. They are
+        skipped and counted under ``unchained_records``; the chain links
+        across them.
+
         Args:
             start_time: Start of verification period
             end_time: End of verification period
@@ -228,66 +436,118 @@ class AuditBackend:
             Verification result with details
         """
         with session_scope() as session:
-            q = session.query(AuditLogModel).order_by(AuditLogModel.timestamp)
+            # Only the hashed columns are loaded, streamed in chunks, so no
+            # ORM objects or AuditRecords are built per row
+            q: Query[Any] = session.query(*self._HASH_COLUMNS).order_by(
+                AuditLogModel.timestamp
+            )
 
+            checkpoint: Optional[Row[Any]] = None
             if start_time:
+                checkpoints: Query[Any] = session.query(
+                    AuditCheckpointModel.event_id,
+                    AuditCheckpointModel.timestamp,
+                    AuditCheckpointModel.record_hash,
+                )
+                checkpoint = (
+                    checkpoints.filter(AuditCheckpointModel.timestamp <= start_time)
+                    .order_by(desc(AuditCheckpointModel.timestamp))
+                    .first()
+                )
+                if checkpoint is not None:
+                    start_time = checkpoint.timestamp
                 q = q.filter(AuditLogModel.timestamp >= start_time)
             if end_time:
                 q = q.filter(AuditLogModel.timestamp <= end_time)
 
-            records = q.all()
-
-            if not records:
-                return {
-                    "verified": True,
-                    "records_checked": 0,
-                    "errors": [],
-                    "message": "No records to verify",
-                }
-
             errors = []
             previous_hash = None
+            records_checked = 0
+            unchained_records = 0
+            first_timestamp: Optional[datetime] = None
+            last_timestamp: Optional[datetime] = None
+
+            # stream_results makes psycopg2 use a named server-side cursor, so
+            # memory stays bounded by one batch however large the window is
+            rows = q.execution_options(stream_results=True).yield_per(
+                self.VERIFY_BATCH_SIZE
+            )
+
+            for row in rows:
+                if row.record_hash is None:
+                    unchained_records += 1
+                    continue
+
+                # Check the anchoring record against its checkpoint
+                if (
+                    checkpoint is not None
+                    and row.event_id == checkpoint.event_id
+                    and row.record_hash != checkpoint.record_hash
+                ):
+                    errors.append(
+                        {
+                            "event_id": str(row.event_id),
+                            "timestamp": row.timestamp.isoformat(),
+                            "error": "Checkpoint hash mismatch - chain rewritten",
+                            "expected": checkpoint.record_hash,
+                            "actual": row.record_hash,
+                        }
+                    )
 
-            for i, model in enumerate(records):
                 # Check previous hash linkage
-                if i > 0 and model.previous_record_hash != previous_hash:
+                if records_checked > 0 and row.previous_record_hash != previous_hash:
                     errors.append(
                         {
-                            "event_id": str(model.event_id),
-                            "timestamp": model.timestamp.isoformat(),
+                            "event_id": str(row.event_id),
+                            "timestamp": row.timestamp.isoformat(),
                             "error": "Hash chain broken - previous hash mismatch",
                             "expected": previous_hash,
-                            "actual": model.previous_record_hash,
+                            "actual": row.previous_record_hash,
                         }
                     )
 
                 # Verify record hash
-                record = self._model_to_record(model)
-                expected_hash = record.compute_hash()
-                if expected_hash != model.record_hash:
+                expected_hash = AuditRecord.compute_hash_from_row(row)
+                if expected_hash != row.record_hash:
                     errors.append(
                         {
-                            "event_id": str(model.event_id),
-                            "timestamp": model.timestamp.isoformat(),
+                            "event_id": str(row.event_id),
+                            "timestamp": row.timestamp.isoformat(),
                             "error": "Record hash mismatch - possible tampering",
                             "expected": expected_hash,
-                            "actual": model.record_hash,
+                            "actual": row.record_hash,
                         }
                     )
 
-                previous_hash = model.record_hash
+                previous_hash = row.record_hash
+                if first_timestamp is None:
+                    first_timestamp = row.timestamp
+                last_timestamp = row.timestamp
+                records_checked += 1
+
+            if records_checked == 0:
+                return {
+                    "verified": True,
+                    "records_checked": 0,
+                    "unchained_records": unchained_records,
+                    "errors": [],
+                    "message": "No records to verify",
+                }
 
             return {
                 "verified": len(errors) == 0,
-                "records_checked": len(records),
+                "records_checked": records_checked,
+                "unchained_records": unchained_records,
                 "errors": errors,
                 "message": (
                     "Audit log integrity verified"
                     if not errors
                     else f"Found {len(errors)} integrity errors"
                 ),
-                "first_record": records[0].timestamp.isoformat() if records else None,
-                "last_record": records[-1].timestamp.isoformat() if records else None,
+                "first_record": (
+                    first_timestamp.isoformat() if first_timestamp else None
+                ),
+                "last_record": last_timestamp.isoformat() if last_timestamp else None,
             }
 
     def get_record_count(
@@ -306,6 +566,41 @@ class AuditBackend:
 
             return q.count()
 
+    def _record_to_mapping(self, record: AuditRecord) -> dict[str, Any]:
+        """Convert AuditRecord to a column mapping for AuditLogModel."""
+        return {
+            "event_id": record.event_id,
+            "timestamp": record.timestamp,
+            "event_type": record.event_type.value,
+            "severity": record.severity.value,
+            "user_id": record.user_id,
+            "user_session_id": record.user_session_id,
+            "user_ip_address": record.user_ip_address,
+            "user_role": record.user_role,
+            "user_department": record.user_department,
+            "resource_type": record.resource_type,
+            "resource_id": record.resource_id,
+            "resource_classification": record.resource_classification,
+            "resource_tags": record.resource_tags,
+            "action": record.action,
+            "action_result": record.action_result,
+            "action_metadata": record.action_metadata,
+            "policy_id": record.policy_id,
+            "policy_version": record.policy_version,
+            "classification_tier": record.classification_tier,
+            "classification_confidence": record.classification_confidence,
+            "classification_reasoning": record.classification_reasoning,
+            "parent_event_id": record.parent_event_id,
+            "lineage_chain": record.lineage_chain,
+            "compliance_flags": record.compliance_flags,
+            "retention_period_days": record.retention_period_days,
+            "previous_record_hash": record.previous_record_hash,
+            "record_hash": record.record_hash or None,
+            "signature": record.signature,
+            "system_id": record.system_id,
+            "system_version": record.system_version,
+        }
+
     def _model_to_record(self, model: AuditLogModel) -> AuditRecord:
         """Convert database model to AuditRecord."""
         return AuditRecord(
@@ -335,7 +630,7 @@ class AuditBackend:
             compliance_flags=model.compliance_flags or [],
             retention_period_days=model.retention_period_days,
             previous_record_hash=model.previous_record_hash,
-            record_hash=model.record_hash,
+            record_hash=model.record_hash or "",
             signature=model.signature,
             system_id=model.system_id,
             system_version=model.system_version,
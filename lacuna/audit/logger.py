@@ -1,20 +1,40 @@
 """Audit logger with async batch writing for performance."""
 
+import hashlib
 import threading
+import time
 from datetime import datetime
-from queue import Empty, Queue
+from queue import Empty, SimpleQueue
 from typing import Any, Optional
 
 import structlog
 
 from lacuna.config import get_settings
-from lacuna.models.audit import AuditRecord, EventType, Severity
+from lacuna.models.audit import AuditQuery, AuditRecord, EventType, Severity
 from lacuna.models.classification import Classification
 from lacuna.models.data_operation import DataOperation
 from lacuna.models.policy import PolicyDecision
 
 logger = structlog.get_logger()
 
+# Event types for administrative actions; anything else is a config change
+_ADMIN_EVENT_TYPES = {
+    "policy.create": EventType.ADMIN_POLICY_CREATE,
+    "policy.update": EventType.ADMIN_POLICY_UPDATE,
+    "policy.delete": EventType.ADMIN_POLICY_DELETE,
+    "user.grant": EventType.ADMIN_USER_GRANT,
+    "user.revoke": EventType.ADMIN_USER_REVOKE,
+}
+
+
+def _hash_query(query: str) -> str:
+    """Hash a query for privacy-preserving storage.
+
+    Deliberately not memoized: a cache would keep raw queries in memory,
+    which is exactly what hashing them avoids.
+    """
+    return hashlib.sha256(query.encode()).hexdigest()
+
 
 def get_audit_backend() -> Any:
     """Get the appropriate audit backend based on configuration."""
@@ -42,6 +62,9 @@ class AuditLogger:
     - ISO 27001-compliant record structure
     """
 
+    # Seconds the worker keeps collecting already-queued records into a batch
+    COALESCE_WINDOW = 0.05
+
     def __init__(
         self,
         backend: Optional[Any] = None,
@@ -63,9 +86,8 @@ class AuditLogger:
         self.flush_interval = flush_interval
 
         self._backend = backend or get_audit_backend()
-        self._queue: Queue[AuditRecord] = Queue()
-        self._buffer: list[AuditRecord] = []
-        self._lock = threading.Lock()
+        self._queue: SimpleQueue[AuditRecord] = SimpleQueue()
+        self._write_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
 
@@ -84,35 +106,40 @@ class AuditLogger:
         """Background worker that processes the audit queue."""
         while not self._stop_event.is_set():
             try:
-                # Wait for items with timeout
+                # Block for the first record only
                 try:
-                    record = self._queue.get(timeout=self.flush_interval)
-                    with self._lock:
-                        self._buffer.append(record)
+                    records = [self._queue.get(timeout=self.flush_interval)]
                 except Empty:
-                    pass
+                    continue
+
+                # Coalesce whatever else is already queued into the same batch
+                deadline = time.monotonic() + self.COALESCE_WINDOW
+                while len(records) < self.batch_size and time.monotonic() < deadline:
+                    try:
+                        records.append(self._queue.get_nowait())
+                    except Empty:
+                        break
 
-                # Flush if buffer is full or timeout
-                with self._lock:
-                    if len(self._buffer) >= self.batch_size or (
-                        self._buffer and self._queue.empty()
-                    ):
-                        self._flush_buffer()
+                if not self._write_batch(records):
+                    # Back off instead of retrying the re-queued batch at once
+                    self._stop_event.wait(self.flush_interval)
 
             except Exception as e:
                 logger.error("audit_worker_error", error=str(e))
 
-    def _flush_buffer(self) -> None:
-        """Flush the buffer to storage (must hold lock)."""
-        if not self._buffer:
-            return
-
-        try:
-            self._backend.write_batch(self._buffer)
-            logger.debug("audit_buffer_flushed", count=len(self._buffer))
-            self._buffer = []
-        except Exception as e:
-            logger.error("audit_flush_error", error=str(e), count=len(self._buffer))
+    def _write_batch(self, records: list[AuditRecord]) -> bool:
+        """Write a batch to storage, re-queueing it if the write fails."""
+        # Serializes the worker and flush(); backends chain hashes across writes
+        with self._write_lock:
+            try:
+                self._backend.write_batch(records)
+                logger.debug("audit_buffer_flushed", count=len(records))
+                return True
+            except Exception as e:
+                logger.error("audit_flush_error", error=str(e), count=len(records))
+                for record in records:
+                    self._queue.put(record)
+                return False
 
     def log(self, record: AuditRecord) -> None:
         """Log an audit record asynchronously.
@@ -143,21 +170,24 @@ class AuditLogger:
         Returns:
             Created audit record
         """
+        metadata: dict[str, Any] = {
+            "query_length": len(query),
+            "classifier": classification.classifier_name,
+        }
+        if context:
+            metadata.update(context)
+
         record = AuditRecord(
             event_type=EventType.CLASSIFICATION_AUTO,
             severity=Severity.INFO,
             user_id=user_id,
             resource_type="query",
-            resource_id=self._hash_query(query),
+            resource_id=_hash_query(query),
             resource_classification=classification.tier.value,
             resource_tags=classification.tags,
             action="classify",
             action_result="success",
-            action_metadata={
-                "query_length": len(query),
-                "classifier": classification.classifier_name,
-                **(context or {}),
-            },
+            action_metadata=metadata,
             classification_tier=classification.tier.value,
             classification_confidence=classification.confidence,
             classification_reasoning=classification.reasoning,
@@ -204,7 +234,7 @@ class AuditLogger:
             action_result="success" if allowed else "denied",
             action_metadata={
                 "destination": operation.destination,
-                "sources": operation.sources,
+                "sources": list(operation.sources),
                 "purpose": operation.purpose,
             },
             classification_tier=classification.tier.value if classification else None,
@@ -270,6 +300,59 @@ class AuditLogger:
         self.log(record)
         return record
 
+    def log_cached_evaluation(
+        self,
+        operation: DataOperation,
+        allowed: bool,
+        reasoning: str,
+        evaluation_id: str,
+        cached_evaluation_id: str,
+        classification_tier: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+    ) -> AuditRecord:
+        """Log a policy decision served from the decision cache.
+
+        Args:
+            operation: Data operation being evaluated
+            allowed: Whether the cached decision allows the operation
+            reasoning: Reasoning of the cached decision
+            evaluation_id: ID of this evaluation
+            cached_evaluation_id: ID of the evaluation the decision came from
+            classification_tier: Classification tier of the cached decision
+            tags: Data tags of the cached decision
+
+        Returns:
+            Created audit record
+        """
+        event_type = EventType.POLICY_ALLOW if allowed else EventType.POLICY_DENY
+        severity = Severity.INFO if allowed else Severity.WARNING
+
+        record = AuditRecord(
+            event_type=event_type,
+            severity=severity,
+            user_id=operation.user.user_id if operation.user else "unknown",
+            user_session_id=operation.user.session_id if operation.user else None,
+            user_ip_address=operation.user.ip_address if operation.user else None,
+            user_role=operation.user.user_role if operation.user else None,
+            resource_type=operation.resource_type,
+            resource_id=operation.resource_id,
+            resource_classification=classification_tier,
+            resource_tags=tags or [],
+            action=operation.operation_type.value,
+            action_result="success" if allowed else "denied",
+            action_metadata={
+                "destination": operation.destination,
+                "evaluation_id": evaluation_id,
+                "cached_evaluation_id": cached_evaluation_id,
+            },
+            classification_tier=classification_tier,
+            classification_reasoning=reasoning,
+            metadata={"decision_cache": "hit"},
+        )
+
+        self.log(record)
+        return record
+
     def log_admin_action(
         self,
         action: str,
@@ -290,16 +373,8 @@ class AuditLogger:
         Returns:
             Created audit record
         """
-        event_type_map = {
-            "policy.create": EventType.ADMIN_POLICY_CREATE,
-            "policy.update": EventType.ADMIN_POLICY_UPDATE,
-            "policy.delete": EventType.ADMIN_POLICY_DELETE,
-            "user.grant": EventType.ADMIN_USER_GRANT,
-            "user.revoke": EventType.ADMIN_USER_REVOKE,
-        }
-
         record = AuditRecord(
-            event_type=event_type_map.get(action, EventType.SYSTEM_CONFIG_CHANGE),
+            event_type=_ADMIN_EVENT_TYPES.get(action, EventType.SYSTEM_CONFIG_CHANGE),
             severity=Severity.INFO,
             user_id=user_id,
             resource_type=resource_type,
@@ -317,18 +392,15 @@ class AuditLogger:
         if not self.enabled:
             return
 
-        # Wait for queue to drain
-        while not self._queue.empty():
+        records: list[AuditRecord] = []
+        while True:
             try:
-                record = self._queue.get_nowait()
-                with self._lock:
-                    self._buffer.append(record)
+                records.append(self._queue.get_nowait())
             except Empty:
                 break
 
-        # Flush buffer
-        with self._lock:
-            self._flush_buffer()
+        for start in range(0, len(records), self.batch_size):
+            self._write_batch(records[start : start + self.batch_size])
 
     def stop(self) -> None:
         """Stop the audit logger and flush remaining records."""
@@ -354,26 +426,17 @@ class AuditLogger:
         """
         return self._backend.verify_chain(start_time, end_time)
 
-    def query(self, **kwargs: Any) -> list[AuditRecord]:
+    def query(self, query: AuditQuery) -> list[AuditRecord]:
         """Query audit records.
 
         Args:
-            **kwargs: Query parameters (see AuditQuery)
+            query: Query parameters
 
         Returns:
             List of matching records
         """
-        from lacuna.models.audit import AuditQuery
-
-        query = AuditQuery(**kwargs)
         return self._backend.query(query)
 
-    def _hash_query(self, query: str) -> str:
-        """Hash query for privacy-preserving storage."""
-        import hashlib
-
-        return hashlib.sha256(query.encode()).hexdigest()
-
     def __enter__(self) -> "AuditLogger":
         """Context manager entry."""
         return self
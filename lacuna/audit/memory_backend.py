@@ -1,11 +1,13 @@
 """In-memory audit storage backend for development."""
 
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Optional
 
 import structlog
 
-from lacuna.models.audit import AuditQuery, AuditRecord
+from lacuna.models.audit import AuditQuery, AuditRecord, EventType
 
 logger = structlog.get_logger()
 
@@ -24,16 +26,28 @@ class InMemoryAuditBackend:
         Args:
             verify_on_write: Ignored for in-memory backend
         """
+        # Kept in timestamp order, so queries walk backwards from the newest
         self._records: list[AuditRecord] = []
         self._last_hash: Optional[str] = None
 
+        self._by_event_id: dict[str, AuditRecord] = {}
+
+        # Secondary indexes so equality filters start from a small bucket
+        self._by_user: defaultdict[str, list[AuditRecord]] = defaultdict(list)
+        self._by_resource: defaultdict[str, list[AuditRecord]] = defaultdict(list)
+        self._by_event_type: defaultdict[str, list[AuditRecord]] = defaultdict(list)
+
     def write(self, record: AuditRecord) -> None:
         """Write a single audit record.
 
         Args:
             record: Audit record to write
         """
-        self._records.append(record)
+        self._insert_sorted(self._records, record)
+        self._by_event_id[str(record.event_id)] = record
+        self._insert_sorted(self._by_user[record.user_id], record)
+        self._insert_sorted(self._by_resource[record.resource_id], record)
+        self._insert_sorted(self._by_event_type[record.event_type.value], record)
         self._last_hash = record.record_hash
 
         logger.debug(
@@ -61,30 +75,36 @@ class InMemoryAuditBackend:
         Returns:
             List of matching audit records
         """
-        results = self._records.copy()
-
-        # Apply filters
-        if query.user_id:
-            results = [r for r in results if r.user_id == query.user_id]
-
-        if query.resource_id:
-            results = [r for r in results if r.resource_id == query.resource_id]
-
-        if query.event_types:
-            results = [r for r in results if r.event_type in query.event_types]
-
-        if query.start_time:
-            results = [r for r in results if r.timestamp >= query.start_time]
-
-        if query.end_time:
-            results = [r for r in results if r.timestamp <= query.end_time]
-
-        # Sort by timestamp descending (most recent first)
-        results.sort(key=lambda r: r.timestamp, reverse=True)
+        candidates = self._candidates(
+            query.user_id, query.resource_id, query.event_types
+        )
 
-        # Apply limit
-        if query.limit:
-            results = results[: query.limit]
+        user_id = query.user_id
+        resource_id = query.resource_id
+        event_types = frozenset(query.event_types)
+        tags = set(query.resource_tags)
+        flags = set(query.compliance_flags)
+        start_time = query.start_time
+        end_time = query.end_time
+
+        # Candidates are in timestamp order: walk them newest first, applying
+        # every filter in a single pass, and stop at the limit or start time
+        results: list[AuditRecord] = []
+        for r in reversed(candidates):
+            if end_time is not None and r.timestamp > end_time:
+                continue
+            if start_time is not None and r.timestamp < start_time:
+                break
+            if (
+                (not user_id or r.user_id == user_id)
+                and (not resource_id or r.resource_id == resource_id)
+                and (not event_types or r.event_type in event_types)
+                and (not tags or tags.issubset(r.resource_tags))
+                and (not flags or flags.issubset(r.compliance_flags))
+            ):
+                results.append(r)
+                if len(results) == query.limit:
+                    break
 
         return results
 
@@ -97,10 +117,7 @@ class InMemoryAuditBackend:
         Returns:
             Audit record if found, None otherwise
         """
-        for record in self._records:
-            if record.event_id == event_id:
-                return record
-        return None
+        return self._by_event_id.get(str(event_id))
 
     def count(
         self,
@@ -118,20 +135,53 @@ class InMemoryAuditBackend:
         Returns:
             Count of matching records
         """
-        results = self._records
-
-        if user_id:
-            results = [r for r in results if r.user_id == user_id]
-
-        if start_time:
-            results = [r for r in results if r.timestamp >= start_time]
+        count = 0
+        for r in reversed(self._candidates(user_id)):
+            if start_time is not None and r.timestamp < start_time:
+                break
+            if (not user_id or r.user_id == user_id) and (
+                end_time is None or r.timestamp <= end_time
+            ):
+                count += 1
+        return count
+
+    @staticmethod
+    def _insert_sorted(records: list[AuditRecord], record: AuditRecord) -> None:
+        """Insert a record keeping timestamp order.
+
+        Records nearly always arrive in order, so this is an append; a late
+        record is placed by walking back from the end.
+        """
+        index = len(records)
+        while index > 0 and records[index - 1].timestamp > record.timestamp:
+            index -= 1
+        records.insert(index, record)
 
-        if end_time:
-            results = [r for r in results if r.timestamp <= end_time]
+    def _candidates(
+        self,
+        user_id: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        event_types: Sequence[EventType] = (),
+    ) -> list[AuditRecord]:
+        """Get the smallest indexed bucket that can contain the matches.
 
-        return len(results)
+        The result may hold non-matching records; callers still apply every
+        filter, but only to this bucket instead of the whole store.
+        """
+        buckets = []
+        if user_id:
+            buckets.append(self._by_user.get(user_id, []))
+        if resource_id:
+            buckets.append(self._by_resource.get(resource_id, []))
+        if len(event_types) == 1:
+            buckets.append(self._by_event_type.get(event_types[0].value, []))
+        return min(buckets, key=len, default=self._records)
 
     def clear(self) -> None:
         """Clear all records (for testing)."""
         self._records.clear()
+        self._by_event_id.clear()
+        self._by_user.clear()
+        self._by_resource.clear()
+        self._by_event_type.clear()
         self._last_hash = None
@@ -20,7 +20,7 @@ class APIKeyStore:
 
     _instance: Optional["APIKeyStore"] = None
     _keys: dict[UUID, APIKey]  # id -> APIKey
-    _hash_index: dict[str, UUID]  # key_hash -> id
+    _hash_index: dict[bytes, UUID]  # raw SHA-256 digest of the key -> id
 
     def __new__(cls) -> "APIKeyStore":
         """Singleton pattern."""
@@ -61,7 +61,7 @@ class APIKeyStore:
 
         # Store it
         self._keys[api_key.id] = api_key
-        self._hash_index[key_hash] = api_key.id
+        self._hash_index[bytes.fromhex(key_hash)] = api_key.id
 
         logger.info(
             "api_key_created",
@@ -81,8 +81,7 @@ class APIKeyStore:
         """Get an API key by the raw key value."""
         import hashlib
 
-        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-        key_id = self._hash_index.get(key_hash)
+        key_id = self._hash_index.get(hashlib.sha256(raw_key.encode()).digest())
         if key_id is None:
             return None
         return self._keys.get(key_id)
@@ -120,7 +119,7 @@ class APIKeyStore:
             return False
 
         # Remove from hash index
-        self._hash_index.pop(api_key.key_hash, None)
+        self._hash_index.pop(bytes.fromhex(api_key.key_hash), None)
 
         logger.info("api_key_deleted", key_id=str(key_id))
         return True
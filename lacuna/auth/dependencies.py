@@ -22,16 +22,20 @@ def _extract_user_from_headers(request: Request) -> Optional[AuthenticatedUser]:
     email = request.headers.get(auth_settings.email_header)
     display_name = request.headers.get(auth_settings.name_header)
 
-    # Parse groups (comma-separated)
-    groups_header = request.headers.get(auth_settings.groups_header, "")
-    groups = [g.strip() for g in groups_header.split(",") if g.strip()]
+    # Parse groups (comma-separated), stripping each entry once
+    groups_header = request.headers.get(auth_settings.groups_header)
+    groups = (
+        [g for g in map(str.strip, groups_header.split(",")) if g]
+        if groups_header
+        else []
+    )
 
     # Get client IP
     ip_address = request.client.host if request.client else None
     # Check for forwarded IP
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
-        ip_address = forwarded.split(",")[0].strip()
+        ip_address = forwarded.partition(",")[0].strip()
 
     return AuthenticatedUser(
         user_id=user_id,
@@ -34,13 +34,19 @@ class AuthenticatedUser:
     session_id: Optional[str] = None
     ip_address: Optional[str] = None
 
+    # Memoized admin check, resolved on first access
+    _is_admin: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def is_admin(self) -> bool:
         """Check if user is an admin."""
-        from lacuna.config import get_settings
+        if self._is_admin is None:
+            from lacuna.config import get_settings
 
-        settings = get_settings()
-        return settings.auth.admin_group in self.groups
+            self._is_admin = get_settings().auth.admin_group in self.groups
+        return self._is_admin
 
     @property
     def is_service_account(self) -> bool:
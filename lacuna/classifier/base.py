@@ -32,6 +32,23 @@ class Classifier(ABC):
         """
         pass
 
+    def classify_batch(
+        self, queries: list[str], context: Optional[ClassificationContext] = None
+    ) -> list[Optional[Classification]]:
+        """Classify multiple queries sharing the same context.
+
+        Subclasses that can process a batch more efficiently than one query
+        at a time (e.g. a single model forward pass) should override this.
+
+        Args:
+            queries: Query texts to classify
+            context: Optional context information
+
+        Returns:
+            One result per query, None where the query cannot be classified
+        """
+        return [self.classify(query, context) for query in queries]
+
     @property
     @abstractmethod
     def name(self) -> str:
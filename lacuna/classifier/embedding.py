@@ -1,5 +1,7 @@
 """Embedding-based classifier using semantic similarity."""
 
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
@@ -20,6 +22,9 @@ class EmbeddingClassifier(Classifier):
     8% of queries with ~10ms latency using semantic similarity matching.
     """
 
+    # Normalized query embeddings kept for repeated queries, skipping the encoder
+    EMBEDDING_CACHE_SIZE = 1024
+
     def __init__(
         self,
         model_name: Optional[str] = None,
@@ -44,6 +49,15 @@ class EmbeddingClassifier(Classifier):
         self.examples_by_tier = examples_by_tier or self._default_examples()
         self.example_embeddings: dict[DataTier, np.ndarray] = {}
 
+        # Centroids stacked as a (tiers, dim) matrix, rows in _tier_order
+        self._centroid_matrix: Optional[np.ndarray] = None
+        self._tier_order: list[DataTier] = []
+
+        # query -> unit-length embedding, LRU order. Guarded by a lock as the
+        # API classifies from worker threads.
+        self._embed_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._embed_cache_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         """Get classifier name."""
@@ -88,11 +102,23 @@ class EmbeddingClassifier(Classifier):
                 self.model_name, device=settings.classification.embedding_device
             )
 
-            # Precompute example embeddings
+            # Precompute example embeddings in one encoder pass for all tiers
+            all_examples: list[str] = []
+            offsets: list[tuple[DataTier, int, int]] = []
             for tier, examples in self.examples_by_tier.items():
-                embeddings = self.model.encode(examples, convert_to_numpy=True)  # type: ignore[attr-defined]
-                # Average embeddings for this tier
-                self.example_embeddings[tier] = np.mean(embeddings, axis=0)
+                start = len(all_examples)
+                all_examples.extend(examples)
+                offsets.append((tier, start, len(all_examples)))
+
+            embeddings = self.model.encode(  # type: ignore[attr-defined]
+                all_examples, convert_to_numpy=True
+            )
+            for tier, start, end in offsets:
+                # Average embeddings for this tier, stored at unit length
+                self.example_embeddings[tier] = self._normalize(
+                    np.mean(embeddings[start:end], axis=0)
+                )
+            self._stack_centroids()
 
         except ImportError as err:
             raise ImportError(
@@ -115,30 +141,103 @@ class EmbeddingClassifier(Classifier):
         # Load model lazily
         self._load_model()
 
-        if self.model is None:
+        if self.model is None or self._centroid_matrix is None:
             return None
 
-        # Encode query
-        query_embedding = self.model.encode([query], convert_to_numpy=True)[0]
+        query_embedding = self._cached_embedding(query)
+        if query_embedding is None:
+            query_embedding = self._normalize(
+                self.model.encode([query], convert_to_numpy=True)[0]
+            )
+            self._cache_embedding(query, query_embedding)
+
+        similarities = self._centroid_matrix @ query_embedding
+        return self._classify_similarities(similarities)
+
+    def _cached_embedding(self, query: str) -> Optional[np.ndarray]:
+        """Get a cached unit-length query embedding.
+
+        The embedding depends only on the model, so cached entries stay valid
+        when examples are added; only the centroids they are scored against
+        change.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Cached embedding, or None on miss
+        """
+        with self._embed_cache_lock:
+            embedding = self._embed_cache.get(query)
+            if embedding is not None:
+                self._embed_cache.move_to_end(query)
+            return embedding
+
+    def _cache_embedding(self, query: str, embedding: np.ndarray) -> None:
+        """Store a query embedding, evicting the least recently used entry.
+
+        Args:
+            query: Query text
+            embedding: Unit-length query embedding
+        """
+        with self._embed_cache_lock:
+            self._embed_cache[query] = embedding
+            self._embed_cache.move_to_end(query)
+            while len(self._embed_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+
+    def classify_batch(
+        self, queries: list[str], context: Optional[ClassificationContext] = None
+    ) -> list[Optional[Classification]]:
+        """Classify multiple queries with a single encoder pass.
+
+        Args:
+            queries: Query texts to classify
+            context: Optional context information
+
+        Returns:
+            One result per query, None where the threshold is not met
+        """
+        # Load model lazily
+        self._load_model()
 
-        # Compute similarity to each tier
-        similarities = {}
-        for tier, tier_embedding in self.example_embeddings.items():
-            # Cosine similarity
-            similarity = self._cosine_similarity(query_embedding, tier_embedding)
-            similarities[tier] = similarity
+        if self.model is None or self._centroid_matrix is None or not queries:
+            return [None] * len(queries)
+
+        query_embeddings = self.model.encode(queries, convert_to_numpy=True)
+
+        # One matrix product scores every query against every tier
+        norms = np.linalg.norm(query_embeddings, axis=1, keepdims=True)
+        query_embeddings = query_embeddings / np.where(norms == 0, 1, norms)
+        similarities = query_embeddings @ self._centroid_matrix.T
+
+        return [self._classify_similarities(row) for row in similarities]
+
+    def _classify_similarities(
+        self, similarities: np.ndarray
+    ) -> Optional[Classification]:
+        """Classify a query from its similarity to each tier centroid.
 
+        Args:
+            similarities: Cosine similarity per tier, in _tier_order
+
+        Returns:
+            Classification if similarity threshold met, None otherwise
+        """
         # Find best match
-        best_tier = max(similarities, key=lambda t: similarities[t])
-        best_similarity = similarities[best_tier]
+        best_index = int(np.argmax(similarities))
+        best_tier = self._tier_order[best_index]
+        best_similarity = float(similarities[best_index])
 
         # Check if above threshold
         if best_similarity < self.threshold:
             return None
 
         # Calculate confidence based on similarity and margin
-        sorted_sims = sorted(similarities.values(), reverse=True)
-        margin = sorted_sims[0] - sorted_sims[1] if len(sorted_sims) > 1 else 0.1
+        if len(similarities) > 1:
+            margin = best_similarity - float(np.partition(similarities, -2)[-2])
+        else:
+            margin = 0.1
         confidence = min(0.95, best_similarity + margin * 0.5)
 
         return Classification(
@@ -154,30 +253,38 @@ class EmbeddingClassifier(Classifier):
             classifier_version="1.0.0",
             metadata={
                 "similarities": {
-                    tier.value: float(sim) for tier, sim in similarities.items()
+                    tier.value: float(sim)
+                    for tier, sim in zip(self._tier_order, similarities)
                 },
                 "model": self.model_name,
             },
         )
 
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Compute cosine similarity between two vectors.
+    def _stack_centroids(self) -> None:
+        """Stack the unit-length tier centroids into one float32 matrix.
+
+        float32 keeps scoring on single-precision BLAS; NumPy has no BLAS
+        kernels for float16, so a half-precision matrix would be slower.
+        """
+        self._tier_order = list(self.example_embeddings)
+        self._centroid_matrix = np.stack(
+            [self.example_embeddings[tier] for tier in self._tier_order]
+        ).astype(np.float32, copy=False)
+
+    @staticmethod
+    def _normalize(vec: np.ndarray) -> np.ndarray:
+        """Scale a vector to unit length (zero vectors are returned as is).
 
         Args:
-            vec1: First vector
-            vec2: Second vector
+            vec: Vector to normalize
 
         Returns:
-            Cosine similarity (0.0 to 1.0)
+            Unit-length vector
         """
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return float(dot_product / (norm1 * norm2))
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return vec
+        return vec / norm
 
     def add_examples(self, tier: DataTier, examples: list[str]) -> None:
         """Add training examples for a tier.
@@ -196,4 +303,5 @@ class EmbeddingClassifier(Classifier):
             embeddings = self.model.encode(
                 self.examples_by_tier[tier], convert_to_numpy=True
             )
-            self.example_embeddings[tier] = np.mean(embeddings, axis=0)
+            self.example_embeddings[tier] = self._normalize(np.mean(embeddings, axis=0))
+            self._stack_centroids()
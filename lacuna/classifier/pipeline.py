@@ -1,6 +1,8 @@
 """Classification pipeline orchestrating multiple classifiers."""
 
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 
 import structlog
@@ -63,9 +65,14 @@ class ClassificationPipeline:
         # Sort by priority (lower = earlier)
         self.classifiers.sort(key=lambda c: c.priority)
 
-        # Cache for query classifications (in-memory)
-        self._cache: dict = {}
+        # LRU cache for query classifications (in-memory), entries expire
+        # after cache_ttl seconds. Guarded by a lock as the API classifies
+        # from worker threads.
+        self._cache: OrderedDict[str, tuple[Classification, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._cache_enabled = True
+        self._cache_max_size = self.settings.classification.cache_max_size
+        self._cache_ttl = self.settings.classification.cache_ttl
 
     def _init_default_classifiers(self) -> list[Classifier]:
         """Initialize default classifier stack.
@@ -124,8 +131,8 @@ class ClassificationPipeline:
 
         # Check cache
         cache_key = self._make_cache_key(query, context)
-        if self._cache_enabled and cache_key in self._cache:
-            cached = self._cache[cache_key]
+        cached = self._cache_get(cache_key) if self._cache_enabled else None
+        if cached is not None:
             logger.debug(
                 "classification_cache_hit",
                 query=query[:100],
@@ -170,7 +177,7 @@ class ClassificationPipeline:
 
                         # Cache result
                         if self._cache_enabled:
-                            self._cache[cache_key] = result
+                            self._cache_put(cache_key, result)
 
                         return result
 
@@ -201,20 +208,12 @@ class ClassificationPipeline:
 
             # Cache result
             if self._cache_enabled:
-                self._cache[cache_key] = best_result
+                self._cache_put(cache_key, best_result)
 
             return best_result
         else:
             # All classifiers failed - use conservative default
-            default_result = Classification(
-                tier=self.default_tier,
-                confidence=0.5,
-                reasoning="No classifiers matched - using conservative default",
-                matched_rules=["default_fallback"],
-                tags=[],
-                classifier_name="DefaultFallback",
-                classifier_version="1.0.0",
-            )
+            default_result = self._default_classification()
 
             elapsed_ms = (time.time() - start_time) * 1000
             logger.warning(
@@ -227,6 +226,145 @@ class ClassificationPipeline:
             # Don't cache fallback results
             return default_result
 
+    def classify_batch(
+        self,
+        queries: list[str],
+        context: Optional[ClassificationContext] = None,
+    ) -> list[Classification]:
+        """Classify multiple queries sharing the same context.
+
+        Each classifier layer receives all still-unresolved queries in one
+        ``classify_batch`` call, so classifiers backed by a model can encode
+        the whole batch at once. Duplicate queries are classified once and
+        the result is reused.
+
+        Args:
+            queries: Query texts to classify
+            context: Optional context applied to every query
+
+        Returns:
+            Classification results in the same order as ``queries``
+        """
+        start_time = time.time()
+
+        resolved: dict[str, Classification] = {}
+        candidates: dict[str, list[Classification]] = {}
+        pending: list[str] = []
+
+        # Check cache
+        for query in dict.fromkeys(queries):
+            cache_key = self._make_cache_key(query, context)
+            cached = self._cache_get(cache_key) if self._cache_enabled else None
+            if cached is not None:
+                resolved[query] = cached
+            else:
+                candidates[query] = []
+                pending.append(query)
+
+        # Run classifiers in priority order over unresolved queries
+        for classifier in self.classifiers:
+            if not pending:
+                break
+
+            results = self._classify_layer(classifier, pending, context)
+
+            still_pending = []
+            for query, result in zip(pending, results):
+                if result is not None:
+                    candidates[query].append(result)
+
+                    # Short-circuit on high confidence
+                    if (
+                        self.short_circuit
+                        and result.confidence >= self.confidence_threshold
+                    ):
+                        resolved[query] = result
+                        continue
+
+                still_pending.append(query)
+            pending = still_pending
+
+        # No high-confidence result, use best available or default
+        for query in pending:
+            if candidates[query]:
+                resolved[query] = max(candidates[query], key=lambda r: r.confidence)
+            else:
+                resolved[query] = self._default_classification()
+
+        # Cache results (fallback results are not cached)
+        if self._cache_enabled:
+            for query, query_candidates in candidates.items():
+                if query_candidates:
+                    cache_key = self._make_cache_key(query, context)
+                    self._cache_put(cache_key, resolved[query])
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info(
+            "classification_batch_complete",
+            queries=len(queries),
+            unique=len(resolved),
+            classified=len(candidates),
+            fallbacks=sum(1 for found in candidates.values() if not found),
+            latency_ms=round(elapsed_ms, 2),
+        )
+
+        return [resolved[query] for query in queries]
+
+    def _classify_layer(
+        self,
+        classifier: Classifier,
+        queries: list[str],
+        context: Optional[ClassificationContext],
+    ) -> list[Optional[Classification]]:
+        """Run one classifier over a batch of queries.
+
+        If the batch call fails, queries are retried one at a time so a
+        single bad query only loses its own result.
+
+        Args:
+            classifier: Classifier to run
+            queries: Query texts to classify
+            context: Optional context information
+
+        Returns:
+            One result per query, None where the classifier did not match
+        """
+        try:
+            return classifier.classify_batch(queries, context)
+        except Exception as e:
+            logger.error(
+                "classifier_batch_error",
+                classifier=classifier.name,
+                error=str(e),
+                batch_size=len(queries),
+            )
+
+        results: list[Optional[Classification]] = []
+        for query in queries:
+            try:
+                results.append(classifier.classify(query, context))
+            except Exception as e:
+                logger.error(
+                    "classifier_error",
+                    classifier=classifier.name,
+                    error=str(e),
+                    query=query[:100],
+                )
+                results.append(None)
+        return results
+
+    def _default_classification(self) -> Classification:
+        """Build the conservative result used when no classifier matched."""
+        return Classification(
+            tier=self.default_tier,
+            confidence=0.5,
+            reasoning="No classifiers matched - using conservative default",
+            matched_rules=["default_fallback"],
+            tags=[],
+            classifier_name="DefaultFallback",
+            classifier_version="1.0.0",
+        )
+
     def _make_cache_key(
         self, query: str, context: Optional[ClassificationContext]
     ) -> str:
@@ -251,6 +389,41 @@ class ClassificationPipeline:
 
         return "|".join(key_parts)
 
+    def _cache_get(self, cache_key: str) -> Optional[Classification]:
+        """Look up a cached classification, evicting it if expired.
+
+        Args:
+            cache_key: Cache key from _make_cache_key
+
+        Returns:
+            Cached classification, or None on miss or expiry
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+
+            classification, stored_at = entry
+            if time.monotonic() - stored_at > self._cache_ttl:
+                del self._cache[cache_key]
+                return None
+
+            self._cache.move_to_end(cache_key)
+            return classification
+
+    def _cache_put(self, cache_key: str, classification: Classification) -> None:
+        """Store a classification, evicting the least recently used entry.
+
+        Args:
+            cache_key: Cache key from _make_cache_key
+            classification: Classification to cache
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = (classification, time.monotonic())
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._cache_max_size:
+                self._cache.popitem(last=False)
+
     def add_classifier(self, classifier: Classifier) -> None:
         """Add a classifier to the pipeline.
 
@@ -275,7 +448,8 @@ class ClassificationPipeline:
 
     def clear_cache(self) -> None:
         """Clear the classification cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
         logger.info("classification_cache_cleared")
 
     def get_stats(self) -> dict:
@@ -289,6 +463,8 @@ class ClassificationPipeline:
                 {"name": c.name, "priority": c.priority} for c in self.classifiers
             ],
             "cache_size": len(self._cache),
+            "cache_max_size": self._cache_max_size,
+            "cache_ttl": self._cache_ttl,
             "cache_enabled": self._cache_enabled,
             "confidence_threshold": self.confidence_threshold,
             "short_circuit": self.short_circuit,
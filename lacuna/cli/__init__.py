@@ -284,6 +284,39 @@ def audit_query(
         logger.stop()
 
 
+@audit.command("partitions")
+@click.option(
+    "--months-ahead", "-m", default=3, help="Future months to create partitions for"
+)
+@click.option(
+    "--drop-expired", is_flag=True, help="Drop partitions past the retention period"
+)
+def audit_partitions(months_ahead: int, drop_expired: bool) -> None:
+    """Maintain monthly audit log partitions (PostgreSQL only).
+
+    Run this regularly, e.g. daily, so each month's partition exists
+    before its records arrive.
+
+    Example:
+        lacuna audit partitions --months-ahead 3 --drop-expired
+    """
+    from lacuna.db.partitions import (
+        drop_expired_audit_partitions,
+        ensure_audit_partitions,
+    )
+
+    try:
+        created = ensure_audit_partitions(months_ahead=months_ahead)
+        click.echo(f"Partitions ready: {', '.join(created) or 'none'}")
+
+        if drop_expired:
+            dropped = drop_expired_audit_partitions()
+            click.echo(f"Partitions dropped: {', '.join(dropped) or 'none'}")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.group()
 def lineage() -> None:
     """Lineage tracking commands."""
@@ -342,10 +375,6 @@ def lineage_impact(artifact_id: str, json_output: bool) -> None:
         analysis = tracker.get_impact_analysis(artifact_id)
 
         if json_output:
-            # Convert int keys to strings for JSON
-            analysis["by_depth"] = {
-                str(k): v for k, v in analysis.get("by_depth", {}).items()
-            }
             click.echo(json.dumps(analysis, indent=2))
         else:
             click.echo(f"\n⚡ Impact Analysis for: {artifact_id}")
@@ -431,7 +460,7 @@ def dev(host: str, port: int, reload: bool) -> None:
     click.echo("✓ Database initialized")
 
     uvicorn.run(
-        "lacuna.api.app:app",
+        "lacuna.api.asgi:app",
         host=host,
         port=port,
         reload=reload,
@@ -443,11 +472,22 @@ def dev(host: str, port: int, reload: bool) -> None:
 @click.option("--host", "-h", default="0.0.0.0", help="Host to bind to")  # nosec B104
 @click.option("--port", "-p", default=8000, help="Port to bind to")
 @click.option("--reload/--no-reload", default=False, help="Enable auto-reload")
-def serve(host: str, port: int, reload: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    envvar="WEB_CONCURRENCY",
+    help="Number of worker processes",
+)
+@click.option("--access-log/--no-access-log", default=False, help="Log every request")
+def serve(host: str, port: int, reload: bool, workers: int, access_log: bool) -> None:
     """Start the Lacuna API server.
 
+    uvicorn picks uvloop and httptools automatically when they are installed
+    (they ship with uvicorn[standard]).
+
     Example:
-        lacuna serve --port 8000
+        lacuna serve --port 8000 --workers 4
     """
     import uvicorn
 
@@ -455,10 +495,12 @@ def serve(host: str, port: int, reload: bool) -> None:
     click.echo(f"   Documentation: http://{host}:{port}/docs")
 
     uvicorn.run(
-        "lacuna.api.app:app",
+        "lacuna.api.asgi:app",
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,
+        access_log=access_log,
         log_level="info",
     )
 
@@ -17,6 +17,16 @@ class DatabaseSettings(BaseSettings):
     )
     pool_size: int = Field(default=20, description="Connection pool size")
     max_overflow: int = Field(default=10, description="Max overflow connections")
+    pool_timeout: float = Field(
+        default=30.0, description="Seconds to wait for a pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        description="Seconds before a pooled connection is replaced (-1 disables)",
+    )
+    pool_warmup: bool = Field(
+        default=True, description="Open pooled connections at API startup"
+    )
     echo: bool = Field(default=False, description="Echo SQL queries")
 
 
@@ -43,6 +53,12 @@ class ClassificationSettings(BaseSettings):
     short_circuit: bool = Field(
         default=True, description="Stop at first high-confidence result"
     )
+    cache_max_size: int = Field(
+        default=1024, description="Maximum number of cached classifications"
+    )
+    cache_ttl: int = Field(
+        default=300, description="Classification cache TTL in seconds"
+    )
 
     # Heuristic layer
     heuristic_enabled: bool = True
@@ -71,6 +87,16 @@ class LineageSettings(BaseSettings):
         default=1.0, description="Sampling rate for lineage (0.0 to 1.0)"
     )
     max_depth: int = Field(default=10, description="Maximum lineage depth to track")
+    max_relations: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum related artifacts returned by a lineage traversal",
+    )
+    bloom_capacity: int = Field(
+        default=1_000_000,
+        ge=1,
+        description="Expected artifact count for the lineage Bloom filter",
+    )
 
 
 class AuditSettings(BaseSettings):
@@ -79,7 +105,8 @@ class AuditSettings(BaseSettings):
     enabled: bool = Field(default=True, description="Enable audit logging")
     retention_days: int = Field(default=2555, description="Retention period (7 years)")
     verify_integrity: bool = Field(
-        default=True, description="Verify hash chain integrity"
+        default=True,
+        description="Hash-chain records on write; if disabled they cannot be verified",
     )
     alert_enabled: bool = Field(default=True, description="Enable real-time alerting")
 
@@ -93,6 +120,12 @@ class PolicySettings(BaseSettings):
         default="lacuna/classification", description="OPA policy path"
     )
     opa_timeout: float = Field(default=1.0, description="OPA request timeout")
+    decision_cache_size: int = Field(
+        default=10_000, description="Maximum number of cached evaluation decisions"
+    )
+    decision_cache_ttl: int = Field(
+        default=60, description="Evaluation decision cache TTL in seconds"
+    )
 
 
 class MonitoringSettings(BaseSettings):
@@ -1,7 +1,8 @@
 """Database layer for Lacuna."""
 
-from lacuna.db.base import Base, get_engine, get_session, init_db
+from lacuna.db.base import Base, get_engine, get_session, init_db, warm_pool
 from lacuna.db.models import (
+    AuditCheckpointModel,
     AuditLogModel,
     ClassificationModel,
     LineageEdgeModel,
@@ -13,6 +14,8 @@ __all__ = [
     "get_engine",
     "get_session",
     "init_db",
+    "warm_pool",
+    "AuditCheckpointModel",
     "AuditLogModel",
     "ClassificationModel",
     "LineageEdgeModel",
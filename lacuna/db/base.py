@@ -37,12 +37,44 @@ def get_engine() -> Engine:
                 db_url,
                 pool_size=settings.database.pool_size,
                 max_overflow=settings.database.max_overflow,
+                pool_timeout=settings.database.pool_timeout,
+                pool_recycle=settings.database.pool_recycle,
                 echo=settings.database.echo,
                 pool_pre_ping=True,  # Verify connections before using
             )
     return _engine
 
 
+def warm_pool(size: Optional[int] = None) -> int:
+    """Open pooled connections ahead of the first requests.
+
+    Checks out ``size`` connections at once and returns them to the pool, so
+    the first burst of requests does not pay for connection setup.
+
+    Args:
+        size: Connections to open (defaults to the configured pool size)
+
+    Returns:
+        Number of connections opened
+    """
+    engine = get_engine()
+    if engine.dialect.name == "sqlite":
+        return 0
+
+    if size is None:
+        size = get_settings().database.pool_size
+
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+    return len(connections)
+
+
 def get_session_factory() -> sessionmaker:
     """Get or create session factory."""
     global _SessionLocal
@@ -76,11 +108,16 @@ def session_scope() -> Generator[Session, None, None]:
 def init_db() -> None:
     """Initialize database schema."""
     from lacuna.db.models import (  # noqa: F401
+        AuditCheckpointModel,
         AuditLogModel,
         ClassificationModel,
         LineageEdgeModel,
         PolicyEvaluationModel,
     )
+    from lacuna.db.partitions import ensure_audit_default_partition
 
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+
+    # Monthly partitions are created by `lacuna audit partitions`, not here
+    ensure_audit_default_partition()
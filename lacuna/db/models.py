@@ -134,9 +134,12 @@ class AuditLogModel(Base):
 
     __tablename__ = "audit_log"
 
-    # Core identity
+    # Core identity. On PostgreSQL the table is range-partitioned by month on
+    # timestamp, which therefore has to be part of the primary key.
     event_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    timestamp = Column(DateTime, nullable=False, default=_utc_now, index=True)
+    timestamp = Column(
+        DateTime, primary_key=True, nullable=False, default=_utc_now, index=True
+    )
     event_type = Column(String(50), nullable=False, index=True)
     severity = Column(String(20), nullable=False, index=True)
 
@@ -165,8 +168,9 @@ class AuditLogModel(Base):
     classification_confidence = Column(Float)
     classification_reasoning = Column(Text)
 
-    # Lineage/Provenance
-    parent_event_id = Column(UUID(as_uuid=True), ForeignKey("audit_log.event_id"))
+    # Lineage/Provenance. Not a foreign key: partitioned tables can only be
+    # referenced through the full (event_id, timestamp) primary key.
+    parent_event_id = Column(UUID(as_uuid=True))
     lineage_chain: Column[list[str]] = Column(StringList(), default=list)
 
     # Compliance metadata
@@ -175,7 +179,7 @@ class AuditLogModel(Base):
 
     # Tamper detection (hash chain)
     previous_record_hash = Column(String(64))
-    record_hash = Column(String(64), nullable=False)
+    record_hash = Column(String(64))  # NULL for records outside the chain
     signature = Column(Text)
 
     # System context
@@ -183,7 +187,11 @@ class AuditLogModel(Base):
     system_version = Column(String(50))
 
     # Relationships
-    parent_event = relationship("AuditLogModel", remote_side=[event_id])
+    parent_event = relationship(
+        "AuditLogModel",
+        primaryjoin="foreign(AuditLogModel.parent_event_id) == AuditLogModel.event_id",
+        remote_side=[event_id],
+    )
 
     __table_args__ = (
         Index("idx_audit_timestamp", "timestamp"),
@@ -194,9 +202,40 @@ class AuditLogModel(Base):
         ),
         Index("idx_audit_event_type", "event_type", "timestamp"),
         Index("idx_audit_action_result", "action_result", "timestamp"),
+        Index("idx_audit_severity_timestamp", "severity", "timestamp"),
+        # GIN indexes for tag and compliance flag containment filters
+        Index("idx_audit_tags_gin", "resource_tags", postgresql_using="gin"),
+        Index(
+            "idx_audit_compliance_flags_gin",
+            "compliance_flags",
+            postgresql_using="gin",
+        ),
+        # Covering index for the latest record hash lookup
+        Index(
+            "idx_audit_timestamp_desc_hash",
+            timestamp.desc(),
+            postgresql_include=["record_hash"],
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
 
+class AuditCheckpointModel(Base):
+    """Periodic snapshot of the audit hash chain.
+
+    Lets verification of a recent window start from a trusted hash near the
+    window instead of re-hashing the log from its beginning.
+    """
+
+    __tablename__ = "audit_checkpoints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(UUID(as_uuid=True), nullable=False)
+    timestamp = Column(DateTime, nullable=False, index=True)
+    record_hash = Column(String(64), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=_utc_now)
+
+
 class PolicyEvaluationModel(Base):
     """Database model for policy evaluation records."""
 
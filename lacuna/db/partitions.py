@@ -0,0 +1,207 @@
+"""Monthly range partitions for the audit log on PostgreSQL."""
+
+from datetime import date, timedelta
+from typing import Optional
+
+import structlog
+from sqlalchemy import Connection, text
+
+from lacuna.config import get_settings
+from lacuna.db.base import get_engine
+
+logger = structlog.get_logger()
+
+AUDIT_TABLE = "audit_log"
+AUDIT_DEFAULT_PARTITION = f"{AUDIT_TABLE}_default"
+
+
+def month_start(day: date) -> date:
+    """Get the first day of the month containing a date."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift the first day of a month by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def audit_partition_name(month: date) -> str:
+    """Get the partition table name for a month, e.g. ``audit_log_2026_10``."""
+    return f"{AUDIT_TABLE}_{month:%Y_%m}"
+
+
+def ensure_audit_default_partition() -> None:
+    """Create the default audit partition, which catches every record.
+
+    Safe to run at startup: it never creates monthly partitions, so it
+    cannot collide with rows already held by the default partition.
+    """
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {AUDIT_DEFAULT_PARTITION} "  # nosec B608
+                f"PARTITION OF {AUDIT_TABLE} DEFAULT"
+            )
+        )
+
+
+def ensure_audit_partitions(
+    months_ahead: int = 3, today: Optional[date] = None
+) -> list[str]:
+    """Create audit log partitions for the current and upcoming months.
+
+    Rows outside every monthly partition land in the default partition, so
+    partitions should exist before their month starts; run this regularly
+    (e.g. daily) from a scheduled job. If a run was missed and the default
+    partition already holds rows for a new month, those rows are moved into
+    the month's partition in the same transaction.
+
+    Args:
+        months_ahead: Number of future months to create partitions for
+        today: Reference date (defaults to today)
+
+    Returns:
+        Names of the monthly partitions that now exist
+    """
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        return []
+
+    ensure_audit_default_partition()
+
+    month = month_start(today or date.today())
+    names = []
+
+    with engine.begin() as connection:
+        for _ in range(months_ahead + 1):
+            name = audit_partition_name(month)
+            upper = add_months(month, 1)
+            exists = connection.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+            ).scalar()
+            if not exists:
+                _create_audit_partition(connection, name, month, upper)
+            names.append(name)
+            month = upper
+
+    logger.info("audit_partitions_ensured", partitions=names)
+    return names
+
+
+def _create_audit_partition(
+    connection: Connection, name: str, lower: date, upper: date
+) -> None:
+    """Create a monthly partition, moving its rows out of the default one.
+
+    PostgreSQL refuses to create a partition while the default partition
+    holds rows in its range, so the default is detached, its rows for the
+    month are moved, and it is attached again. Runs inside the caller's
+    transaction, so concurrent writers wait rather than see a missing
+    default partition.
+    """
+    bounds = {"lower": lower, "upper": upper}
+    in_range = "timestamp >= :lower AND timestamp < :upper"
+    stranded = (
+        connection.execute(
+            text(
+                f"SELECT 1 FROM {AUDIT_DEFAULT_PARTITION} "  # nosec B608
+                f"WHERE {in_range} LIMIT 1"
+            ),
+            bounds,
+        ).first()
+        is not None
+    )
+
+    if stranded:
+        connection.execute(
+            text(
+                f"ALTER TABLE {AUDIT_TABLE} "  # nosec B608
+                f"DETACH PARTITION {AUDIT_DEFAULT_PARTITION}"
+            )
+        )
+
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} PARTITION OF {AUDIT_TABLE} "  # nosec B608
+            f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+    )
+
+    if stranded:
+        moved = connection.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {AUDIT_DEFAULT_PARTITION} "  # nosec B608
+                f"WHERE {in_range} RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds,
+        ).rowcount
+        connection.execute(
+            text(
+                f"ALTER TABLE {AUDIT_TABLE} "  # nosec B608
+                f"ATTACH PARTITION {AUDIT_DEFAULT_PARTITION} DEFAULT"
+            )
+        )
+        logger.warning("audit_default_partition_rows_moved", partition=name, rows=moved)
+
+
+def drop_expired_audit_partitions(
+    retention_days: Optional[int] = None, today: Optional[date] = None
+) -> list[str]:
+    """Drop monthly audit partitions whose records are all past retention.
+
+    A partition is dropped only when its whole month ends before the
+    retention cutoff, which removes expired records without a bulk DELETE.
+
+    Args:
+        retention_days: Retention period (defaults to audit.retention_days)
+        today: Reference date (defaults to today)
+
+    Returns:
+        Names of the dropped partitions
+    """
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        return []
+
+    if retention_days is None:
+        retention_days = get_settings().audit.retention_days
+    cutoff = (today or date.today()) - timedelta(days=retention_days)
+
+    dropped = []
+    with engine.begin() as connection:
+        partitions = connection.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": AUDIT_TABLE},
+        ).scalars()
+
+        for name in partitions:
+            month = _partition_month(name)
+            if month is None or add_months(month, 1) > cutoff:
+                continue
+            connection.execute(text(f"DROP TABLE {name}"))  # nosec B608
+            dropped.append(name)
+
+    if dropped:
+        logger.info("audit_partitions_dropped", partitions=dropped)
+    return dropped
+
+
+def _partition_month(name: str) -> Optional[date]:
+    """Parse the month from a monthly partition name, or None if not one."""
+    prefix = f"{AUDIT_TABLE}_"
+    try:
+        year, month = name[len(prefix) :].split("_")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        return None
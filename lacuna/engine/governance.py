@@ -180,6 +180,29 @@ class GovernanceEngine:
 
         return classification
 
+    def classify_batch(
+        self,
+        queries: list[str],
+        context: Optional[ClassificationContext] = None,
+    ) -> list[Classification]:
+        """Classify multiple queries or texts in one call.
+
+        Args:
+            queries: Texts to classify
+            context: Classification context shared by all queries
+
+        Returns:
+            Classification results in the same order as ``queries``
+        """
+        classifications = self._classifier.classify_batch(queries, context)
+
+        # Log classifications
+        user_id = context.user_id if context and context.user_id else "anonymous"
+        for query, classification in zip(queries, classifications):
+            self._audit_logger.log_classification(classification, query, user_id)
+
+        return classifications
+
     def evaluate_query(
         self,
         query: str,
@@ -236,7 +259,32 @@ class GovernanceEngine:
         Returns:
             Governance result with policy decision
         """
-        operation = DataOperation(
+        operation = self.export_operation(source, destination, user_id, purpose)
+
+        # Classify the source data
+        context = ClassificationContext(user_id=user_id)
+
+        return self.evaluate_operation(operation, context)
+
+    def export_operation(
+        self,
+        source: str,
+        destination: str,
+        user_id: str,
+        purpose: Optional[str] = None,
+    ) -> DataOperation:
+        """Build the data operation for an export.
+
+        Args:
+            source: Source resource ID (file, table, etc.)
+            destination: Destination path or URL
+            user_id: User performing the export
+            purpose: Business justification
+
+        Returns:
+            Export operation
+        """
+        return DataOperation(
             operation_type=OperationType.EXPORT,
             resource_type="file",
             resource_id=source,
@@ -246,10 +294,39 @@ class GovernanceEngine:
             destination_encrypted=self._is_encrypted_destination(destination),
         )
 
-        # Classify the source data
-        context = ClassificationContext(user_id=user_id)
+    def log_cached_evaluation(
+        self,
+        operation: DataOperation,
+        allowed: bool,
+        reasoning: str,
+        evaluation_id: str,
+        cached_evaluation_id: str,
+        classification_tier: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+    ) -> None:
+        """Audit a policy decision served from the API decision cache.
+
+        Cached decisions skip the pipeline, but every decision handed to a
+        client must still leave an audit record.
 
-        return self.evaluate_operation(operation, context)
+        Args:
+            operation: Data operation being evaluated
+            allowed: Whether the cached decision allows the operation
+            reasoning: Reasoning of the cached decision
+            evaluation_id: ID of this evaluation
+            cached_evaluation_id: ID of the evaluation the decision came from
+            classification_tier: Classification tier of the cached decision
+            tags: Data tags of the cached decision
+        """
+        self._audit_logger.log_cached_evaluation(
+            operation,
+            allowed,
+            reasoning,
+            evaluation_id,
+            cached_evaluation_id,
+            classification_tier=classification_tier,
+            tags=tags,
+        )
 
     def _classify_operation(
         self,
@@ -281,6 +358,14 @@ class GovernanceEngine:
         ]
         return any(destination.startswith(p) for p in encrypted_patterns)
 
+    def lineage_version(self) -> Optional[int]:
+        """Get the lineage version for response validation.
+
+        Returns:
+            Counter that changes on any lineage write, or None if unknown
+        """
+        return self._lineage_tracker.get_version()
+
     def get_lineage(self, artifact_id: str) -> dict[str, Any]:
         """Get lineage information for an artifact.
 
@@ -293,13 +378,33 @@ class GovernanceEngine:
         graph = self._lineage_tracker.get_lineage(artifact_id)
         return graph.to_dict()
 
-    def get_upstream(self, artifact_id: str) -> list:
+    def get_lineage_with_counts(
+        self, artifact_id: str, max_depth: Optional[int] = None
+    ) -> dict[str, Any]:
+        """Get lineage information with upstream and downstream counts.
+
+        Args:
+            artifact_id: Artifact to get lineage for
+            max_depth: Maximum depth to traverse
+
+        Returns:
+            Lineage information with ``upstream_count`` and ``downstream_count``
+        """
+        graph, upstream_count, downstream_count = (
+            self._lineage_tracker.get_lineage_with_counts(artifact_id, max_depth)
+        )
+        lineage = graph.to_dict()
+        lineage["upstream_count"] = upstream_count
+        lineage["downstream_count"] = downstream_count
+        return lineage
+
+    def get_upstream(self, artifact_id: str, max_depth: Optional[int] = None) -> list:
         """Get upstream dependencies of an artifact."""
-        return self._lineage_tracker.get_upstream(artifact_id)
+        return self._lineage_tracker.get_upstream(artifact_id, max_depth)
 
-    def get_downstream(self, artifact_id: str) -> list:
+    def get_downstream(self, artifact_id: str, max_depth: Optional[int] = None) -> list:
         """Get downstream dependents of an artifact."""
-        return self._lineage_tracker.get_downstream(artifact_id)
+        return self._lineage_tracker.get_downstream(artifact_id, max_depth)
 
     def verify_audit_integrity(self) -> dict[str, Any]:
         """Verify audit log integrity.
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 import structlog
-from sqlalchemy import desc
+from sqlalchemy import Column, desc
 
 from lacuna.db.base import session_scope
 from lacuna.db.models import LineageEdgeModel
@@ -21,6 +21,9 @@ class LineageBackend:
     for upstream/downstream traversal.
     """
 
+    # Maximum artifacts matched by a single traversal query
+    FRONTIER_SLICE_SIZE = 500
+
     def write_edge(self, edge: LineageEdge) -> None:
         """Write a lineage edge to storage.
 
@@ -96,35 +99,7 @@ class LineageBackend:
         Returns:
             List of upstream lineage edges
         """
-        with session_scope() as session:
-            edges = []
-            visited = set()
-            queue = [(artifact_id, 0)]
-
-            while queue:
-                current_id, depth = queue.pop(0)
-
-                if current_id in visited:
-                    continue
-
-                if max_depth is not None and depth > max_depth:
-                    continue
-
-                visited.add(current_id)
-
-                # Find edges where current_id is target
-                results = (
-                    session.query(LineageEdgeModel)
-                    .filter(LineageEdgeModel.target_artifact_id == current_id)
-                    .all()
-                )
-
-                for model in results:
-                    edge = self._model_to_edge(model)
-                    edges.append(edge)
-                    queue.append((model.source_artifact_id, depth + 1))
-
-            return edges
+        return self._traverse(artifact_id, max_depth, upstream=True)
 
     def get_downstream_edges(
         self, artifact_id: str, max_depth: Optional[int] = None
@@ -138,33 +113,61 @@ class LineageBackend:
         Returns:
             List of downstream lineage edges
         """
-        with session_scope() as session:
-            edges = []
-            visited = set()
-            queue = [(artifact_id, 0)]
-
-            while queue:
-                current_id, depth = queue.pop(0)
+        return self._traverse(artifact_id, max_depth, upstream=False)
 
-                if current_id in visited:
-                    continue
+    def _traverse(
+        self, artifact_id: str, max_depth: Optional[int], upstream: bool
+    ) -> list[LineageEdge]:
+        """Breadth-first traversal that queries one frontier slice at a time.
 
-                if max_depth is not None and depth > max_depth:
-                    continue
+        Each BFS level is fetched with ``IN`` queries over slices of at most
+        FRONTIER_SLICE_SIZE artifacts, so a wide fan-out costs a handful of
+        round trips rather than one query per artifact.
 
-                visited.add(current_id)
+        Args:
+            artifact_id: Artifact to start from
+            max_depth: Maximum depth to traverse
+            upstream: Follow edges towards sources instead of targets
 
-                # Find edges where current_id is source
-                results = (
-                    session.query(LineageEdgeModel)
-                    .filter(LineageEdgeModel.source_artifact_id == current_id)
-                    .all()
-                )
+        Returns:
+            List of lineage edges reached by the traversal
+        """
+        match_column: Column[str]
+        if upstream:
+            match_column = LineageEdgeModel.target_artifact_id
+        else:
+            match_column = LineageEdgeModel.source_artifact_id
 
-                for model in results:
-                    edge = self._model_to_edge(model)
-                    edges.append(edge)
-                    queue.append((model.target_artifact_id, depth + 1))
+        with session_scope() as session:
+            edges: list[LineageEdge] = []
+            visited = {artifact_id}
+            frontier = [artifact_id]
+            depth = 0
+
+            while frontier and (max_depth is None or depth <= max_depth):
+                next_frontier: list[str] = []
+
+                for i in range(0, len(frontier), self.FRONTIER_SLICE_SIZE):
+                    frontier_slice = frontier[i : i + self.FRONTIER_SLICE_SIZE]
+                    results = (
+                        session.query(LineageEdgeModel)
+                        .filter(match_column.in_(frontier_slice))
+                        .all()
+                    )
+
+                    for model in results:
+                        edges.append(self._model_to_edge(model))
+                        neighbour = (
+                            model.source_artifact_id
+                            if upstream
+                            else model.target_artifact_id
+                        )
+                        if neighbour not in visited:
+                            visited.add(neighbour)
+                            next_frontier.append(neighbour)
+
+                frontier = next_frontier
+                depth += 1
 
             return edges
 
@@ -0,0 +1,54 @@
+"""Bloom filter for fast negative membership checks on artifact IDs."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Membership tests may return false positives (at roughly ``error_rate``
+    once ``capacity`` keys have been added) but never false negatives, so a
+    miss proves the key was never added.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        """Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        """Get bit positions for a key using double hashing."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter.
+
+        Args:
+            key: Key to add
+        """
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key may have been added."""
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+    def clear(self) -> None:
+        """Remove all keys from the filter."""
+        self._bits = bytearray(len(self._bits))
@@ -1,5 +1,6 @@
 """In-memory lineage storage backend for development."""
 
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -62,10 +63,10 @@ class InMemoryLineageBackend:
         """
         result: list[LineageEdge] = []
         visited: set[str] = set()
-        queue = [(artifact_id, 0)]
+        queue = deque([(artifact_id, 0)])
 
         while queue:
-            current_id, depth = queue.pop(0)
+            current_id, depth = queue.popleft()
 
             if depth >= max_depth or current_id in visited:
                 continue
@@ -95,10 +96,10 @@ class InMemoryLineageBackend:
         """
         result: list[LineageEdge] = []
         visited: set[str] = set()
-        queue = [(artifact_id, 0)]
+        queue = deque([(artifact_id, 0)])
 
         while queue:
-            current_id, depth = queue.pop(0)
+            current_id, depth = queue.popleft()
 
             if depth >= max_depth or current_id in visited:
                 continue
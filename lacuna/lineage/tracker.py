@@ -1,11 +1,14 @@
 """Lineage tracker for data flow and dependency tracking."""
 
+import threading
+from collections import deque
 from typing import Any, Optional
 
 import networkx as nx
 import structlog
 
 from lacuna.config import get_settings
+from lacuna.lineage.bloom import BloomFilter
 from lacuna.models.classification import Classification, DataTier
 from lacuna.models.data_operation import DataOperation
 from lacuna.models.lineage import LineageEdge, LineageGraph, LineageNode
@@ -55,13 +58,42 @@ class LineageTracker:
         settings = get_settings()
         self.enabled = enabled and settings.lineage.enabled
         self.max_depth = max_depth or settings.lineage.max_depth
+        self.max_relations: int = settings.lineage.max_relations
         self._backend = backend or get_lineage_backend()
 
+        # Artifacts with at least one edge written through this tracker. When
+        # the tracker created a process-local in-memory backend itself, every
+        # stored edge passed through here, so a filter miss proves there is
+        # no lineage and the backend need not be consulted. Other backends
+        # may be written by other processes, so no filter is kept for them.
+        from lacuna.lineage.memory_backend import InMemoryLineageBackend
+
+        self._known_artifacts_complete = backend is None and isinstance(
+            self._backend, InMemoryLineageBackend
+        )
+        self._known_artifacts: Optional[BloomFilter] = None
+        if self._known_artifacts_complete:
+            self._known_artifacts = BloomFilter(
+                capacity=int(settings.lineage.bloom_capacity)
+            )
+
         # In-memory graph for fast traversal
         self._graph = nx.DiGraph()
         self._node_classifications: dict[str, Classification] = {}
         self._node_metadata: dict[str, dict[str, Any]] = {}
 
+        # Guards the graph and traversal cache; API routes query the tracker
+        # from worker threads while evaluations add edges
+        self._graph_lock = threading.Lock()
+
+        # Bumped on every change to the in-memory lineage
+        self._version = 0
+
+        # Memoized in-memory traversals, keyed by (direction, artifact, depth)
+        # and mapping each related artifact to its distance. Invalidated
+        # whenever an edge is added to the graph.
+        self._traversal_cache: dict[tuple[str, str, int], dict[str, int]] = {}
+
     def track_operation(
         self,
         operation: DataOperation,
@@ -149,14 +181,103 @@ class LineageTracker:
 
     def _add_edge_to_graph(self, edge: LineageEdge) -> None:
         """Add an edge to the in-memory graph."""
-        self._graph.add_edge(
-            edge.source_id,
-            edge.destination_id,
-            edge_id=edge.edge_id,
-            operation_type=edge.operation_type,
-            timestamp=edge.timestamp,
-            tags_propagated=edge.tags_propagated,
-        )
+        with self._graph_lock:
+            self._version += 1
+            self._traversal_cache.clear()
+            if self._known_artifacts is not None:
+                self._known_artifacts.add(edge.source_id)
+                self._known_artifacts.add(edge.destination_id)
+            self._graph.add_edge(
+                edge.source_id,
+                edge.destination_id,
+                edge_id=edge.edge_id,
+                operation_type=edge.operation_type,
+                timestamp=edge.timestamp,
+                tags_propagated=edge.tags_propagated,
+            )
+
+    def _may_have_lineage(self, artifact_id: str) -> bool:
+        """Check whether the backend may hold edges for an artifact.
+
+        Args:
+            artifact_id: Artifact to check
+
+        Returns:
+            False only if the artifact is known to have no lineage
+        """
+        if self._known_artifacts is None:
+            return True
+        return artifact_id in self._known_artifacts
+
+    def _walk(self, artifact_id: str, depth: int, upstream: bool) -> dict[str, int]:
+        """Breadth-first walk of the in-memory graph from an artifact.
+
+        Only artifacts reachable within ``depth`` hops are visited, and the
+        walk stops once ``max_relations`` related artifacts have been found.
+
+        Args:
+            artifact_id: Artifact to start from
+            depth: Maximum number of hops
+            upstream: Walk against edge direction instead of along it
+
+        Returns:
+            Mapping of related artifact ID to its distance from the artifact
+        """
+        neighbours = self._graph.predecessors if upstream else self._graph.successors
+        distances: dict[str, int] = {}
+        visited = {artifact_id}
+        queue = deque([(artifact_id, 0)])
+
+        while queue:
+            current_id, distance = queue.popleft()
+            if distance >= depth:
+                continue
+
+            for neighbour in neighbours(current_id):
+                if neighbour in visited:
+                    continue
+                visited.add(neighbour)
+                distances[neighbour] = distance + 1
+
+                if len(distances) >= self.max_relations:
+                    logger.warning(
+                        "lineage_traversal_truncated",
+                        artifact_id=artifact_id,
+                        max_relations=self.max_relations,
+                    )
+                    return distances
+
+                queue.append((neighbour, distance + 1))
+
+        return distances
+
+    def _related(self, artifact_id: str, depth: int, upstream: bool) -> dict[str, int]:
+        """Get memoized in-memory traversal results for an artifact."""
+        cache_key = ("upstream" if upstream else "downstream", artifact_id, depth)
+        with self._graph_lock:
+            distances = self._traversal_cache.get(cache_key)
+            if distances is None:
+                distances = {}
+                if artifact_id in self._graph:
+                    distances = self._walk(artifact_id, depth, upstream)
+                if distances:
+                    self._traversal_cache[cache_key] = distances
+        return distances
+
+    def get_version(self) -> Optional[int]:
+        """Get a counter that changes whenever the lineage changes.
+
+        Only a tracker that created its own in-memory backend sees every
+        write, so on any other backend (including PostgreSQL) this is always
+        None and lineage responses carry no ETag.
+
+        Returns:
+            Lineage version, or None if edges may be written by other
+            processes and changes cannot be observed here
+        """
+        if not self._known_artifacts_complete:
+            return None
+        return self._version
 
     def get_upstream(
         self, artifact_id: str, max_depth: Optional[int] = None
@@ -173,20 +294,12 @@ class LineageTracker:
         depth = max_depth or self.max_depth
 
         # First check in-memory graph
-        if artifact_id in self._graph:
-            upstream = []
-            for node in nx.ancestors(self._graph, artifact_id):
-                # Check depth
-                try:
-                    path_length = nx.shortest_path_length(
-                        self._graph, node, artifact_id
-                    )
-                    if path_length <= depth:
-                        upstream.append(node)
-                except nx.NetworkXNoPath:
-                    continue
-            if upstream:
-                return upstream
+        upstream = self._related(artifact_id, depth, upstream=True)
+        if upstream:
+            return list(upstream)
+
+        if not self._may_have_lineage(artifact_id):
+            return []
 
         # Fall back to database
         edges = self._backend.get_upstream_edges(artifact_id, max_depth=depth)
@@ -207,33 +320,59 @@ class LineageTracker:
         depth = max_depth or self.max_depth
 
         # First check in-memory graph
-        if artifact_id in self._graph:
-            downstream = []
-            for node in nx.descendants(self._graph, artifact_id):
-                try:
-                    path_length = nx.shortest_path_length(
-                        self._graph, artifact_id, node
-                    )
-                    if path_length <= depth:
-                        downstream.append(node)
-                except nx.NetworkXNoPath:
-                    continue
-            if downstream:
-                return downstream
+        downstream = self._related(artifact_id, depth, upstream=False)
+        if downstream:
+            return list(downstream)
+
+        if not self._may_have_lineage(artifact_id):
+            return []
 
         # Fall back to database
         edges = self._backend.get_downstream_edges(artifact_id, max_depth=depth)
         return list({edge.destination_id for edge in edges})
 
-    def get_lineage(self, artifact_id: str) -> LineageGraph:
+    def get_lineage(
+        self, artifact_id: str, max_depth: Optional[int] = None
+    ) -> LineageGraph:
         """Get complete lineage graph for an artifact.
 
         Args:
             artifact_id: Artifact to get lineage for
+            max_depth: Maximum depth to traverse
 
         Returns:
             LineageGraph with all connected nodes and edges
         """
+        graph, _, _ = self._build_lineage(artifact_id, max_depth)
+        return graph
+
+    def get_lineage_with_counts(
+        self, artifact_id: str, max_depth: Optional[int] = None
+    ) -> tuple[LineageGraph, int, int]:
+        """Get an artifact's lineage graph together with its dependency counts.
+
+        The counts are derived from the edges already fetched for the graph,
+        so no separate upstream or downstream traversal is needed.
+
+        Args:
+            artifact_id: Artifact to get lineage for
+            max_depth: Maximum depth to traverse
+
+        Returns:
+            Tuple of (lineage graph, upstream count, downstream count)
+        """
+        graph, upstream_edges, downstream_edges = self._build_lineage(
+            artifact_id, max_depth
+        )
+        upstream = {edge.source_id for edge in upstream_edges}
+        downstream = {edge.destination_id for edge in downstream_edges}
+        return graph, len(upstream), len(downstream)
+
+    def _build_lineage(
+        self, artifact_id: str, max_depth: Optional[int]
+    ) -> tuple[LineageGraph, list[LineageEdge], list[LineageEdge]]:
+        """Build a lineage graph, returning the edges it was built from."""
+        depth = max_depth or self.max_depth
         graph = LineageGraph(name=f"lineage_{artifact_id}")
 
         # Add the target node
@@ -248,19 +387,20 @@ class LineageTracker:
             )
         )
 
+        if not self._may_have_lineage(artifact_id):
+            return graph, [], []
+
         # Get upstream and downstream edges
-        upstream_edges = self._backend.get_upstream_edges(
-            artifact_id, max_depth=self.max_depth
-        )
+        upstream_edges = self._backend.get_upstream_edges(artifact_id, max_depth=depth)
         downstream_edges = self._backend.get_downstream_edges(
-            artifact_id, max_depth=self.max_depth
+            artifact_id, max_depth=depth
         )
 
         # Add all edges to graph
         for edge in upstream_edges + downstream_edges:
             graph.add_edge(edge)
 
-        return graph
+        return graph, upstream_edges, downstream_edges
 
     def compute_inherited_classification(
         self,
@@ -346,7 +486,9 @@ class LineageTracker:
             classification: Classification to register
         """
         self._node_classifications[artifact_id] = classification
-        self._graph.add_node(artifact_id, classification=classification.tier.value)
+        with self._graph_lock:
+            self._version += 1
+            self._graph.add_node(artifact_id, classification=classification.tier.value)
 
     def get_impact_analysis(self, artifact_id: str) -> dict[str, Any]:
         """Analyze impact of changes to an artifact.
@@ -355,24 +497,21 @@ class LineageTracker:
             artifact_id: Artifact to analyze
 
         Returns:
-            Impact analysis with downstream dependencies
+            Impact analysis with downstream dependencies, grouped under
+            ``by_depth`` by their distance as a string
         """
         downstream = self.get_downstream(artifact_id)
         downstream_edges = self._backend.get_downstream_edges(artifact_id)
 
-        # Group by depth
-        depth_map: dict[int, list[str]] = {}
+        # Group by depth, reusing the distances from the downstream walk. Keys
+        # are strings so the result can be serialized to JSON as-is.
+        distances = self._related(artifact_id, self.max_depth, upstream=False)
+        depth_map: dict[str, list[str]] = {}
         for node in downstream:
-            try:
-                if node in self._graph and artifact_id in self._graph:
-                    depth = nx.shortest_path_length(self._graph, artifact_id, node)
-                else:
-                    depth = 1  # Default depth
-                if depth not in depth_map:
-                    depth_map[depth] = []
-                depth_map[depth].append(node)
-            except nx.NetworkXNoPath:
-                continue
+            depth = str(distances.get(node, 1))  # Default depth
+            if depth not in depth_map:
+                depth_map[depth] = []
+            depth_map[depth].append(node)
 
         return {
             "artifact_id": artifact_id,
@@ -426,7 +565,10 @@ class LineageTracker:
 
     def clear_cache(self) -> None:
         """Clear in-memory graph cache."""
-        self._graph.clear()
+        with self._graph_lock:
+            self._version += 1
+            self._graph.clear()
+            self._traversal_cache.clear()
         self._node_classifications.clear()
         self._node_metadata.clear()
         logger.info("lineage_cache_cleared")
@@ -1,5 +1,7 @@
 """Audit models for ISO 27001-compliant logging."""
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -12,6 +14,33 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _hash_fields(
+    event_id: UUID,
+    timestamp: datetime,
+    event_type: str,
+    user_id: str,
+    resource_id: str,
+    action: str,
+    action_result: str,
+    previous_record_hash: Optional[str],
+) -> str:
+    """Hash the tamper-evident fields of an audit record."""
+    # Create deterministic serialization
+    hash_data = {
+        "event_id": str(event_id),
+        "timestamp": timestamp.isoformat(),
+        "event_type": event_type,
+        "user_id": user_id,
+        "resource_id": resource_id,
+        "action": action,
+        "action_result": action_result,
+        "previous_record_hash": previous_record_hash,
+    }
+
+    serialized = json.dumps(hash_data, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 class EventType(str, Enum):
     """Types of auditable events (ISO 27001 A.12.4.1)."""
 
@@ -218,26 +247,73 @@ class AuditRecord:
         This creates a hash chain by including the previous record's hash,
         enabling verification of audit log integrity per ISO 27001 A.12.4.2.
 
+        Uses OpenSSL's SHA-256 through hashlib, which takes the SHA-NI/ARMv8
+        crypto instruction path where the CPU supports it.
+
         Returns:
             Hexadecimal string representation of the hash
         """
-        import hashlib
-        import json
+        return _hash_fields(
+            self.event_id,
+            self.timestamp,
+            self.event_type.value,
+            self.user_id,
+            self.resource_id,
+            self.action,
+            self.action_result,
+            self.previous_record_hash,
+        )
 
-        # Create deterministic serialization
-        hash_data = {
-            "event_id": str(self.event_id),
-            "timestamp": self.timestamp.isoformat(),
-            "event_type": self.event_type.value,
-            "user_id": self.user_id,
-            "resource_id": self.resource_id,
-            "action": self.action,
-            "action_result": self.action_result,
-            "previous_record_hash": self.previous_record_hash,
-        }
+    @staticmethod
+    def compute_hash_from_row(row: Any) -> str:
+        """
+        Compute a record hash directly from stored columns.
+
+        Produces the same hash as compute_hash without building an
+        AuditRecord, for verifying rows straight from the database.
 
-        serialized = json.dumps(hash_data, sort_keys=True)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        Args:
+            row: Object exposing the hashed columns as attributes, such as a
+                SQLAlchemy row; ``event_type`` is the stored string value
+
+        Returns:
+            Hexadecimal string representation of the hash
+        """
+        return _hash_fields(
+            row.event_id,
+            row.timestamp,
+            row.event_type,
+            row.user_id,
+            row.resource_id,
+            row.action,
+            row.action_result,
+            row.previous_record_hash,
+        )
+
+    @staticmethod
+    def compute_hash_from_mapping(mapping: dict[str, Any]) -> str:
+        """
+        Compute a record hash from a column mapping.
+
+        Lets batch writers hash the mapping they already built for INSERT,
+        reusing its enum values instead of dereferencing them again.
+
+        Args:
+            mapping: Column mapping with ``event_type`` as the stored string
+
+        Returns:
+            Hexadecimal string representation of the hash
+        """
+        return _hash_fields(
+            mapping["event_id"],
+            mapping["timestamp"],
+            mapping["event_type"],
+            mapping["user_id"],
+            mapping["resource_id"],
+            mapping["action"],
+            mapping["action_result"],
+            mapping["previous_record_hash"],
+        )
 
     def is_sensitive_event(self) -> bool:
         """Check if this event involves sensitive data access."""
@@ -103,8 +103,9 @@ class DataOperation:
     resource_id: str = ""  # Path, table name, dataset ID
     resource_path: Optional[str] = None
 
-    # Source and destination (for transformations)
-    sources: list[str] = field(default_factory=list)
+    # Source and destination (for transformations). Stored as a tuple so
+    # operations over the same sources can be hashed and compared cheaply.
+    sources: tuple[str, ...] = ()
     destination: Optional[str] = None
     destination_type: Optional[str] = None
     destination_encrypted: bool = False
@@ -134,6 +135,11 @@ class DataOperation:
     error_message: Optional[str] = None
     records_affected: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        """Normalize sources given as any iterable (e.g. a list) to a tuple."""
+        if not isinstance(self.sources, tuple):
+            self.sources = tuple(self.sources) if self.sources else ()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -143,7 +149,7 @@ class DataOperation:
             "resource_type": self.resource_type,
             "resource_id": self.resource_id,
             "resource_path": self.resource_path,
-            "sources": self.sources,
+            "sources": list(self.sources),
             "destination": self.destination,
             "destination_type": self.destination_type,
             "destination_encrypted": self.destination_encrypted,
@@ -0,0 +1,40 @@
+"""Covering index for the latest audit record hash
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets "ORDER BY timestamp DESC LIMIT 1" fetch record_hash with an
+    # index-only scan; built concurrently so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_audit_timestamp_desc_hash",
+            "audit_log",
+            [sa.text("timestamp DESC")],
+            postgresql_include=["record_hash"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_audit_timestamp_desc_hash",
+            table_name="audit_log",
+            postgresql_concurrently=True,
+        )
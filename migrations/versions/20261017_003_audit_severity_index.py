@@ -0,0 +1,36 @@
+"""Composite index for audit queries filtered by severity
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_audit_severity_timestamp",
+            "audit_log",
+            ["severity", "timestamp"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_audit_severity_timestamp",
+            table_name="audit_log",
+            postgresql_concurrently=True,
+        )
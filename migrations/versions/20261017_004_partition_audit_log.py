@@ -0,0 +1,111 @@
+"""Partition audit_log by month on timestamp
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes on audit_log, recreated on the new table after the data is copied
+AUDIT_INDEXES: list[tuple[str, list]] = [
+    ("ix_audit_log_timestamp", ["timestamp"]),
+    ("ix_audit_log_event_type", ["event_type"]),
+    ("ix_audit_log_severity", ["severity"]),
+    ("ix_audit_log_user_id", ["user_id"]),
+    ("ix_audit_log_resource_id", ["resource_id"]),
+    ("ix_audit_log_resource_classification", ["resource_classification"]),
+    ("ix_audit_log_action_result", ["action_result"]),
+    ("idx_audit_user_timestamp", ["user_id", "timestamp"]),
+    ("idx_audit_resource_timestamp", ["resource_id", "timestamp"]),
+    ("idx_audit_classification_timestamp", ["resource_classification", "timestamp"]),
+    ("idx_audit_event_type", ["event_type", "timestamp"]),
+    ("idx_audit_action_result", ["action_result", "timestamp"]),
+    ("idx_audit_severity_timestamp", ["severity", "timestamp"]),
+]
+
+
+def _create_indexes() -> None:
+    for name, columns in AUDIT_INDEXES:
+        op.create_index(name, "audit_log", columns)
+    op.create_index(
+        "idx_audit_timestamp_desc_hash",
+        "audit_log",
+        [sa.text("timestamp DESC")],
+        postgresql_include=["record_hash"],
+    )
+
+
+def upgrade() -> None:
+    op.rename_table("audit_log", "audit_log_unpartitioned")
+    op.execute(
+        "CREATE TABLE audit_log "
+        "(LIKE audit_log_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+
+    # Monthly partitions covering existing records and the next three months
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc(
+                        'month', coalesce(min(timestamp), now())
+                    )::date,
+                    (date_trunc('month', now()) + interval '3 months')::date,
+                    interval '1 month'
+                )::date
+                FROM audit_log_unpartitioned
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_log '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'audit_log_' || to_char(month, 'YYYY_MM'),
+                    month,
+                    (month + interval '1 month')::date
+                );
+            END LOOP;
+        END $$
+        """
+    )
+
+    op.execute("INSERT INTO audit_log SELECT * FROM audit_log_unpartitioned")
+    op.drop_table("audit_log_unpartitioned")
+
+    op.create_primary_key("audit_log_pkey", "audit_log", ["event_id", "timestamp"])
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE TABLE audit_log_unpartitioned "
+        "(LIKE audit_log INCLUDING DEFAULTS)"
+    )
+    op.execute("INSERT INTO audit_log_unpartitioned SELECT * FROM audit_log")
+    op.drop_table("audit_log")
+    op.rename_table("audit_log_unpartitioned", "audit_log")
+
+    op.create_primary_key("audit_log_pkey", "audit_log", ["event_id"])
+    op.create_foreign_key(
+        "audit_log_parent_event_id_fkey",
+        "audit_log",
+        "audit_log",
+        ["parent_event_id"],
+        ["event_id"],
+    )
+    _create_indexes()
@@ -0,0 +1,38 @@
+"""Add audit hash chain checkpoints
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("record_hash", sa.String(64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_audit_checkpoints_timestamp", "audit_checkpoints", ["timestamp"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_checkpoints_timestamp", table_name="audit_checkpoints")
+    op.drop_table("audit_checkpoints")
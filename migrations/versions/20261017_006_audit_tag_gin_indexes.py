@@ -0,0 +1,38 @@
+"""GIN indexes for audit tag and compliance flag filters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # audit_log is partitioned, which rules out CREATE INDEX CONCURRENTLY
+    op.create_index(
+        "idx_audit_tags_gin",
+        "audit_log",
+        ["resource_tags"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_audit_compliance_flags_gin",
+        "audit_log",
+        ["compliance_flags"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_compliance_flags_gin", table_name="audit_log")
+    op.drop_index("idx_audit_tags_gin", table_name="audit_log")
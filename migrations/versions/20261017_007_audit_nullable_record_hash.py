@@ -0,0 +1,33 @@
+"""Allow NULL record hashes for audit records outside the hash chain
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "audit_log", "record_hash", existing_type=sa.String(64), nullable=True
+    )
+    # Records written with verify_on_write disabled used an empty hash
+    op.execute("UPDATE audit_log SET record_hash = NULL WHERE record_hash = ''")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE audit_log SET record_hash = '' WHERE record_hash IS NULL")
+    op.alter_column(
+        "audit_log", "record_hash", existing_type=sa.String(64), nullable=False
+    )
@@ -1,5 +1,6 @@
 """Unit tests for Lacuna API routes."""
 
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,6 +38,14 @@ class TestHealthRoutes:
         assert data["status"] == "ready"
         assert "environment" in data
 
+    def test_readiness_body_is_cached(self, client: TestClient) -> None:
+        """Test repeated readiness probes reuse the encoded response."""
+        first = client.get("/health/ready")
+        second = client.get("/health/ready")
+
+        assert first.content == second.content
+        assert first.headers["content-type"] == "application/json"
+
     def test_liveness_endpoint(self, client: TestClient) -> None:
         """Test liveness check."""
         response = client.get("/health/live")
@@ -60,21 +69,24 @@ class TestClassifyRoutes:
             tags=["PII"],
             classifier_name="heuristic",
         )
+        mock.classify_batch.side_effect = lambda queries, context=None: [
+            mock.classify.return_value for _ in queries
+        ]
         return mock
 
     @pytest.fixture
-    def client(self, mock_engine: MagicMock) -> TestClient:
+    def client(self, mock_engine: MagicMock) -> Generator[TestClient, None, None]:
         """Create a test client with mocked engine."""
-        from lacuna.api.app import create_app
+        from lacuna.api.app import create_app, get_engine
 
         app = create_app()
 
         # Override the engine dependency
-        from lacuna.api import app as app_module
+        app.dependency_overrides[get_engine] = lambda: mock_engine
 
-        app_module._engine = mock_engine
+        yield TestClient(app)
 
-        return TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_classify_basic(self, client: TestClient) -> None:
         """Test basic classification."""
@@ -111,6 +123,24 @@ class TestClassifyRoutes:
         assert "tier" in data
         assert "classifier" in data
 
+    def test_classify_builds_context_per_request(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test that identical requests each get their own context."""
+        payload = {
+            "query": "Summarize the meeting",
+            "user_id": "analyst@company.com",
+            "conversation": [{"role": "user", "content": "Hi"}],
+        }
+
+        client.post("/api/v1/classify", json=payload)
+        client.post("/api/v1/classify", json=payload)
+
+        first, second = (c.args[1] for c in mock_engine.classify.call_args_list)
+        assert first is not second
+        assert first.conversation is not second.conversation
+        assert first.conversation == [{"role": "user", "content": "Hi"}]
+
     def test_classify_batch(self, client: TestClient) -> None:
         """Test batch classification."""
         response = client.post(
@@ -161,17 +191,18 @@ class TestEvaluateRoutes:
         return mock
 
     @pytest.fixture
-    def client(self, mock_engine: MagicMock) -> TestClient:
+    def client(self, mock_engine: MagicMock) -> Generator[TestClient, None, None]:
         """Create a test client with mocked engine."""
-        from lacuna.api.app import create_app
+        from lacuna.api.app import create_app, get_engine
+        from lacuna.api.cache import get_decision_cache
 
         app = create_app()
+        app.dependency_overrides[get_engine] = lambda: mock_engine
 
-        from lacuna.api import app as app_module
+        yield TestClient(app)
 
-        app_module._engine = mock_engine
-
-        return TestClient(app)
+        app.dependency_overrides.clear()
+        get_decision_cache().clear()
 
     def test_evaluate_operation(self, client: TestClient) -> None:
         """Test evaluating an operation."""
@@ -207,6 +238,83 @@ class TestEvaluateRoutes:
         data = response.json()
         assert "allowed" in data
 
+    def test_evaluate_engine_error(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test engine failures return a generic 500 without the error text."""
+        mock_engine.evaluate_operation.side_effect = RuntimeError("db unreachable")
+
+        response = client.post(
+            "/api/v1/evaluate",
+            json={
+                "operation_type": "read",
+                "resource_type": "table",
+                "resource_id": "public.products",
+            },
+        )
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Internal server error"}
+
+    def test_evaluate_cached_decision(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test that repeated requests are served from the decision cache."""
+        payload = {
+            "operation_type": "read",
+            "resource_type": "table",
+            "resource_id": "public.products",
+            "user_id": "analyst@company.com",
+        }
+        params = {"cache_policy": "enabled"}
+
+        first = client.post("/api/v1/evaluate", json=payload, params=params)
+        second = client.post("/api/v1/evaluate", json=payload, params=params)
+
+        assert first.status_code == second.status_code == 200
+        assert second.json()["evaluation_id"] != first.json()["evaluation_id"]
+        mock_engine.evaluate_operation.assert_called_once()
+
+        # The cache hit is still audited, pointing at the original evaluation
+        mock_engine.log_cached_evaluation.assert_called_once()
+        args = mock_engine.log_cached_evaluation.call_args.args
+        assert args[3] == second.json()["evaluation_id"]
+        assert args[4] == first.json()["evaluation_id"]
+
+        stats = client.get("/api/v1/evaluate/cache/stats").json()
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_evaluate_cache_disabled_by_default(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test that evaluations are not cached unless requested."""
+        payload = {
+            "operation_type": "read",
+            "resource_type": "table",
+            "resource_id": "public.products",
+        }
+
+        client.post("/api/v1/evaluate", json=payload)
+        client.post("/api/v1/evaluate", json=payload)
+
+        assert mock_engine.evaluate_operation.call_count == 2
+        assert client.get("/api/v1/evaluate/cache/stats").json()["misses"] == 0
+
+    def test_evaluate_replay_miss(self, client: TestClient) -> None:
+        """Test that replay mode rejects requests with no cached decision."""
+        response = client.post(
+            "/api/v1/evaluate",
+            json={
+                "operation_type": "read",
+                "resource_type": "table",
+                "resource_id": "public.products",
+            },
+            params={"cache_policy": "replay"},
+        )
+
+        assert response.status_code == 404
+
     def test_evaluate_missing_fields(self, client: TestClient) -> None:
         """Test evaluation with missing required fields."""
         response = client.post(
@@ -228,8 +336,8 @@ class TestLineageRoutes:
         """Create a mock governance engine with lineage tracker."""
         mock = MagicMock()
 
-        # Mock get_lineage to return proper structure
-        mock.get_lineage.return_value = {
+        # Mock get_lineage_with_counts to return proper structure
+        mock.get_lineage_with_counts.return_value = {
             "nodes": {"source.csv": {}, "output.csv": {}},
             "edges": [
                 {
@@ -238,8 +346,12 @@ class TestLineageRoutes:
                     "operation_type": "transform",
                 }
             ],
+            "upstream_count": 2,
+            "downstream_count": 1,
         }
 
+        mock.lineage_version.return_value = 1
+
         # Mock upstream/downstream
         mock.get_upstream.return_value = ["source_a.csv", "source_b.csv"]
         mock.get_downstream.return_value = ["output.csv"]
@@ -256,17 +368,16 @@ class TestLineageRoutes:
         return mock
 
     @pytest.fixture
-    def client(self, mock_engine: MagicMock) -> TestClient:
+    def client(self, mock_engine: MagicMock) -> Generator[TestClient, None, None]:
         """Create a test client with mocked engine."""
-        from lacuna.api.app import create_app
+        from lacuna.api.app import create_app, get_engine
 
         app = create_app()
+        app.dependency_overrides[get_engine] = lambda: mock_engine
 
-        from lacuna.api import app as app_module
-
-        app_module._engine = mock_engine
+        yield TestClient(app)
 
-        return TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_get_lineage(self, client: TestClient) -> None:
         """Test getting lineage for an artifact."""
@@ -277,6 +388,77 @@ class TestLineageRoutes:
         assert "artifact_id" in data
         assert data["artifact_id"] == "output.csv"
 
+    def test_get_lineage_graph_shape(self, client: TestClient) -> None:
+        """Test that lineage nodes and edges are projected onto response fields."""
+        data = client.get("/api/v1/lineage/output.csv").json()
+
+        assert data["nodes"][0] == {
+            "node_id": "source.csv",
+            "resource_type": None,
+            "classification_tier": None,
+            "tags": [],
+        }
+        assert data["edges"] == [
+            {
+                "source_id": "source.csv",
+                "destination_id": "output.csv",
+                "operation_type": "transform",
+                "timestamp": None,
+            }
+        ]
+        assert data["upstream_count"] == 2
+        assert data["downstream_count"] == 1
+
+    def test_lineage_not_modified(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test revalidating with a current ETag skips the engine call."""
+        first = client.get("/api/v1/lineage/output.csv/upstream")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, max-age=30"
+
+        second = client.get(
+            "/api/v1/lineage/output.csv/upstream",
+            headers={"If-None-Match": etag},
+        )
+
+        assert second.status_code == 304
+        assert mock_engine.get_upstream.call_count == 1
+
+    def test_lineage_etag_changes_with_version(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test a lineage write invalidates previously issued ETags."""
+        etag = client.get("/api/v1/lineage/output.csv").headers["etag"]
+        mock_engine.lineage_version.return_value = 2
+
+        response = client.get(
+            "/api/v1/lineage/output.csv", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_get_impact_analysis(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test impact analysis passes depth buckets through unchanged."""
+        mock_engine._lineage_tracker.get_impact_analysis.return_value = {
+            "downstream_count": 2,
+            "downstream_artifacts": ["b.csv", "c.csv"],
+            "by_depth": {"1": ["b.csv"], "2": ["c.csv"]},
+        }
+
+        response = client.get("/api/v1/lineage/a.csv/impact")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "artifact_id": "a.csv",
+            "downstream_count": 2,
+            "downstream_artifacts": ["b.csv", "c.csv"],
+            "by_depth": {"1": ["b.csv"], "2": ["c.csv"]},
+        }
+
 
 class TestAuditRoutes:
     """Tests for audit endpoints."""
@@ -309,17 +491,16 @@ class TestAuditRoutes:
         return mock
 
     @pytest.fixture
-    def client(self, mock_engine: MagicMock) -> TestClient:
+    def client(self, mock_engine: MagicMock) -> Generator[TestClient, None, None]:
         """Create a test client with mocked engine."""
-        from lacuna.api.app import create_app
+        from lacuna.api.app import create_app, get_engine
 
         app = create_app()
+        app.dependency_overrides[get_engine] = lambda: mock_engine
 
-        from lacuna.api import app as app_module
-
-        app_module._engine = mock_engine
+        yield TestClient(app)
 
-        return TestClient(app)
+        app.dependency_overrides.clear()
 
     def test_query_audit_logs(self, client: TestClient) -> None:
         """Test querying audit logs."""
@@ -339,6 +520,93 @@ class TestAuditRoutes:
 
         assert response.status_code == 200
 
+    def test_query_audit_builds_query(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test that filters are passed to the audit logger as an AuditQuery."""
+        from lacuna.models.audit import AuditQuery
+
+        client.get(
+            "/api/v1/audit",
+            params={"user_id": "test-user", "event_type": "unknown", "limit": 10},
+        )
+
+        query = mock_engine._audit_logger.query.call_args.args[0]
+        assert isinstance(query, AuditQuery)
+        assert query.user_id == "test-user"
+        assert query.event_types == []
+        assert query.limit == 10
+
+    def test_query_audit_logs_serializes_records(
+        self, client: TestClient, mock_engine: MagicMock
+    ) -> None:
+        """Test that audit records are serialized into the response."""
+        from lacuna.models.audit import AuditRecord
+
+        record = AuditRecord(
+            user_id="test-user",
+            resource_id="customers.csv",
+            action="read",
+            action_result="success",
+        )
+        mock_engine._audit_logger.query.return_value = [record]
+
+        response = client.get("/api/v1/audit")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["records"][0]["event_id"] == str(record.event_id)
+        assert data["records"][0]["timestamp"] == record.timestamp.isoformat()
+        assert data["records"][0]["event_type"] == record.event_type.value
+        assert data["records"][0]["resource_id"] == "customers.csv"
+
+    def test_query_audit_invalid_time(self, client: TestClient) -> None:
+        """Test that a malformed timestamp is rejected as a bad request."""
+        response = client.get("/api/v1/audit", params={"start_time": "yesterday"})
+
+        assert response.status_code == 400
+
+
+class TestCORS:
+    """Tests for CORS handling."""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        """Create a test client."""
+        from lacuna.api.app import create_app
+
+        return TestClient(create_app())
+
+    def test_cross_origin_request_gets_cors_headers(self, client: TestClient) -> None:
+        """Test that requests with an Origin header receive CORS headers."""
+        origin = "https://example.com"
+        response = client.get("/health", headers={"Origin": origin})
+
+        assert response.status_code == 200
+        # With credentials allowed, the request origin is echoed instead of "*"
+        assert response.headers["access-control-allow-origin"] == origin
+
+    def test_same_origin_request_skips_cors(self, client: TestClient) -> None:
+        """Test that requests without an Origin header bypass CORS handling."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_request(self, client: TestClient) -> None:
+        """Test that CORS preflight requests are answered."""
+        response = client.options(
+            "/api/v1/classify",
+            headers={
+                "Origin": "https://example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        assert response.status_code == 200
+        assert "access-control-allow-methods" in response.headers
+
 
 class TestOpenAPI:
     """Tests for OpenAPI documentation."""
@@ -1,10 +1,15 @@
 """Tests for audit logging."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from lacuna.audit.backend import AuditBackend, _copy_value
+from lacuna.audit.logger import AuditLogger
 from lacuna.models.audit import AuditQuery, AuditRecord, EventType, Severity
+from lacuna.models.data_operation import DataOperation, OperationType, UserContext
 
 
 class TestAuditRecord:
@@ -66,6 +71,32 @@ class TestAuditRecord:
 
         assert record1.compute_hash() != record2.compute_hash()
 
+    def test_audit_record_hash_from_row_matches(self) -> None:
+        """Test hashing stored columns matches hashing the record."""
+        record = AuditRecord(
+            event_type=EventType.DATA_EXPORT,
+            user_id="user1",
+            resource_id="file1",
+            action="export",
+            action_result="denied",
+            previous_record_hash="a" * 64,
+        )
+        row = SimpleNamespace(
+            event_id=record.event_id,
+            timestamp=record.timestamp,
+            event_type=record.event_type.value,
+            user_id=record.user_id,
+            resource_id=record.resource_id,
+            action=record.action,
+            action_result=record.action_result,
+            previous_record_hash=record.previous_record_hash,
+        )
+
+        assert AuditRecord.compute_hash_from_row(row) == record.compute_hash()
+        assert AuditRecord.compute_hash_from_mapping(vars(row)) == (
+            record.compute_hash()
+        )
+
     def test_audit_record_to_dict(self) -> None:
         """Test serialization to dictionary."""
         record = AuditRecord(
@@ -172,3 +203,167 @@ class TestAuditQuery:
         assert data["user_id"] == "test-user"
         assert data["limit"] == 25
         assert "data.access" in data["event_types"]
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger batching."""
+
+    def test_queued_records_are_written_in_batches(self) -> None:
+        """Test every logged record reaches the backend by stop()."""
+        backend = MagicMock()
+        audit_logger = AuditLogger(backend=backend, batch_size=2, flush_interval=0.01)
+
+        for i in range(5):
+            audit_logger.log(
+                AuditRecord(
+                    event_type=EventType.DATA_ACCESS,
+                    severity=Severity.INFO,
+                    user_id="test-user",
+                    resource_type="file",
+                    resource_id=f"file-{i}.csv",
+                    action="read",
+                    action_result="success",
+                )
+            )
+        audit_logger.stop()
+
+        batches = [call.args[0] for call in backend.write_batch.call_args_list]
+        assert sum(len(batch) for batch in batches) == 5
+        assert all(len(batch) <= 2 for batch in batches)
+
+    def test_cached_evaluation_logged(self) -> None:
+        """Test a decision served from cache is audited with both IDs."""
+        audit_logger = AuditLogger(backend=MagicMock())
+        operation = DataOperation(
+            operation_type=OperationType.EXPORT,
+            resource_type="file",
+            resource_id="customers.csv",
+            destination="~/Downloads/customers.csv",
+            user=UserContext(user_id="analyst"),
+        )
+
+        record = audit_logger.log_cached_evaluation(
+            operation,
+            False,
+            "Export of PII denied",
+            "eval-new",
+            "eval-cached",
+            classification_tier="PROPRIETARY",
+        )
+        audit_logger.stop()
+
+        assert record.event_type == EventType.POLICY_DENY
+        assert record.user_id == "analyst"
+        assert record.action_result == "denied"
+        assert record.action_metadata["evaluation_id"] == "eval-new"
+        assert record.action_metadata["cached_evaluation_id"] == "eval-cached"
+
+
+class TestAuditBackendChainHead:
+    """Tests for sharing the hash chain head through Redis."""
+
+    def test_last_hash_read_from_redis(self) -> None:
+        """Test a cached chain head skips the database query."""
+        redis_client = MagicMock()
+        redis_client.get.return_value = b"a" * 64
+        backend = AuditBackend(redis_client=redis_client)
+        session = MagicMock()
+
+        assert backend._get_last_hash(session) == "a" * 64
+        session.query.assert_not_called()
+
+    def test_last_hash_cached_in_redis_on_miss(self) -> None:
+        """Test a database lookup populates Redis."""
+        redis_client = MagicMock()
+        redis_client.get.return_value = None
+        backend = AuditBackend(redis_client=redis_client)
+        session = MagicMock()
+        latest = session.query.return_value.filter.return_value.order_by.return_value
+        latest.first.return_value = ("b" * 64,)
+
+        assert backend._get_last_hash(session) == "b" * 64
+        redis_client.set.assert_called_once_with(
+            AuditBackend.LAST_HASH_KEY, "b" * 64, ex=AuditBackend.LAST_HASH_TTL
+        )
+
+    def test_last_hash_skips_unchained_records(self) -> None:
+        """Test the chain head lookup ignores records stored without a hash."""
+        redis_client = MagicMock()
+        redis_client.get.return_value = None
+        backend = AuditBackend(redis_client=redis_client)
+        session = MagicMock()
+        latest = session.query.return_value.filter.return_value.order_by.return_value
+        latest.first.return_value = ("c" * 64,)
+
+        assert backend._get_last_hash(session) == "c" * 64
+        condition = session.query.return_value.filter.call_args.args[0]
+        assert str(condition) == "audit_log.record_hash IS NOT NULL"
+
+
+class TestAuditBackendUnchained:
+    """Tests for writing without the hash chain."""
+
+    @patch("lacuna.audit.backend.session_scope")
+    def test_write_batch_skips_hashing(self, mock_session_scope) -> None:
+        """Test records are stored unhashed when verify_on_write is off."""
+        backend = AuditBackend(verify_on_write=False, redis_client=MagicMock())
+        backend._get_last_hash = MagicMock()
+        record = AuditRecord(
+            event_type=EventType.DATA_ACCESS,
+            user_id="test-user",
+            resource_id="customers.csv",
+            action="read",
+            action_result="success",
+            previous_record_hash="a" * 64,
+        )
+
+        backend.write_batch([record])
+
+        assert record.record_hash == ""
+        assert record.previous_record_hash is None
+        backend._get_last_hash.assert_not_called()
+        session = mock_session_scope.return_value.__enter__.return_value
+        session.execute.assert_called_once()
+        mapping = session.execute.call_args.args[1][0]
+        assert mapping["record_hash"] is None
+
+
+class TestAuditCheckpoints:
+    """Tests for hash chain checkpoints."""
+
+    def test_checkpoint_stored_every_interval(self) -> None:
+        """Test a checkpoint is added once the interval is reached."""
+        backend = AuditBackend(redis_client=MagicMock())
+        backend.CHECKPOINT_INTERVAL = 3
+        session = MagicMock()
+        records = [
+            AuditRecord(user_id="test-user", record_hash=str(i) * 64) for i in range(4)
+        ]
+
+        backend._advance_checkpoint(session, records[:2])
+        session.add.assert_not_called()
+
+        backend._advance_checkpoint(session, records[2:])
+        checkpoint = session.add.call_args.args[0]
+        assert checkpoint.record_hash == "3" * 64
+        assert backend._records_since_checkpoint == 0
+
+
+class TestCopyValue:
+    """Tests for formatting values for COPY."""
+
+    def test_null_and_scalars(self) -> None:
+        """Test NULL marker and scalar formatting."""
+        timestamp = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+        assert _copy_value(None) == r"\N"
+        assert _copy_value(timestamp) == timestamp.isoformat()
+        assert _copy_value({"a": 1}) == '{"a": 1}'
+        assert _copy_value("") == ""
+
+    def test_array_literal_escaping(self) -> None:
+        """Test list values become quoted PostgreSQL array literals."""
+        assert _copy_value(["PII", 'say "hi"', "a\\b"]) == (
+            '{"PII","say \\"hi\\"","a\\\\b"}'
+        )
+        assert _copy_value([]) == "{}"
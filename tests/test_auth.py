@@ -239,6 +239,20 @@ class TestAPIKeyStore:
         assert store.delete(api_key.id) is True
         assert store.get(api_key.id) is None
 
+    def test_get_by_raw_key_after_delete(self):
+        """Test a cached raw key stops resolving once the key is deleted."""
+        store = APIKeyStore()
+
+        api_key, raw_key = store.create(
+            name="test-key",
+            service_account_id="svc-test",
+            created_by="admin",
+        )
+
+        assert store.get_by_raw_key(raw_key) is not None
+        assert store.delete(api_key.id) is True
+        assert store.get_by_raw_key(raw_key) is None
+
     def test_list_all_keys(self):
         """Test listing all keys."""
         store = APIKeyStore()
@@ -1,5 +1,7 @@
 """Tests for classification pipeline."""
 
+from unittest.mock import patch
+
 import pytest
 
 from lacuna.classifier.heuristic import HeuristicClassifier
@@ -132,6 +134,66 @@ class TestClassificationPipeline:
         assert result1.tier == result2.tier
         assert pipeline._cache
 
+    def test_pipeline_classify_batch_dedupes(self) -> None:
+        """Test batch classification classifies duplicate queries once."""
+        pipeline = ClassificationPipeline()
+        classifier = pipeline.classifiers[0]
+        queries = ["What is Python?", "SSN: 123-45-6789", "What is Python?"]
+
+        with patch.object(
+            classifier, "classify_batch", wraps=classifier.classify_batch
+        ) as spy:
+            results = pipeline.classify_batch(queries)
+
+        assert spy.call_args[0][0] == ["What is Python?", "SSN: 123-45-6789"]
+        assert len(results) == 3
+        assert results[0] is results[2]
+        assert results[1].tier == DataTier.PROPRIETARY
+
+    def test_pipeline_classify_batch_matches_single(self) -> None:
+        """Test batch classification agrees with per-query classification."""
+        queries = ["Contact me at test@example.com", "What is Python?", "xyz"]
+
+        batch = ClassificationPipeline().classify_batch(queries)
+        single = [ClassificationPipeline().classify(query) for query in queries]
+
+        assert [r.tier for r in batch] == [r.tier for r in single]
+        assert [r.classifier_name for r in batch] == [r.classifier_name for r in single]
+
+    def test_pipeline_classify_batch_isolates_errors(self) -> None:
+        """Test a failing batch call falls back to per-query classification."""
+        pipeline = ClassificationPipeline()
+        classifier = pipeline.classifiers[0]
+
+        with patch.object(classifier, "classify_batch", side_effect=RuntimeError):
+            results = pipeline.classify_batch(["SSN: 123-45-6789"])
+
+        assert results[0].tier == DataTier.PROPRIETARY
+
+    def test_pipeline_cache_lru_eviction(self) -> None:
+        """Test pipeline cache evicts least recently used entries."""
+        pipeline = ClassificationPipeline()
+        pipeline._cache_max_size = 2
+
+        pipeline.classify("What is Python?")
+        pipeline.classify("What is Rust?")
+        pipeline.classify("What is Python?")  # refresh
+        pipeline.classify("What is Go?")
+
+        assert len(pipeline._cache) == 2
+        assert "What is Python?" in pipeline._cache
+        assert "What is Rust?" not in pipeline._cache
+
+    def test_pipeline_cache_ttl_expiry(self) -> None:
+        """Test expired cache entries are not returned."""
+        pipeline = ClassificationPipeline()
+        pipeline._cache_ttl = -1
+
+        pipeline.classify("What is Python?")
+
+        assert pipeline._cache_get("What is Python?") is None
+        assert "What is Python?" not in pipeline._cache
+
     def test_pipeline_fallback(self) -> None:
         """Test pipeline falls back to default on no match."""
         pipeline = ClassificationPipeline(default_tier=DataTier.PROPRIETARY)
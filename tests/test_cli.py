@@ -321,7 +321,7 @@ class TestLineageCommands:
         mock_tracker.get_impact_analysis.return_value = {
             "downstream_count": 5,
             "downstream_artifacts": ["a.csv", "b.csv", "c.csv"],
-            "by_depth": {1: ["a.csv"], 2: ["b.csv", "c.csv"]},
+            "by_depth": {"1": ["a.csv"], "2": ["b.csv", "c.csv"]},
         }
 
         runner = CliRunner()
@@ -409,3 +409,12 @@ class TestServeCommand:
         mock_uvicorn_run.assert_called_once()
         call_kwargs = mock_uvicorn_run.call_args[1]
         assert call_kwargs["port"] == 8001
+        assert call_kwargs["access_log"] is False
+
+    @patch("uvicorn.run")
+    def test_serve_workers(self, mock_uvicorn_run) -> None:
+        """Test serve command passes the worker count to uvicorn."""
+        runner = CliRunner()
+        runner.invoke(cli, ["serve", "--workers", "4"], catch_exceptions=False)
+
+        assert mock_uvicorn_run.call_args[1]["workers"] == 4
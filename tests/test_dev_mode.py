@@ -45,21 +45,25 @@ class TestBackendSelection:
 
     def test_lineage_backend_sqlite_uses_memory(self) -> None:
         """Test that SQLite URL uses in-memory lineage backend."""
-        with patch("lacuna.config.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                database=MagicMock(url="sqlite:///data/test.db"),
-                lineage=MagicMock(enabled=True, max_depth=10),
-            )
+        import lacuna.lineage.tracker as tracker_module
 
-            # Reimport to pick up the patched settings
-            import lacuna.lineage.tracker as tracker_module
+        try:
+            with patch("lacuna.config.get_settings") as mock_settings:
+                mock_settings.return_value = MagicMock(
+                    database=MagicMock(url="sqlite:///data/test.db"),
+                    lineage=MagicMock(enabled=True, max_depth=10),
+                )
 
-            importlib.reload(tracker_module)
+                # Reimport to pick up the patched settings
+                importlib.reload(tracker_module)
 
-            from lacuna.lineage.memory_backend import InMemoryLineageBackend
+                from lacuna.lineage.memory_backend import InMemoryLineageBackend
 
-            backend = tracker_module.get_lineage_backend()
-            assert isinstance(backend, InMemoryLineageBackend)
+                backend = tracker_module.get_lineage_backend()
+                assert isinstance(backend, InMemoryLineageBackend)
+        finally:
+            # Reload again so later tests see the real get_settings
+            importlib.reload(tracker_module)
 
     def test_lineage_backend_postgres_url_detected(self) -> None:
         """Test that PostgreSQL URL is detected as non-SQLite."""
@@ -241,18 +245,28 @@ class TestDevModeIntegration:
 
     def test_lineage_tracker_with_memory_backend(self) -> None:
         """Test LineageTracker uses InMemoryLineageBackend with SQLite."""
-        with patch("lacuna.config.get_settings") as mock_settings:
-            mock_settings.return_value = MagicMock(
-                database=MagicMock(url="sqlite:///data/test.db"),
-                lineage=MagicMock(enabled=True, max_depth=10),
-            )
-
-            # Reimport to pick up the patched settings
-            import lacuna.lineage.tracker as tracker_module
-
+        import lacuna.lineage.tracker as tracker_module
+
+        try:
+            with patch("lacuna.config.get_settings") as mock_settings:
+                mock_settings.return_value = MagicMock(
+                    database=MagicMock(url="sqlite:///data/test.db"),
+                    lineage=MagicMock(
+                        enabled=True,
+                        max_depth=10,
+                        max_relations=10_000,
+                        bloom_capacity=1_000,
+                    ),
+                )
+
+                # Reimport to pick up the patched settings
+                importlib.reload(tracker_module)
+
+                from lacuna.lineage.memory_backend import InMemoryLineageBackend
+
+                tracker = tracker_module.LineageTracker()
+                assert isinstance(tracker._backend, InMemoryLineageBackend)
+                assert tracker.max_relations == 10_000
+        finally:
+            # Reload again so later tests see the real get_settings
             importlib.reload(tracker_module)
-
-            from lacuna.lineage.memory_backend import InMemoryLineageBackend
-
-            tracker = tracker_module.LineageTracker()
-            assert isinstance(tracker._backend, InMemoryLineageBackend)
@@ -73,6 +73,22 @@ class TestGovernanceEngine:
 
         engine.stop()
 
+    def test_classify_batch(self, engine: GovernanceEngine) -> None:
+        """Test batch classification preserves query order."""
+        queries = [
+            "Contact me at test@example.com",
+            "What is machine learning?",
+        ]
+        classifications = engine.classify_batch(
+            queries, ClassificationContext(user_id="test")
+        )
+
+        assert len(classifications) == len(queries)
+        assert classifications[0].tier == DataTier.PROPRIETARY
+        assert classifications[1].tier == DataTier.PUBLIC
+
+        engine.stop()
+
     def test_evaluate_public_query(self, engine: GovernanceEngine) -> None:
         """Test evaluating a public query."""
         result = engine.evaluate_query(
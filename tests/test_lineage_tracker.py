@@ -181,6 +181,151 @@ class TestLineageTrackerQueries:
         assert "B" in downstream
         # C and D should be excluded due to depth limit
 
+    def test_get_upstream_with_max_depth(self, tracker) -> None:
+        """Test upstream query respects max depth."""
+        # A -> B -> C -> D
+        for source, destination in [("A", "B"), ("B", "C"), ("C", "D")]:
+            tracker._add_edge_to_graph(
+                LineageEdge(
+                    source_id=source, destination_id=destination, operation_type="t"
+                )
+            )
+
+        assert sorted(tracker.get_upstream("D", max_depth=2)) == ["B", "C"]
+
+    def test_traversal_capped_at_max_relations(self, tracker) -> None:
+        """Test traversal stops once max_relations artifacts are found."""
+        tracker.max_relations = 2
+        for destination in ["B", "C", "D"]:
+            tracker._add_edge_to_graph(
+                LineageEdge(
+                    source_id="A", destination_id=destination, operation_type="t"
+                )
+            )
+
+        assert len(tracker.get_downstream("A")) == 2
+
+    def test_impact_analysis_groups_by_depth(self, tracker) -> None:
+        """Test impact analysis groups downstream artifacts by distance."""
+        for source, destination in [("A", "B"), ("B", "C"), ("A", "D")]:
+            tracker._add_edge_to_graph(
+                LineageEdge(
+                    source_id=source, destination_id=destination, operation_type="t"
+                )
+            )
+
+        analysis = tracker.get_impact_analysis("A")
+
+        assert sorted(analysis["by_depth"]["1"]) == ["B", "D"]
+        assert analysis["by_depth"]["2"] == ["C"]
+
+    def test_upstream_traversal_is_memoized(self, tracker) -> None:
+        """Test repeated upstream queries reuse the cached traversal."""
+        tracker._add_edge_to_graph(
+            LineageEdge(source_id="A", destination_id="B", operation_type="t")
+        )
+
+        first = tracker.get_upstream("B")
+        with patch.object(tracker, "_walk") as mock_traversal:
+            second = tracker.get_upstream("B")
+
+        mock_traversal.assert_not_called()
+        assert first == second == ["A"]
+
+    def test_memoized_traversal_invalidated_on_new_edge(self, tracker) -> None:
+        """Test adding an edge invalidates cached traversals."""
+        tracker._add_edge_to_graph(
+            LineageEdge(source_id="A", destination_id="B", operation_type="t")
+        )
+        assert tracker.get_upstream("B") == ["A"]
+
+        tracker._add_edge_to_graph(
+            LineageEdge(source_id="X", destination_id="B", operation_type="t")
+        )
+
+        assert sorted(tracker.get_upstream("B")) == ["A", "X"]
+
+    def test_version_unknown_for_external_backend(self, tracker) -> None:
+        """Test no lineage version is reported for a shared backend."""
+        assert tracker.get_version() is None
+
+    def test_get_lineage_with_counts(self, tracker, mock_backend) -> None:
+        """Test counts are derived from the edges fetched for the graph."""
+        mock_backend.get_upstream_edges.return_value = [
+            LineageEdge(source_id="A", destination_id="C", operation_type="t"),
+            LineageEdge(source_id="B", destination_id="C", operation_type="t"),
+        ]
+        mock_backend.get_downstream_edges.return_value = [
+            LineageEdge(source_id="C", destination_id="D", operation_type="t"),
+        ]
+
+        graph, upstream_count, downstream_count = tracker.get_lineage_with_counts(
+            "C", max_depth=3
+        )
+
+        assert (upstream_count, downstream_count) == (2, 1)
+        assert len(graph.edges) == 3
+        mock_backend.get_upstream_edges.assert_called_once_with("C", max_depth=3)
+        mock_backend.get_downstream_edges.assert_called_once_with("C", max_depth=3)
+
+
+class TestLineageTrackerKnownArtifacts:
+    """Tests for skipping backend lookups for artifacts without lineage."""
+
+    @pytest.fixture
+    def tracker(self):
+        """Create a tracker that owns a process-local in-memory backend."""
+        from lacuna.lineage.memory_backend import InMemoryLineageBackend
+
+        backend = MagicMock(spec=InMemoryLineageBackend)
+        backend.get_upstream_edges = MagicMock(return_value=[])
+        backend.get_downstream_edges = MagicMock(return_value=[])
+
+        with patch("lacuna.lineage.tracker.get_lineage_backend", return_value=backend):
+            return LineageTracker(enabled=True)
+
+    @pytest.fixture
+    def mock_backend(self):
+        """Create a mock backend."""
+        return MagicMock(spec=LineageBackend)
+
+    def test_unknown_artifact_skips_backend(self, tracker) -> None:
+        """Test that artifacts never seen return empty lineage directly."""
+        assert tracker.get_upstream("unknown.csv") == []
+        assert tracker.get_downstream("unknown.csv") == []
+        assert len(tracker.get_lineage("unknown.csv").edges) == 0
+
+        tracker._backend.get_upstream_edges.assert_not_called()
+        tracker._backend.get_downstream_edges.assert_not_called()
+
+    def test_known_artifact_queries_backend(self, tracker) -> None:
+        """Test that artifacts with recorded edges still reach the backend."""
+        tracker._add_edge_to_graph(
+            LineageEdge(source_id="A", destination_id="B", operation_type="t")
+        )
+        tracker.get_lineage("A")
+
+        tracker._backend.get_upstream_edges.assert_called_once()
+
+    def test_injected_backend_always_queried(self, mock_backend) -> None:
+        """Test that a shared backend is queried even for unseen artifacts."""
+        tracker = LineageTracker(backend=mock_backend, enabled=True)
+        mock_backend.get_upstream_edges.return_value = []
+
+        tracker.get_upstream("unknown.csv")
+
+        mock_backend.get_upstream_edges.assert_called_once()
+
+    def test_version_changes_on_new_edge(self, tracker) -> None:
+        """Test that the lineage version changes when an edge is added."""
+        before = tracker.get_version()
+        tracker._add_edge_to_graph(
+            LineageEdge(source_id="A", destination_id="B", operation_type="t")
+        )
+
+        assert before is not None
+        assert tracker.get_version() != before
+
 
 class TestLineageTrackerClassification:
     """Tests for LineageTracker classification inheritance."""
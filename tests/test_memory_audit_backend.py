@@ -102,6 +102,7 @@ class TestInMemoryAuditBackendQuery:
                 event_type=EventType.DATA_ACCESS,
                 user_id="user-a",
                 resource_id="file1.csv",
+                resource_tags=["PII"],
                 action="read",
                 timestamp=now - timedelta(hours=2),
             ),
@@ -109,6 +110,7 @@ class TestInMemoryAuditBackendQuery:
                 event_type=EventType.DATA_EXPORT,
                 user_id="user-a",
                 resource_id="file2.csv",
+                resource_tags=["PII", "FINANCIAL"],
                 action="export",
                 timestamp=now - timedelta(hours=1),
             ),
@@ -159,6 +161,28 @@ class TestInMemoryAuditBackendQuery:
         assert len(results) == 1
         assert results[0].event_type == EventType.POLICY_DENY
 
+    def test_query_by_user_and_event_type(
+        self, backend_with_data: InMemoryAuditBackend
+    ) -> None:
+        """Test combining indexed filters."""
+        query = AuditQuery(user_id="user-a", event_types=[EventType.DATA_EXPORT])
+        results = backend_with_data.query(query)
+
+        assert len(results) == 1
+        assert results[0].resource_id == "file2.csv"
+
+    def test_query_by_resource_tags(
+        self, backend_with_data: InMemoryAuditBackend
+    ) -> None:
+        """Test querying records that carry all requested tags."""
+        assert len(backend_with_data.query(AuditQuery(resource_tags=["PII"]))) == 2
+
+        query = AuditQuery(resource_tags=["PII", "FINANCIAL"])
+        results = backend_with_data.query(query)
+
+        assert len(results) == 1
+        assert results[0].resource_id == "file2.csv"
+
     def test_query_by_time_range(self, backend_with_data: InMemoryAuditBackend) -> None:
         """Test querying by time range."""
         now = datetime.now(timezone.utc)
@@ -189,6 +213,23 @@ class TestInMemoryAuditBackendQuery:
         for i in range(len(results) - 1):
             assert results[i].timestamp >= results[i + 1].timestamp
 
+    def test_query_orders_late_records(self) -> None:
+        """Test records written out of timestamp order are returned in order."""
+        backend = InMemoryAuditBackend()
+        now = datetime.now(timezone.utc)
+        for hours in (1, 3, 2):
+            backend.write(
+                AuditRecord(user_id="user-a", timestamp=now - timedelta(hours=hours))
+            )
+
+        results = backend.query(AuditQuery(user_id="user-a"))
+
+        assert [r.timestamp for r in results] == [
+            now - timedelta(hours=1),
+            now - timedelta(hours=2),
+            now - timedelta(hours=3),
+        ]
+
 
 class TestInMemoryAuditBackendLookup:
     """Tests for InMemoryAuditBackend lookup operations."""
@@ -212,6 +253,13 @@ class TestInMemoryAuditBackendLookup:
         assert result is not None
         assert result.event_id == record.event_id
 
+    def test_get_by_event_id_string(self, backend: InMemoryAuditBackend) -> None:
+        """Test getting record by the string form of its event ID."""
+        record = AuditRecord(event_type=EventType.DATA_ACCESS, user_id="test-user")
+        backend.write(record)
+
+        assert backend.get_by_event_id(str(record.event_id)) is record
+
     def test_get_by_event_id_not_found(self, backend: InMemoryAuditBackend) -> None:
         """Test getting record by event ID when it doesn't exist."""
         result = backend.get_by_event_id("nonexistent-id")
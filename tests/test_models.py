@@ -153,3 +153,14 @@ class TestDataOperation:
         assert data["operation_type"] == "export"
         assert data["destination"] == "/tmp/export.csv"
         assert data["user"]["user_id"] == "user"
+
+    def test_operation_sources_normalized_to_tuple(self) -> None:
+        """Test that sources given as a list are stored as a tuple."""
+        operation = DataOperation(
+            operation_type=OperationType.JOIN,
+            sources=["a.csv", "b.csv"],
+        )
+
+        assert operation.sources == ("a.csv", "b.csv")
+        assert hash(operation.sources)
+        assert operation.to_dict()["sources"] == ["a.csv", "b.csv"]
@@ -0,0 +1,84 @@
+"""Tests for audit log partition helpers."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from lacuna.db.partitions import (
+    _create_audit_partition,
+    _partition_month,
+    add_months,
+    audit_partition_name,
+    ensure_audit_partitions,
+)
+
+
+class TestPartitionHelpers:
+    """Tests for partition naming and month arithmetic."""
+
+    def test_add_months_crosses_year(self) -> None:
+        """Test month arithmetic across year boundaries."""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name_round_trip(self) -> None:
+        """Test partition names parse back to their month."""
+        name = audit_partition_name(date(2026, 10, 1))
+        assert name == "audit_log_2026_10"
+        assert _partition_month(name) == date(2026, 10, 1)
+
+    def test_default_partition_is_not_monthly(self) -> None:
+        """Test the default partition is never treated as a month."""
+        assert _partition_month("audit_log_default") is None
+
+    @patch("lacuna.db.partitions.get_engine")
+    def test_ensure_skips_non_postgresql(self, mock_get_engine) -> None:
+        """Test partition maintenance is a no-op outside PostgreSQL."""
+        mock_get_engine.return_value = MagicMock()
+        mock_get_engine.return_value.dialect.name = "sqlite"
+
+        assert ensure_audit_partitions() == []
+        mock_get_engine.return_value.begin.assert_not_called()
+
+
+class TestCreateAuditPartition:
+    """Tests for creating a monthly partition."""
+
+    @staticmethod
+    def _connection(stranded: bool) -> MagicMock:
+        """Build a connection whose default partition may hold month rows."""
+        connection = MagicMock()
+        connection.execute.return_value.first.return_value = (1,) if stranded else None
+        return connection
+
+    @staticmethod
+    def _statements(connection: MagicMock) -> list[str]:
+        """Get the SQL executed on a connection, in order."""
+        return [str(call.args[0]) for call in connection.execute.call_args_list]
+
+    def test_empty_default_partition(self) -> None:
+        """Test a partition is created directly when no rows are stranded."""
+        connection = self._connection(stranded=False)
+
+        _create_audit_partition(
+            connection, "audit_log_2026_11", date(2026, 11, 1), date(2026, 12, 1)
+        )
+
+        statements = self._statements(connection)
+        assert len(statements) == 2
+        assert statements[1].startswith("CREATE TABLE audit_log_2026_11")
+        assert not any("DETACH" in statement for statement in statements)
+
+    def test_rows_moved_out_of_default_partition(self) -> None:
+        """Test stranded rows are moved while the default is detached."""
+        connection = self._connection(stranded=True)
+
+        _create_audit_partition(
+            connection, "audit_log_2026_11", date(2026, 11, 1), date(2026, 12, 1)
+        )
+
+        statements = self._statements(connection)
+        assert "DETACH PARTITION audit_log_default" in statements[1]
+        assert statements[2].startswith("CREATE TABLE audit_log_2026_11")
+        assert "INSERT INTO audit_log_2026_11" in statements[3]
+        assert "DELETE FROM audit_log_default" in statements[3]
+        assert "ATTACH PARTITION audit_log_default DEFAULT" in statements[4]
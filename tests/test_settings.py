@@ -33,6 +33,7 @@ class TestDatabaseSettings:
         assert "postgresql://" in settings.url
         assert settings.pool_size == 20
         assert settings.max_overflow == 10
+        assert settings.pool_recycle == 1800
         assert settings.echo is False
 
     def test_custom_values(self) -> None: